@@ -0,0 +1,29 @@
+"""global_entities event_time brin index
+
+Revision ID: 0762cca5a5de
+Revises: b53445fe046a
+Create Date: 2026-10-16 10:52:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0762cca5a5de'
+down_revision: Union[str, None] = 'b53445fe046a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'idx_global_entity_time_brin', 'global_entities', ['event_time'], unique=False,
+        schema='data_playground', postgresql_using='brin', postgresql_with={'pages_per_range': 32}
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_global_entity_time_brin', table_name='global_entities', schema='data_playground')
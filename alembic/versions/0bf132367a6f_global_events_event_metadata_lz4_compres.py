@@ -0,0 +1,28 @@
+"""global_events event_metadata lz4 compression
+
+Revision ID: 0bf132367a6f
+Revises: 1dc2e97c1a0a
+Create Date: 2026-10-16 11:13:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0bf132367a6f'
+down_revision: Union[str, None] = '1dc2e97c1a0a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Recurses into the existing partitions; ones created later inherit it.
+    # Values already stored keep their pglz compression until rewritten
+    op.execute('ALTER TABLE data_playground.global_events ALTER COLUMN event_metadata SET COMPRESSION lz4')
+
+
+def downgrade() -> None:
+    op.execute('ALTER TABLE data_playground.global_events ALTER COLUMN event_metadata SET COMPRESSION default')
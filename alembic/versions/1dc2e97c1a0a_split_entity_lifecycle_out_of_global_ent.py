@@ -0,0 +1,112 @@
+"""split entity lifecycle out of global_entities
+
+Revision ID: 1dc2e97c1a0a
+Revises: 3d87c5ad8af2
+Create Date: 2026-10-16 11:06:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '1dc2e97c1a0a'
+down_revision: Union[str, None] = '3d87c5ad8af2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'entity_lifecycle_events',
+        sa.Column('event_time', postgresql.TIMESTAMP(timezone=True, precision=0), nullable=False, comment='When the transition happened'),
+        sa.Column('entity_id', sa.UUID(), nullable=False, comment='GlobalEntity the transition belongs to'),
+        sa.Column('kind', sa.SmallInteger(), nullable=False, comment='EntityLifecycleKind code: 1 created, 2 deactivated, 3 reactivated'),
+        sa.Column('partition_key', sa.String(), nullable=False),
+        sa.CheckConstraint('kind BETWEEN 1 AND 3', name=op.f('ck_entity_lifecycle_events_kind')),
+        sa.PrimaryKeyConstraint('event_time', 'entity_id', 'kind', 'partition_key', name=op.f('pk_entity_lifecycle_events')),
+        schema='data_playground',
+        comment='Append-only entity lifecycle transitions, partitioned hourly',
+        postgresql_partition_by='RANGE (partition_key)'
+    )
+    op.create_index('idx_entity_lifecycle_entity_time', 'entity_lifecycle_events', ['entity_id', 'event_time'], unique=False, schema='data_playground', postgresql_using='btree')
+    op.create_index(
+        'idx_entity_lifecycle_time_brin', 'entity_lifecycle_events', ['event_time'], unique=False,
+        schema='data_playground', postgresql_using='brin', postgresql_with={'pages_per_range': 32}
+    )
+
+    # Carry the existing timestamps over as lifecycle rows, one hourly partition per hour they touch
+    op.execute(sa.DDL("""
+        CREATE TEMPORARY TABLE lifecycle_backfill AS
+        SELECT date_trunc('second', t) AS event_time, entity_id, kind,
+               to_char(date_trunc('hour', t), 'YYYY-MM-DD"T"HH24:MI:SS') AS partition_key
+        FROM data_playground.global_entities,
+             LATERAL (VALUES (created_time, 1), (deactivated_time, 2), (reactivated_time, 3)) AS v(t, kind)
+        WHERE t IS NOT NULL
+    """))
+    op.execute(sa.DDL("""
+        SELECT data_playground.ensure_partition(
+            'entity_lifecycle_events',
+            'entity_lifecycle_events_p_' || lower(translate(lo, '-:', '__')),
+            lo,
+            to_char(lo::timestamp + interval '1 hour', 'YYYY-MM-DD"T"HH24:MI:SS')
+        )
+        FROM (SELECT DISTINCT partition_key AS lo FROM lifecycle_backfill) hours
+    """))
+    op.execute(
+        'INSERT INTO data_playground.entity_lifecycle_events (event_time, entity_id, kind, partition_key) '
+        'SELECT DISTINCT event_time, entity_id, kind, partition_key FROM lifecycle_backfill'
+    )
+    op.execute('DROP TABLE lifecycle_backfill')
+
+    # global_entities becomes the narrow identity row
+    op.drop_index('idx_ge_deactivated', table_name='global_entities', schema='data_playground')
+    op.drop_index('idx_ge_reactivated', table_name='global_entities', schema='data_playground')
+    op.drop_index('idx_global_entity_time_id', table_name='global_entities', schema='data_playground')
+    op.create_index(
+        'idx_global_entity_time_id', 'global_entities', ['event_time', 'entity_id'], unique=False,
+        schema='data_playground', postgresql_using='btree', postgresql_include=['entity_type']
+    )
+    op.drop_column('global_entities', 'reactivated_time', schema='data_playground')
+    op.drop_column('global_entities', 'deactivated_time', schema='data_playground')
+    op.drop_column('global_entities', 'created_time', schema='data_playground')
+
+
+def downgrade() -> None:
+    op.add_column('global_entities', sa.Column('created_time', sa.DateTime(timezone=True), nullable=True, comment='When the entity was created'), schema='data_playground')
+    op.add_column('global_entities', sa.Column('deactivated_time', sa.DateTime(timezone=True), nullable=True, comment='When the entity was deactivated (if applicable)'), schema='data_playground')
+    op.add_column('global_entities', sa.Column('reactivated_time', sa.DateTime(timezone=True), nullable=True, comment='When the entity was reactivated (if applicable)'), schema='data_playground')
+
+    # Latest transition of each kind back onto its entity row; created falls back to event_time
+    op.execute("""
+        UPDATE data_playground.global_entities ge
+        SET created_time = COALESCE(l.created_time, ge.event_time),
+            deactivated_time = l.deactivated_time,
+            reactivated_time = l.reactivated_time
+        FROM (
+            SELECT entity_id,
+                   max(event_time) FILTER (WHERE kind = 1) AS created_time,
+                   max(event_time) FILTER (WHERE kind = 2) AS deactivated_time,
+                   max(event_time) FILTER (WHERE kind = 3) AS reactivated_time
+            FROM data_playground.entity_lifecycle_events
+            GROUP BY entity_id
+        ) l
+        WHERE l.entity_id = ge.entity_id
+    """)
+    op.execute('UPDATE data_playground.global_entities SET created_time = event_time WHERE created_time IS NULL')
+    op.alter_column('global_entities', 'created_time', nullable=False, schema='data_playground')
+
+    op.drop_index('idx_global_entity_time_id', table_name='global_entities', schema='data_playground')
+    op.create_index(
+        'idx_global_entity_time_id', 'global_entities', ['event_time', 'entity_id'], unique=False,
+        schema='data_playground', postgresql_using='btree',
+        postgresql_include=['entity_type', 'created_time', 'deactivated_time']
+    )
+    op.create_index('idx_ge_deactivated', 'global_entities', ['deactivated_time'], unique=False, schema='data_playground', postgresql_where=sa.text('deactivated_time IS NOT NULL'))
+    op.create_index('idx_ge_reactivated', 'global_entities', ['reactivated_time'], unique=False, schema='data_playground', postgresql_where=sa.text('reactivated_time IS NOT NULL'))
+
+    op.drop_index('idx_entity_lifecycle_time_brin', table_name='entity_lifecycle_events', schema='data_playground')
+    op.drop_index('idx_entity_lifecycle_entity_time', table_name='entity_lifecycle_events', schema='data_playground')
+    op.drop_table('entity_lifecycle_events', schema='data_playground')
@@ -0,0 +1,58 @@
+"""user payment method card fields as smallint
+
+Revision ID: 21051d2e133c
+Revises: 5a356bfd21db
+Create Date: 2026-10-16 09:14:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '21051d2e133c'
+down_revision: Union[str, None] = '5a356bfd21db'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    for column, comment, old_comment, old_length in (
+        ('last_four', 'Last 4 digits of card/account (zero-pad to 4 for display)', 'Last 4 digits of card/account', 4),
+        ('expiry_month', 'Card expiration month (1-12)', 'Card expiration month (MM)', 2),
+        ('expiry_year', 'Card expiration year (YYYY)', 'Card expiration year (YYYY)', 4),
+    ):
+        op.alter_column('user_payment_methods', column,
+                   existing_type=sa.String(length=old_length),
+                   type_=sa.SmallInteger(),
+                   existing_comment=old_comment,
+                   comment=comment,
+                   postgresql_using=f'{column}::smallint',
+                   schema='data_playground')
+    op.create_check_constraint(op.f('ck_user_payment_methods_expiry_month_range'), 'user_payment_methods', 'expiry_month BETWEEN 1 AND 12', schema='data_playground')
+    op.create_check_constraint(op.f('ck_user_payment_methods_last_four_range'), 'user_payment_methods', 'last_four BETWEEN 0 AND 9999', schema='data_playground')
+
+
+def downgrade() -> None:
+    op.drop_constraint(op.f('ck_user_payment_methods_last_four_range'), 'user_payment_methods', schema='data_playground', type_='check')
+    op.drop_constraint(op.f('ck_user_payment_methods_expiry_month_range'), 'user_payment_methods', schema='data_playground', type_='check')
+    op.alter_column('user_payment_methods', 'last_four',
+               existing_type=sa.SmallInteger(),
+               type_=sa.String(length=4),
+               comment='Last 4 digits of card/account',
+               postgresql_using="lpad(last_four::text, 4, '0')",
+               schema='data_playground')
+    op.alter_column('user_payment_methods', 'expiry_month',
+               existing_type=sa.SmallInteger(),
+               type_=sa.String(length=2),
+               comment='Card expiration month (MM)',
+               postgresql_using="lpad(expiry_month::text, 2, '0')",
+               schema='data_playground')
+    op.alter_column('user_payment_methods', 'expiry_year',
+               existing_type=sa.SmallInteger(),
+               type_=sa.String(length=4),
+               comment='Card expiration year (YYYY)',
+               postgresql_using='expiry_year::text',
+               schema='data_playground')
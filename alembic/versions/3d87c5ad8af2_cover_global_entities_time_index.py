@@ -0,0 +1,35 @@
+"""cover global_entities time index
+
+Revision ID: 3d87c5ad8af2
+Revises: 0762cca5a5de
+Create Date: 2026-10-16 10:59:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3d87c5ad8af2'
+down_revision: Union[str, None] = '0762cca5a5de'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_index('idx_global_entity_time_id', table_name='global_entities', schema='data_playground')
+    op.create_index(
+        'idx_global_entity_time_id', 'global_entities', ['event_time', 'entity_id'], unique=False,
+        schema='data_playground', postgresql_using='btree',
+        postgresql_include=['entity_type', 'created_time', 'deactivated_time']
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_global_entity_time_id', table_name='global_entities', schema='data_playground')
+    op.create_index(
+        'idx_global_entity_time_id', 'global_entities', ['event_time', 'entity_id'], unique=False,
+        schema='data_playground', postgresql_using='btree'
+    )
@@ -0,0 +1,105 @@
+"""partition global_events by range on event_time
+
+Revision ID: 52b60e4c2192
+Revises: 68e7db1f607e
+Create Date: 2026-10-16 10:17:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '52b60e4c2192'
+down_revision: Union[str, None] = '68e7db1f607e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = [
+    (op.f('ix_data_playground_global_events_caller_entity_id'), ['caller_entity_id']),
+    (op.f('ix_data_playground_global_events_event_time'), ['event_time']),
+    (op.f('ix_data_playground_global_events_event_type'), ['event_type']),
+    (op.f('ix_data_playground_global_events_user_id'), ['user_id']),
+    ('ix_global_events_entity_time', ['caller_entity_id', 'event_time']),
+    ('ix_global_events_type_time', ['event_type', 'event_time']),
+    ('ix_global_events_user_time', ['user_id', 'event_time']),
+    ('ix_global_events_user_type', ['user_id', 'event_type']),
+]
+
+
+def _rebuild_global_events(partition_by, primary_key, hour_expr):
+    """
+    The partitioning of an existing table can't be altered, so build a new
+    global_events next to the old one and move the rows across. Hourly children
+    are created with the same names and bounds PartitionedModel would use.
+    """
+    # Free every name the new table, its indexes and its partitions will take
+    op.execute(sa.DDL("""
+        DO $$
+        DECLARE
+            r record;
+        BEGIN
+            ALTER TABLE data_playground.global_events RENAME TO global_events_old;
+            FOR r IN
+                SELECT c.relname
+                FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid
+                WHERE i.inhparent = 'data_playground.global_events_old'::regclass
+            LOOP
+                EXECUTE format('ALTER TABLE data_playground.%%I RENAME TO %%I', r.relname, r.relname || '_old');
+            END LOOP;
+            FOR r IN
+                SELECT c.relname
+                FROM pg_index x JOIN pg_class c ON c.oid = x.indexrelid
+                WHERE x.indrelid = 'data_playground.global_events_old'::regclass
+            LOOP
+                EXECUTE format('ALTER INDEX data_playground.%%I RENAME TO %%I', r.relname, r.relname || '_old');
+            END LOOP;
+        END
+        $$
+    """))
+
+    op.execute(
+        'CREATE TABLE data_playground.global_events '
+        '(LIKE data_playground.global_events_old INCLUDING DEFAULTS INCLUDING COMMENTS INCLUDING STORAGE) '
+        f'PARTITION BY {partition_by}'
+    )
+    op.execute("COMMENT ON TABLE data_playground.global_events IS 'Stores all system events with hourly partitioning for efficient querying'")
+    op.create_primary_key(op.f('pk_global_events'), 'global_events', primary_key, schema='data_playground')
+    op.create_foreign_key(
+        'fk_global_event_user', 'global_events', 'users',
+        ['user_id', 'partition_key'], ['id', 'partition_key'],
+        source_schema='data_playground', referent_schema='data_playground'
+    )
+    for name, columns in INDEXES:
+        op.create_index(name, 'global_events', columns, unique=False, schema='data_playground')
+
+    # One hourly partition per hour present in the old data
+    op.execute(sa.DDL(f"""
+        SELECT data_playground.ensure_partition(
+            'global_events',
+            'global_events_p_' || lower(translate(lo, '-:', '__')),
+            lo,
+            to_char(lo::timestamp + interval '1 hour', 'YYYY-MM-DD"T"HH24:MI:SS')
+        )
+        FROM (
+            SELECT DISTINCT {hour_expr} AS lo
+            FROM data_playground.global_events_old
+        ) hours
+    """))
+    op.execute('INSERT INTO data_playground.global_events SELECT * FROM data_playground.global_events_old')
+    op.execute('DROP TABLE data_playground.global_events_old')
+
+
+def upgrade() -> None:
+    # date_trunc and the partition bound literals both use the session time zone, which
+    # app.database pins to UTC on every connection (SESSION_TIMEZONE)
+    _rebuild_global_events(
+        'RANGE (event_time)', ['event_id', 'event_time'],
+        """to_char(date_trunc('hour', event_time), 'YYYY-MM-DD"T"HH24:MI:SS')"""
+    )
+
+
+def downgrade() -> None:
+    _rebuild_global_events('RANGE (partition_key)', ['event_id', 'partition_key'], 'partition_key')
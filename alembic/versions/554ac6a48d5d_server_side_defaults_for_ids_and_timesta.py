@@ -0,0 +1,37 @@
+"""server side defaults for ids and timestamps
+
+Revision ID: 554ac6a48d5d
+Revises: fd08504aafc2
+Create Date: 2026-10-16 09:28:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '554ac6a48d5d'
+down_revision: Union[str, None] = 'fd08504aafc2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS pgcrypto')
+    op.alter_column('request_response_logs', 'id', server_default=sa.text('gen_random_uuid()'), schema='data_playground')
+    op.alter_column('invoice_payments', 'id', server_default=sa.text('gen_random_uuid()'), schema='data_playground')
+    op.alter_column('invoice_payments', 'initiated_time', server_default=sa.text('now()'), schema='data_playground')
+    op.alter_column('user_payment_methods', 'id', server_default=sa.text('gen_random_uuid()'), schema='data_playground')
+    op.alter_column('user_payment_methods', 'created_time', server_default=sa.text('now()'), schema='data_playground')
+    op.alter_column('user_payment_methods', 'updated_time', server_default=sa.text('now()'), schema='data_playground')
+
+
+def downgrade() -> None:
+    op.alter_column('user_payment_methods', 'updated_time', server_default=None, schema='data_playground')
+    op.alter_column('user_payment_methods', 'created_time', server_default=None, schema='data_playground')
+    op.alter_column('user_payment_methods', 'id', server_default=None, schema='data_playground')
+    op.alter_column('invoice_payments', 'initiated_time', server_default=None, schema='data_playground')
+    op.alter_column('invoice_payments', 'id', server_default=None, schema='data_playground')
+    op.alter_column('request_response_logs', 'id', server_default=None, schema='data_playground')
@@ -0,0 +1,54 @@
+"""invoice payment refs as bytea
+
+Revision ID: 5a356bfd21db
+Revises: bd0df3149e74
+Create Date: 2026-10-16 09:07:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5a356bfd21db'
+down_revision: Union[str, None] = 'bd0df3149e74'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_constraint('uq_invoice_payments_transaction_ref', 'invoice_payments', schema='data_playground', type_='unique')
+    op.alter_column('invoice_payments', 'authorization_code',
+               existing_type=sa.String(length=100),
+               type_=sa.LargeBinary(length=40),
+               existing_comment='Payment authorization code',
+               comment='Payment authorization code (raw gateway bytes)',
+               postgresql_using='convert_to(authorization_code, \'UTF8\')',
+               schema='data_playground')
+    op.alter_column('invoice_payments', 'transaction_reference',
+               existing_type=sa.String(length=100),
+               type_=sa.LargeBinary(length=40),
+               existing_comment='External transaction reference',
+               comment='External transaction reference (raw gateway bytes)',
+               postgresql_using='convert_to(transaction_reference, \'UTF8\')',
+               schema='data_playground')
+    op.create_index('uq_invoice_payments_txn_ref', 'invoice_payments', ['transaction_reference', 'partition_key'], unique=True, schema='data_playground', postgresql_where=sa.text('transaction_reference IS NOT NULL'))
+
+
+def downgrade() -> None:
+    op.drop_index('uq_invoice_payments_txn_ref', table_name='invoice_payments', schema='data_playground', postgresql_where=sa.text('transaction_reference IS NOT NULL'))
+    op.alter_column('invoice_payments', 'transaction_reference',
+               existing_type=sa.LargeBinary(length=40),
+               type_=sa.String(length=100),
+               comment='External transaction reference',
+               postgresql_using='convert_from(transaction_reference, \'UTF8\')',
+               schema='data_playground')
+    op.alter_column('invoice_payments', 'authorization_code',
+               existing_type=sa.LargeBinary(length=40),
+               type_=sa.String(length=100),
+               comment='Payment authorization code',
+               postgresql_using='convert_from(authorization_code, \'UTF8\')',
+               schema='data_playground')
+    op.create_unique_constraint('uq_invoice_payments_transaction_ref', 'invoice_payments', ['transaction_reference', 'partition_key'], schema='data_playground')
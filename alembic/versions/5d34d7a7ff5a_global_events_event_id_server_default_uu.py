@@ -0,0 +1,50 @@
+"""global_events event_id server default uuid_generate_v7
+
+Revision ID: 5d34d7a7ff5a
+Revises: a0f55d4fe745
+Create Date: 2026-10-16 10:38:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d34d7a7ff5a'
+down_revision: Union[str, None] = 'a0f55d4fe745'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(sa.DDL("""
+        CREATE OR REPLACE FUNCTION data_playground.uuid_generate_v7()
+        RETURNS uuid AS $$
+            SELECT encode(
+                set_bit(
+                    set_bit(
+                        overlay(
+                            uuid_send(gen_random_uuid())
+                            PLACING substring(int8send(floor(extract(epoch FROM clock_timestamp()) * 1000)::bigint) FROM 3)
+                            FROM 1 FOR 6
+                        ),
+                        52, 1
+                    ),
+                    53, 1
+                ),
+                'hex'
+            )::uuid
+        $$ LANGUAGE sql VOLATILE
+    """))
+    op.alter_column(
+        'global_events', 'event_id',
+        server_default=sa.text('data_playground.uuid_generate_v7()'),
+        schema='data_playground'
+    )
+
+
+def downgrade() -> None:
+    op.alter_column('global_events', 'event_id', server_default=None, schema='data_playground')
+    op.execute('DROP FUNCTION IF EXISTS data_playground.uuid_generate_v7()')
@@ -0,0 +1,34 @@
+"""global entities partial lifecycle indexes
+
+Revision ID: 68e7db1f607e
+Revises: f64c83307859
+Create Date: 2026-10-16 10:10:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '68e7db1f607e'
+down_revision: Union[str, None] = 'f64c83307859'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_index(op.f('ix_data_playground_global_entities_created_time'), table_name='global_entities', schema='data_playground')
+    op.drop_index(op.f('ix_data_playground_global_entities_deactivated_time'), table_name='global_entities', schema='data_playground')
+    op.drop_index(op.f('ix_data_playground_global_entities_reactivated_time'), table_name='global_entities', schema='data_playground')
+    op.create_index('idx_ge_deactivated', 'global_entities', ['deactivated_time'], unique=False, schema='data_playground', postgresql_where=sa.text('deactivated_time IS NOT NULL'))
+    op.create_index('idx_ge_reactivated', 'global_entities', ['reactivated_time'], unique=False, schema='data_playground', postgresql_where=sa.text('reactivated_time IS NOT NULL'))
+
+
+def downgrade() -> None:
+    op.drop_index('idx_ge_reactivated', table_name='global_entities', schema='data_playground')
+    op.drop_index('idx_ge_deactivated', table_name='global_entities', schema='data_playground')
+    op.create_index(op.f('ix_data_playground_global_entities_reactivated_time'), 'global_entities', ['reactivated_time'], unique=False, schema='data_playground')
+    op.create_index(op.f('ix_data_playground_global_entities_deactivated_time'), 'global_entities', ['deactivated_time'], unique=False, schema='data_playground')
+    op.create_index(op.f('ix_data_playground_global_entities_created_time'), 'global_entities', ['created_time'], unique=False, schema='data_playground')
@@ -0,0 +1,49 @@
+"""global_events entity id columns
+
+Revision ID: 6a6fb719f209
+Revises: c484670fc1f3
+Create Date: 2026-10-16 11:34:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+ENTITY_ID_COLUMNS = ('shop_id', 'product_id', 'order_id', 'payment_id', 'review_id', 'promotion_id')
+
+# revision identifiers, used by Alembic.
+revision: str = '6a6fb719f209'
+down_revision: Union[str, None] = 'c484670fc1f3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    for column in ENTITY_ID_COLUMNS:
+        op.add_column('global_events', sa.Column(column, sa.UUID(), nullable=True), schema='data_playground')
+        op.create_index(
+            f'ix_data_playground_global_events_{column}', 'global_events', [column], unique=False,
+            schema='data_playground'
+        )
+
+    # Move the ids the create_*_event helpers used to write into event_metadata
+    for column in ENTITY_ID_COLUMNS:
+        op.execute(
+            f"UPDATE data_playground.global_events "
+            f"SET {column} = (event_metadata->>'{column}')::uuid, event_metadata = event_metadata - '{column}' "
+            f"WHERE event_metadata ? '{column}'"
+        )
+
+
+def downgrade() -> None:
+    for column in ENTITY_ID_COLUMNS:
+        op.execute(
+            f"UPDATE data_playground.global_events "
+            f"SET event_metadata = COALESCE(event_metadata, '{{}}'::jsonb) || jsonb_build_object('{column}', {column}::text) "
+            f"WHERE {column} IS NOT NULL"
+        )
+
+    for column in ENTITY_ID_COLUMNS:
+        op.drop_index(f'ix_data_playground_global_events_{column}', table_name='global_events', schema='data_playground')
+        op.drop_column('global_events', column, schema='data_playground')
@@ -0,0 +1,49 @@
+"""entity lifecycle seq tiebreaker
+
+Revision ID: 6d94fb08bb0c
+Revises: 9905a1fb9f6a
+Create Date: 2026-10-16 12:09:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6d94fb08bb0c'
+down_revision: Union[str, None] = '9905a1fb9f6a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(sa.schema.CreateSequence(sa.Sequence('entity_lifecycle_events_seq', schema='data_playground')))
+    # Existing rows are numbered in whatever order the table is scanned; only ties within a second depend on it
+    op.add_column(
+        'entity_lifecycle_events',
+        sa.Column(
+            'seq', sa.BigInteger(),
+            server_default=sa.text("nextval('data_playground.entity_lifecycle_events_seq')"),
+            nullable=False,
+            comment='Insert order; breaks event_time ties between transitions'
+        ),
+        schema='data_playground'
+    )
+    op.execute("ALTER SEQUENCE data_playground.entity_lifecycle_events_seq OWNED BY data_playground.entity_lifecycle_events.seq")
+    op.drop_index('idx_entity_lifecycle_entity_time', table_name='entity_lifecycle_events', schema='data_playground')
+    op.create_index(
+        'idx_entity_lifecycle_entity_time', 'entity_lifecycle_events', ['entity_id', 'partition_key', 'event_time', 'seq'],
+        unique=False, schema='data_playground', postgresql_using='btree'
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_entity_lifecycle_entity_time', table_name='entity_lifecycle_events', schema='data_playground')
+    op.create_index(
+        'idx_entity_lifecycle_entity_time', 'entity_lifecycle_events', ['entity_id', 'event_time'],
+        unique=False, schema='data_playground', postgresql_using='btree'
+    )
+    # entity_lifecycle_events_seq is OWNED BY the column and goes with it
+    op.drop_column('entity_lifecycle_events', 'seq', schema='data_playground')
@@ -0,0 +1,76 @@
+"""ensure_partition hash sub-partitions
+
+Revision ID: 91cf3a932d5d
+Revises: 0bf132367a6f
+Create Date: 2026-10-16 11:20:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '91cf3a932d5d'
+down_revision: Union[str, None] = '0bf132367a6f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The signature changes, so CREATE OR REPLACE can't take over the old one; the
+    # new trailing arguments default to NULL/0, so four-argument calls keep working
+    op.execute('DROP FUNCTION IF EXISTS data_playground.ensure_partition(text, text, text, text)')
+    op.execute(sa.DDL("""
+        CREATE OR REPLACE FUNCTION data_playground.ensure_partition(
+            tbl text, pname text, lo text, hi text, hash_col text DEFAULT NULL, modulus int DEFAULT 0
+        )
+        RETURNS void AS $$
+        BEGIN
+            IF hash_col IS NULL THEN
+                EXECUTE format(
+                    'CREATE TABLE IF NOT EXISTS data_playground.%%I PARTITION OF data_playground.%%I FOR VALUES FROM (%%L) TO (%%L)',
+                    pname, tbl, lo, hi
+                );
+                RETURN;
+            END IF;
+
+            EXECUTE format(
+                'CREATE TABLE IF NOT EXISTS data_playground.%%I PARTITION OF data_playground.%%I FOR VALUES FROM (%%L) TO (%%L) PARTITION BY HASH (%%I)',
+                pname, tbl, lo, hi, hash_col
+            );
+            IF EXISTS (
+                SELECT 1 FROM pg_partitioned_table
+                WHERE partrelid = format('data_playground.%%I', pname)::regclass
+            ) THEN
+                FOR k IN 0 .. modulus - 1 LOOP
+                    EXECUTE format(
+                        'CREATE TABLE IF NOT EXISTS data_playground.%%I PARTITION OF data_playground.%%I FOR VALUES WITH (MODULUS %%s, REMAINDER %%s)',
+                        pname || '_h' || k, pname, modulus, k
+                    );
+                END LOOP;
+            END IF;
+        EXCEPTION WHEN duplicate_table THEN
+            NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """))
+
+
+def downgrade() -> None:
+    # Hours already created with hash sub-partitions stay that way
+    op.execute('DROP FUNCTION IF EXISTS data_playground.ensure_partition(text, text, text, text, text, int)')
+    op.execute(sa.DDL("""
+        CREATE OR REPLACE FUNCTION data_playground.ensure_partition(tbl text, pname text, lo text, hi text)
+        RETURNS void AS $$
+        BEGIN
+            EXECUTE format(
+                'CREATE TABLE IF NOT EXISTS data_playground.%%I PARTITION OF data_playground.%%I FOR VALUES FROM (%%L) TO (%%L)',
+                pname, tbl, lo, hi
+            );
+        EXCEPTION WHEN duplicate_table THEN
+            NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """))
@@ -0,0 +1,38 @@
+"""global_events event_time server default
+
+Revision ID: 9683b0cffdb4
+Revises: 6a6fb719f209
+Create Date: 2026-10-16 11:41:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '9683b0cffdb4'
+down_revision: Union[str, None] = '6a6fb719f209'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.alter_column(
+        'global_events', 'event_time',
+        server_default=sa.text('now()'),
+        existing_type=postgresql.TIMESTAMP(timezone=True),
+        existing_nullable=False,
+        schema='data_playground'
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        'global_events', 'event_time',
+        server_default=None,
+        existing_type=postgresql.TIMESTAMP(timezone=True),
+        existing_nullable=False,
+        schema='data_playground'
+    )
@@ -0,0 +1,48 @@
+"""metric_type generated column and shop product timeline indexes
+
+Revision ID: 9905a1fb9f6a
+Revises: c7c8f7815cba
+Create Date: 2026-10-16 11:55:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9905a1fb9f6a'
+down_revision: Union[str, None] = 'c7c8f7815cba'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'global_events',
+        sa.Column('metric_type', sa.String(), sa.Computed("event_metadata->>'metric_type'", persisted=True),
+                  nullable=True, comment='metric_type from event_metadata (metric rollup events only)'),
+        schema='data_playground'
+    )
+    op.create_index(
+        'ix_ge_metric_type_time', 'global_events', ['metric_type', 'event_time'],
+        unique=False, schema='data_playground', postgresql_where=sa.text('metric_type IS NOT NULL')
+    )
+    for column, name in (('shop_id', 'ix_ge_shop_time'), ('product_id', 'ix_ge_product_time')):
+        op.create_index(
+            name, 'global_events', [column, sa.text('event_time DESC'), sa.text('event_id DESC')],
+            unique=False, schema='data_playground', postgresql_where=sa.text(f'{column} IS NOT NULL')
+        )
+        op.drop_index(f'ix_data_playground_global_events_{column}', table_name='global_events', schema='data_playground')
+
+
+def downgrade() -> None:
+    for column, name in (('shop_id', 'ix_ge_shop_time'), ('product_id', 'ix_ge_product_time')):
+        op.create_index(
+            f'ix_data_playground_global_events_{column}', 'global_events', [column],
+            unique=False, schema='data_playground'
+        )
+        op.drop_index(name, table_name='global_events', schema='data_playground')
+    op.drop_index('ix_ge_metric_type_time', table_name='global_events', schema='data_playground')
+    op.drop_column('global_events', 'metric_type', schema='data_playground')
@@ -0,0 +1,42 @@
+"""global_events event_metadata jsonb
+
+Revision ID: 9cf266fe9455
+Revises: 52b60e4c2192
+Create Date: 2026-10-16 10:24:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '9cf266fe9455'
+down_revision: Union[str, None] = '52b60e4c2192'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.alter_column(
+        'global_events', 'event_metadata',
+        type_=postgresql.JSONB(astext_type=sa.Text()),
+        postgresql_using='event_metadata::jsonb',
+        existing_nullable=True,
+        comment='Additional event-specific data stored as JSONB',
+        existing_comment='Additional event-specific data stored as JSON',
+        schema='data_playground'
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        'global_events', 'event_metadata',
+        type_=sa.JSON(),
+        postgresql_using='event_metadata::json',
+        existing_nullable=True,
+        comment='Additional event-specific data stored as JSON',
+        existing_comment='Additional event-specific data stored as JSONB',
+        schema='data_playground'
+    )
@@ -0,0 +1,37 @@
+"""global_events hourly rollup materialized view
+
+Revision ID: a0f55d4fe745
+Revises: 9cf266fe9455
+Create Date: 2026-10-16 10:31:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a0f55d4fe745'
+down_revision: Union[str, None] = '9cf266fe9455'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        CREATE MATERIALIZED VIEW data_playground.global_events_hourly_rollup AS
+        SELECT date_trunc('hour', event_time) AS hour, event_type, count(*) AS n
+        FROM data_playground.global_events
+        GROUP BY 1, 2
+        WITH DATA
+    """)
+    # REFRESH ... CONCURRENTLY needs a unique index on the view
+    op.create_index(
+        'uq_global_events_hourly_rollup_hour_type', 'global_events_hourly_rollup',
+        ['hour', 'event_type'], unique=True, schema='data_playground'
+    )
+
+
+def downgrade() -> None:
+    op.execute('DROP MATERIALIZED VIEW IF EXISTS data_playground.global_events_hourly_rollup')
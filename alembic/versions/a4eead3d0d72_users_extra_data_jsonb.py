@@ -0,0 +1,42 @@
+"""users extra_data jsonb
+
+Revision ID: a4eead3d0d72
+Revises: e08e380df51c
+Create Date: 2026-10-16 09:49:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4eead3d0d72'
+down_revision: Union[str, None] = 'e08e380df51c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.alter_column(
+        'users', 'extra_data',
+        type_=postgresql.JSONB(astext_type=sa.Text()),
+        postgresql_using='extra_data::jsonb',
+        existing_nullable=True,
+        comment='Additional user data stored as JSONB',
+        existing_comment='Additional user data stored as JSON',
+        schema='data_playground'
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        'users', 'extra_data',
+        type_=sa.JSON(),
+        postgresql_using='extra_data::json',
+        existing_nullable=True,
+        comment='Additional user data stored as JSON',
+        existing_comment='Additional user data stored as JSONB',
+        schema='data_playground'
+    )
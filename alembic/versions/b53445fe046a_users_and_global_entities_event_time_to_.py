@@ -0,0 +1,41 @@
+"""users and global_entities event_time to whole seconds
+
+Revision ID: b53445fe046a
+Revises: 5d34d7a7ff5a
+Create Date: 2026-10-16 10:45:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'b53445fe046a'
+down_revision: Union[str, None] = '5d34d7a7ff5a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Truncate rather than let the cast round, so no row moves past its hour's partition_key.
+    # The type change rewrites both tables and rebuilds their indexes, no separate REINDEX needed
+    for table in ('users', 'global_entities'):
+        op.alter_column(
+            table, 'event_time',
+            type_=postgresql.TIMESTAMP(timezone=True, precision=0),
+            existing_type=postgresql.TIMESTAMP(timezone=True),
+            postgresql_using="date_trunc('second', event_time)",
+            schema='data_playground'
+        )
+
+
+def downgrade() -> None:
+    for table in ('users', 'global_entities'):
+        op.alter_column(
+            table, 'event_time',
+            type_=postgresql.TIMESTAMP(timezone=True),
+            existing_type=postgresql.TIMESTAMP(timezone=True, precision=0),
+            schema='data_playground'
+        )
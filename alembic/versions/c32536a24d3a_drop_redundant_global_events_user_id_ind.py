@@ -0,0 +1,26 @@
+"""drop redundant global_events user_id index
+
+Revision ID: c32536a24d3a
+Revises: 6d94fb08bb0c
+Create Date: 2026-10-16 12:09:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c32536a24d3a'
+down_revision: Union[str, None] = '6d94fb08bb0c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_index(op.f('ix_data_playground_global_events_user_id'), table_name='global_events', schema='data_playground')
+
+
+def downgrade() -> None:
+    op.create_index(op.f('ix_data_playground_global_events_user_id'), 'global_events', ['user_id'], unique=False, schema='data_playground')
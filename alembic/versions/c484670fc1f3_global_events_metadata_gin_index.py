@@ -0,0 +1,43 @@
+"""global_events metadata gin index
+
+Revision ID: c484670fc1f3
+Revises: 91cf3a932d5d
+Create Date: 2026-10-16 11:27:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'c484670fc1f3'
+down_revision: Union[str, None] = '91cf3a932d5d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.alter_column(
+        'global_events', 'extra_data',
+        type_=postgresql.JSONB(astext_type=sa.Text()),
+        existing_type=sa.JSON(),
+        postgresql_using='extra_data::jsonb',
+        schema='data_playground'
+    )
+    op.create_index(
+        'ix_ge_metadata_gin', 'global_events', ['event_metadata'], unique=False,
+        schema='data_playground', postgresql_using='gin', postgresql_ops={'event_metadata': 'jsonb_path_ops'}
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_ge_metadata_gin', table_name='global_events', schema='data_playground')
+    op.alter_column(
+        'global_events', 'extra_data',
+        type_=sa.JSON(),
+        existing_type=postgresql.JSONB(astext_type=sa.Text()),
+        postgresql_using='extra_data::json',
+        schema='data_playground'
+    )
@@ -0,0 +1,34 @@
+"""partial user timeline index on global_events
+
+Revision ID: c7c8f7815cba
+Revises: 9683b0cffdb4
+Create Date: 2026-10-16 11:48:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7c8f7815cba'
+down_revision: Union[str, None] = '9683b0cffdb4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_index('ix_global_events_user_time', table_name='global_events', schema='data_playground')
+    op.create_index(
+        'ix_ge_user_time', 'global_events', ['user_id', sa.text('event_time DESC'), sa.text('event_id DESC')],
+        unique=False, schema='data_playground', postgresql_where=sa.text('user_id IS NOT NULL')
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_ge_user_time', table_name='global_events', schema='data_playground')
+    op.create_index(
+        'ix_global_events_user_time', 'global_events', ['user_id', 'event_time'],
+        unique=False, schema='data_playground'
+    )
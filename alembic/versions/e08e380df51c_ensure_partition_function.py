@@ -0,0 +1,38 @@
+"""ensure_partition function
+
+Revision ID: e08e380df51c
+Revises: 554ac6a48d5d
+Create Date: 2026-10-16 09:42:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e08e380df51c'
+down_revision: Union[str, None] = '554ac6a48d5d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(sa.DDL("""
+        CREATE OR REPLACE FUNCTION data_playground.ensure_partition(tbl text, pname text, lo text, hi text)
+        RETURNS void AS $$
+        BEGIN
+            EXECUTE format(
+                'CREATE TABLE IF NOT EXISTS data_playground.%%I PARTITION OF data_playground.%%I FOR VALUES FROM (%%L) TO (%%L)',
+                pname, tbl, lo, hi
+            );
+        EXCEPTION WHEN duplicate_table THEN
+            NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """))
+
+
+def downgrade() -> None:
+    op.execute('DROP FUNCTION IF EXISTS data_playground.ensure_partition(text, text, text, text)')
@@ -0,0 +1,32 @@
+"""drop redundant single column users indexes
+
+Revision ID: f64c83307859
+Revises: a4eead3d0d72
+Create Date: 2026-10-16 10:03:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f64c83307859'
+down_revision: Union[str, None] = 'a4eead3d0d72'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_index(op.f('ix_data_playground_users_status'), table_name='users', schema='data_playground')
+    op.drop_index(op.f('ix_data_playground_users_created_time'), table_name='users', schema='data_playground')
+    op.drop_index(op.f('ix_data_playground_users_last_login_time'), table_name='users', schema='data_playground')
+    op.drop_index(op.f('ix_data_playground_users_event_time'), table_name='users', schema='data_playground')
+
+
+def downgrade() -> None:
+    op.create_index(op.f('ix_data_playground_users_event_time'), 'users', ['event_time'], unique=False, schema='data_playground')
+    op.create_index(op.f('ix_data_playground_users_last_login_time'), 'users', ['last_login_time'], unique=False, schema='data_playground')
+    op.create_index(op.f('ix_data_playground_users_created_time'), 'users', ['created_time'], unique=False, schema='data_playground')
+    op.create_index(op.f('ix_data_playground_users_status'), 'users', ['status'], unique=False, schema='data_playground')
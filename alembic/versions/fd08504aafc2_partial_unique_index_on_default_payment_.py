@@ -0,0 +1,26 @@
+"""partial unique index on default payment method
+
+Revision ID: fd08504aafc2
+Revises: 21051d2e133c
+Create Date: 2026-10-16 09:21:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'fd08504aafc2'
+down_revision: Union[str, None] = '21051d2e133c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('uq_upm_user_default_true', 'user_payment_methods', ['user_id', 'partition_key'], unique=True, schema='data_playground', postgresql_where=sa.text('is_default = true'))
+
+
+def downgrade() -> None:
+    op.drop_index('uq_upm_user_default_true', table_name='user_payment_methods', schema='data_playground', postgresql_where=sa.text('is_default = true'))
@@ -2,6 +2,10 @@ import asyncio
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 from app.tasks.fake_data_generator import run_async_generate_fake_data
+from app.tasks.event_rollup_task import refresh_event_rollup_task
+from app.tasks.cluster_partitions_task import cluster_partitions_task
+from app.tasks.partition_maintenance_task import partition_maintenance_task
+from app.tasks.archive_partitions_task import archive_partitions_task
 #from app.tasks.generate_plots import generate_plots
 #from app.tasks.rollup_task import run_rollups_task
 
@@ -10,6 +14,18 @@ scheduler = AsyncIOScheduler()
 # Schedule fake data generation every 5 minutes
 scheduler.add_job(run_async_generate_fake_data, CronTrigger(minute='*/5'))
 
+# Refresh the hourly event-count rollup every 5 minutes
+scheduler.add_job(refresh_event_rollup_task, CronTrigger(minute='*/5'))
+
+# Cluster last hour's partitions by event_time once they've gone cold
+scheduler.add_job(cluster_partitions_task, CronTrigger(minute='10'))
+
+# Keep the next day of partitions ready and retire global_events past retention
+scheduler.add_job(partition_maintenance_task, CronTrigger(minute='5'))
+
+# Move global_events hours older than a week to Parquet
+scheduler.add_job(archive_partitions_task, CronTrigger(minute='20'))
+
 
 # #Schedule plot generation every 5 minutes
 # scheduler.add_job(generate_plots, CronTrigger(minute='*/5'))
@@ -1,7 +1,10 @@
 from sqlalchemy import create_engine, event, text
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.schema import CreateSchema
 import os
+import orjson
 import logging
 from sqlalchemy.exc import SQLAlchemyError
 from datetime import datetime
@@ -26,6 +29,24 @@ MAX_OVERFLOW = int(os.getenv("MAX_OVERFLOW", 10))
 POOL_TIMEOUT = int(os.getenv("POOL_TIMEOUT", 30))
 POOL_RECYCLE = int(os.getenv("POOL_RECYCLE", 1800))
 
+# Compiled-statement cache entries per engine; sized for the module-level hot statements
+# plus the ORM's own shapes across every model
+QUERY_CACHE_SIZE = int(os.getenv("QUERY_CACHE_SIZE", 1200))
+
+# Async pool is process-wide and hard-capped (no overflow) so it bounds DB concurrency
+ASYNC_DATABASE_URL = SQLALCHEMY_DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://", 1)
+ASYNC_POOL_SIZE = int(os.getenv("ASYNC_POOL_SIZE", 16))
+
+# Partition bounds are written without an offset (e.g. '2026-10-16T22:00:00'), and
+# global_events is range partitioned on a timestamptz, so Postgres reads those
+# bounds in the session time zone. Every connection pins it to UTC, the zone the
+# partition keys are computed in; the DB or role default can't move rows around
+SESSION_TIMEZONE = "UTC"
+
+def json_serializer(value):
+    """orjson for JSON/JSONB bind values; psycopg wants str, not bytes"""
+    return orjson.dumps(value).decode()
+
 # Create the engine with SSL required and timeout settings
 engine = create_engine(
     SQLALCHEMY_DATABASE_URL,
@@ -34,21 +55,101 @@ engine = create_engine(
     pool_timeout=POOL_TIMEOUT,
     pool_recycle=POOL_RECYCLE,
     pool_pre_ping=True,
+    query_cache_size=QUERY_CACHE_SIZE,
+    json_serializer=json_serializer,
+    json_deserializer=orjson.loads,
     connect_args={
         'sslmode': 'require',
         'connect_timeout': 10,
         'keepalives': 1,
         'keepalives_idle': 30,
         'keepalives_interval': 10,
-        'keepalives_count': 5
+        'keepalives_count': 5,
+        'options': f'-c timezone={SESSION_TIMEZONE}'
     }
 )
 
-# Create sessionmaker
+# Create sessionmaker. Like the async one: no autoflush, so pending rows go out in one
+# flush at commit, and no expiry on commit, so handlers can build responses without a reload
 SessionLocal = sessionmaker(
     bind=engine,
     autocommit=False,
     autoflush=False,
+    expire_on_commit=False,
+)
+
+# Create the async engine shared by all coroutines in this process
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    pool_size=ASYNC_POOL_SIZE,
+    max_overflow=0,
+    pool_timeout=POOL_TIMEOUT,
+    pool_recycle=POOL_RECYCLE,
+    pool_pre_ping=False,
+    query_cache_size=QUERY_CACHE_SIZE,
+    json_serializer=orjson.dumps,
+    json_deserializer=orjson.loads,
+    connect_args={
+        'ssl': 'require',
+        'timeout': 10,
+        'statement_cache_size': 1024,
+        'server_settings': {'timezone': SESSION_TIMEZONE}
+    }
+)
+
+# asyncpg talks binary, so the str from json_serializer is only encoded again on the
+# way out, and results are decoded to str just for orjson to parse. Swap the dialect's
+# codecs for ones that hand orjson's bytes straight through in both directions.
+def _jsonb_encoder(value):
+    # \x01 is the jsonb binary format version byte
+    return b"\x01" + value
+
+def _jsonb_decoder(value):
+    return orjson.loads(value[1:])
+
+@event.listens_for(async_engine.sync_engine, "connect")
+def register_orjson_codecs(dbapi_connection, connection_record):
+    dbapi_connection.run_async(lambda conn: conn.set_type_codec(
+        "jsonb", encoder=_jsonb_encoder, decoder=_jsonb_decoder, schema="pg_catalog", format="binary"
+    ))
+    dbapi_connection.run_async(lambda conn: conn.set_type_codec(
+        "json", encoder=bytes, decoder=orjson.loads, schema="pg_catalog", format="binary"
+    ))
+
+# Create async sessionmaker
+AsyncSessionLocal = sessionmaker(
+    async_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+    autocommit=False,
+    autoflush=False,
+)
+
+# Scheduled jobs run on APScheduler's own event loop in another thread (see
+# app/core/scheduler.py), and an asyncpg connection only works on the loop that
+# opened it. So they get their own engine, without a pool: each session connects
+# on the scheduler's loop and closes its connection when done, and async_engine's
+# pool stays with the app loop.
+scheduler_engine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    poolclass=NullPool,
+    query_cache_size=QUERY_CACHE_SIZE,
+    json_serializer=orjson.dumps,
+    json_deserializer=orjson.loads,
+    connect_args={
+        'ssl': 'require',
+        'timeout': 10,
+        'server_settings': {'timezone': SESSION_TIMEZONE}
+    }
+)
+event.listen(scheduler_engine.sync_engine, "connect", register_orjson_codecs)
+
+SchedulerSessionLocal = sessionmaker(
+    scheduler_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+    autocommit=False,
+    autoflush=False,
 )
 
 def execute_ddl(query: str, retries=3):
@@ -100,6 +201,12 @@ def get_db():
     finally:
         db.close()
 
+async def get_async_db():
+    """Provides an async database session from the shared pool."""
+    async with AsyncSessionLocal() as session:
+        await session.execute(text("SET search_path TO data_playground"))
+        yield session
+
 logger.info("Database connection setup completed.")
 
 def parse_event_time(event_time):
@@ -9,9 +9,10 @@ from .tasks.fake_data_generator import run_async_generate_fake_data
 import logging
 import sys
 import os
-from .database import get_db, parse_event_time, engine
+from .database import get_async_db, parse_event_time, engine, AsyncSessionLocal
 from datetime import datetime
 from .models import RequestResponseLog
+from .models.global_event import event_buffer
 import pytz
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import text
@@ -98,7 +99,7 @@ async def general_exception_handler(request: Request, exc: Exception):
     )
 
 @app.get("/health/")
-async def health_check(db: AsyncSession = Depends(get_db)):
+async def health_check(db: AsyncSession = Depends(get_async_db)):
     try:
         await db.execute(text("SELECT 1"))
         return {"status": "healthy"}
@@ -121,10 +122,13 @@ async def startup_event():
     # # Start the scheduler in a separate thread
     threading.Thread(target=run_scheduler, daemon=True).start()
 
+    # Batch the emit_*_event audit writes
+    event_buffer.start(AsyncSessionLocal)
+
 @app.on_event("shutdown")
 async def shutdown_event():
     # The scheduler will be shut down when the main thread exits
-    pass
+    await event_buffer.stop()
 
 @app.get("/", response_class=HTMLResponse)
 async def read_root(request: Request):
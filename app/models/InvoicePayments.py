@@ -1,7 +1,6 @@
 from .base import Base, PartitionedModel
-from sqlalchemy import Column, DateTime, String, ForeignKeyConstraint, Boolean, JSON, Enum, Float, UUID, UniqueConstraint
+from sqlalchemy import Column, DateTime, String, ForeignKeyConstraint, Boolean, JSON, Enum, Float, UUID, Index, LargeBinary, text, func
 from sqlalchemy.orm import relationship, backref
-import uuid
 from datetime import datetime
 from .enums import PaymentMethodType, PaymentStatus
 
@@ -17,6 +16,7 @@ class InvoicePayment(Base, PartitionedModel):
     - user_id is indexed for user-based queries
     - invoice_id is indexed for invoice-based queries
     - shop_id is indexed for shop-based queries
+    - transaction_reference has a partial unique index (non-NULL rows only)
     - event_time is indexed for partitioning
     - Composite indexes for common query patterns
     
@@ -33,7 +33,7 @@ class InvoicePayment(Base, PartitionedModel):
     id = Column(
         UUID(as_uuid=True), 
         primary_key=True, 
-        default=uuid.uuid4,
+        server_default=text('gen_random_uuid()'),
         comment="Unique identifier for the payment"
     )
     user_id = Column(
@@ -83,14 +83,14 @@ class InvoicePayment(Base, PartitionedModel):
     
     # Transaction Details
     authorization_code = Column(
-        String(100), 
+        LargeBinary(40), 
         nullable=True,
-        comment="Payment authorization code"
+        comment="Payment authorization code (raw gateway bytes)"
     )
     transaction_reference = Column(
-        String(100), 
+        LargeBinary(40), 
         nullable=True,
-        comment="External transaction reference"
+        comment="External transaction reference (raw gateway bytes)"
     )
     transaction_fee = Column(
         Float, 
@@ -103,7 +103,7 @@ class InvoicePayment(Base, PartitionedModel):
     initiated_time = Column(
         DateTime(timezone=True), 
         nullable=False, 
-        default=datetime.utcnow,
+        server_default=func.now(),
         comment="When the payment was initiated"
     )
     completed_time = Column(
@@ -127,7 +127,7 @@ class InvoicePayment(Base, PartitionedModel):
     extra_data = Column(
         JSON, 
         nullable=True, 
-        default={},
+        default=dict,
         comment="Additional payment data stored as JSON"
     )
 
@@ -140,29 +140,38 @@ class InvoicePayment(Base, PartitionedModel):
     )
 
     # Relationships
+    # Backrefs are raise_on_sql: load them explicitly with selectinload()/joinedload()
+    # (e.g. select(User).options(selectinload(User.invoice_payments))) instead of
+    # lazy-loading one collection per parent row.
     user = relationship(
         "User",
-        backref=backref("invoice_payments", lazy="dynamic"),
+        backref=backref("invoice_payments", lazy="raise_on_sql"),
         foreign_keys=[user_id]
     )
     invoice = relationship(
         "Invoice",
-        backref=backref("payments", lazy="dynamic"),
+        backref=backref("payments", lazy="raise_on_sql"),
         foreign_keys=[invoice_id]
     )
     shop = relationship(
         "Shop",
-        backref=backref("invoice_payments", lazy="dynamic"),
+        backref=backref("invoice_payments", lazy="raise_on_sql"),
         foreign_keys=[shop_id]
     )
     payment_method = relationship(
         "UserPaymentMethod",
-        backref=backref("invoice_payments", lazy="dynamic"),
+        backref=backref("invoice_payments", lazy="raise_on_sql"),
         foreign_keys=[payment_method_id]
     )
 
     __table_args__ = (
-        UniqueConstraint('transaction_reference', 'partition_key', name='uq_invoice_payments_transaction_ref'),
+        # Partial unique index: most rows have no reference yet, so NULLs are left out of the index
+        Index(
+            'uq_invoice_payments_txn_ref',
+            'transaction_reference', 'partition_key',
+            unique=True,
+            postgresql_where=text('transaction_reference IS NOT NULL')
+        ),
         ForeignKeyConstraint(
             ['user_id', 'partition_key'],
             ['data_playground.users.id', 'data_playground.users.partition_key'],
@@ -218,39 +227,39 @@ class InvoicePayment(Base, PartitionedModel):
         """Mark payment as completed and create event"""
         self.status = PaymentStatus.COMPLETED
         self.completed_time = datetime.utcnow()
-        await db.commit()
         
-        # Create global event for successful payment
+        # Stage global event for successful payment so it commits with the status change
         from .global_event import GlobalEvent, EventType
-        await GlobalEvent.create_user_event(
+        await GlobalEvent.stage_user_event(
             db,
-            EventType.invoice_payment_success,
+            EventType.PAYMENT_SUCCEEDED,
             self.user_id,
-            payment_id=str(self.id),
+            payment_id=self.id,
             amount=self.amount,
-            invoice_id=str(self.invoice_id),
-            shop_id=str(self.shop_id)
+            invoice_id=self.invoice_id,
+            shop_id=self.shop_id
         )
+        await db.commit()
 
     async def fail_payment(self, db, error_message=None):
         """Mark payment as failed and create event"""
         self.status = PaymentStatus.FAILED
         if error_message:
             self.notes = error_message
-        await db.commit()
         
-        # Create global event for failed payment
+        # Stage global event for failed payment so it commits with the status change
         from .global_event import GlobalEvent, EventType
-        await GlobalEvent.create_user_event(
+        await GlobalEvent.stage_user_event(
             db,
-            EventType.invoice_payment_failed,
+            EventType.PAYMENT_FAILED,
             self.user_id,
-            payment_id=str(self.id),
+            payment_id=self.id,
             amount=self.amount,
-            invoice_id=str(self.invoice_id),
-            shop_id=str(self.shop_id),
+            invoice_id=self.invoice_id,
+            shop_id=self.shop_id,
             error=error_message
         )
+        await db.commit()
 
     async def refund_payment(self, db, amount=None, reason=None):
         """Process a refund"""
@@ -268,17 +277,17 @@ class InvoicePayment(Base, PartitionedModel):
             self.status = PaymentStatus.PARTIALLY_REFUNDED
         
         self.notes = f"Refunded: {refund_amount}. Reason: {reason}" if reason else f"Refunded: {refund_amount}"
-        await db.commit()
         
-        # Create global event for refund
+        # Stage global event for refund so it commits with the status change
         from .global_event import GlobalEvent, EventType
-        await GlobalEvent.create_user_event(
+        await GlobalEvent.stage_user_event(
             db,
-            EventType.invoice_payment_refunded,
+            EventType.PAYMENT_REFUNDED,
             self.user_id,
-            payment_id=str(self.id),
+            payment_id=self.id,
             amount=refund_amount,
-            invoice_id=str(self.invoice_id),
-            shop_id=str(self.shop_id),
+            invoice_id=self.invoice_id,
+            shop_id=self.shop_id,
             reason=reason
         )
+        await db.commit()
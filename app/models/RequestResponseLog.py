@@ -1,8 +1,7 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime
+from sqlalchemy import Column, Integer, String, Text, DateTime, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 from datetime import datetime
-import uuid
 from .base import Base, PartitionedModel
 
 class RequestResponseLog(Base, PartitionedModel):
@@ -10,7 +9,7 @@ class RequestResponseLog(Base, PartitionedModel):
     __partitiontype__ = "hourly"
     __partition_field__ = "event_time"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=text('gen_random_uuid()'))
     method = Column(String, index=True)
     url = Column(String, index=True)
     request_body = Column(Text, nullable=True)
@@ -127,7 +127,7 @@ class ShopOrderPayment(Base, PartitionedModel):
     extra_data = Column(
         JSON, 
         nullable=True, 
-        default={},
+        default=dict,
         comment="Additional payment data stored as JSON"
     )
 
@@ -218,39 +218,39 @@ class ShopOrderPayment(Base, PartitionedModel):
         """Mark payment as completed and create event"""
         self.status = PaymentStatus.COMPLETED
         self.completed_time = datetime.utcnow()
-        await db.commit()
         
-        # Create global event for successful payment
+        # Stage global event for successful payment so it commits with the status change
         from .global_event import GlobalEvent, EventType
-        await GlobalEvent.create_user_event(
+        await GlobalEvent.stage_user_event(
             db,
-            EventType.shop_order_payment_success,
+            EventType.PAYMENT_SUCCEEDED,
             self.user_id,
-            payment_id=str(self.id),
+            payment_id=self.id,
             amount=self.amount,
-            order_id=str(self.order_id),
-            shop_id=str(self.shop_id)
+            order_id=self.order_id,
+            shop_id=self.shop_id
         )
+        await db.commit()
 
     async def fail_payment(self, db, error_message=None):
         """Mark payment as failed and create event"""
         self.status = PaymentStatus.FAILED
         if error_message:
             self.notes = error_message
-        await db.commit()
         
-        # Create global event for failed payment
+        # Stage global event for failed payment so it commits with the status change
         from .global_event import GlobalEvent, EventType
-        await GlobalEvent.create_user_event(
+        await GlobalEvent.stage_user_event(
             db,
-            EventType.shop_order_payment_failed,
+            EventType.PAYMENT_FAILED,
             self.user_id,
-            payment_id=str(self.id),
+            payment_id=self.id,
             amount=self.amount,
-            order_id=str(self.order_id),
-            shop_id=str(self.shop_id),
+            order_id=self.order_id,
+            shop_id=self.shop_id,
             error=error_message
         )
+        await db.commit()
 
     async def refund_payment(self, db, amount=None, reason=None):
         """Process a refund"""
@@ -268,17 +268,17 @@ class ShopOrderPayment(Base, PartitionedModel):
             self.status = PaymentStatus.PARTIALLY_REFUNDED
         
         self.notes = f"Refunded: {refund_amount}. Reason: {reason}" if reason else f"Refunded: {refund_amount}"
-        await db.commit()
         
-        # Create global event for refund
+        # Stage global event for refund so it commits with the status change
         from .global_event import GlobalEvent, EventType
-        await GlobalEvent.create_user_event(
+        await GlobalEvent.stage_user_event(
             db,
-            EventType.shop_order_payment_refunded,
+            EventType.PAYMENT_REFUNDED,
             self.user_id,
-            payment_id=str(self.id),
+            payment_id=self.id,
             amount=refund_amount,
-            order_id=str(self.order_id),
-            shop_id=str(self.shop_id),
+            order_id=self.order_id,
+            shop_id=self.shop_id,
             reason=reason
         )
+        await db.commit()
@@ -1,7 +1,6 @@
 from .base import Base, PartitionedModel
-from sqlalchemy import Column, DateTime, String, ForeignKeyConstraint, Boolean, JSON, Enum, UUID, UniqueConstraint
+from sqlalchemy import Column, DateTime, String, ForeignKeyConstraint, Boolean, JSON, Enum, UUID, UniqueConstraint, SmallInteger, CheckConstraint, Index, text, func
 from sqlalchemy.orm import relationship, backref
-import uuid
 from datetime import datetime
 from .enums import PaymentMethodType, PaymentMethodStatus
 
@@ -16,6 +15,7 @@ class UserPaymentMethod(Base, PartitionedModel):
     - user_id is indexed for user-based queries
     - method_type is indexed for filtering by payment type
     - status is indexed for filtering active/inactive methods
+    - (user_id, partition_key) has a partial unique index over default methods only
     - event_time is indexed for partitioning
     - Composite indexes for common query patterns
     
@@ -32,7 +32,7 @@ class UserPaymentMethod(Base, PartitionedModel):
     id = Column(
         UUID(as_uuid=True), 
         primary_key=True, 
-        default=uuid.uuid4,
+        server_default=text('gen_random_uuid()'),
         comment="Unique identifier for the payment method"
     )
     user_id = Column(
@@ -60,18 +60,19 @@ class UserPaymentMethod(Base, PartitionedModel):
         nullable=False,
         comment="Tokenized payment method (for security)"
     )
+    # A number, so "0042" is stored as 42; show it through last_four_display
     last_four = Column(
-        String(4), 
+        SmallInteger, 
         nullable=True,
-        comment="Last 4 digits of card/account"
+        comment="Last 4 digits of card/account (zero-pad to 4 for display)"
     )
     expiry_month = Column(
-        String(2), 
+        SmallInteger, 
         nullable=True,
-        comment="Card expiration month (MM)"
+        comment="Card expiration month (1-12)"
     )
     expiry_year = Column(
-        String(4), 
+        SmallInteger, 
         nullable=True,
         comment="Card expiration year (YYYY)"
     )
@@ -135,13 +136,13 @@ class UserPaymentMethod(Base, PartitionedModel):
     created_time = Column(
         DateTime(timezone=True), 
         nullable=False, 
-        default=datetime.utcnow,
+        server_default=func.now(),
         comment="When the payment method was added"
     )
     updated_time = Column(
         DateTime(timezone=True), 
         nullable=False, 
-        default=datetime.utcnow,
+        server_default=func.now(),
         comment="When the payment method was last updated"
     )
     last_used_time = Column(
@@ -160,7 +161,7 @@ class UserPaymentMethod(Base, PartitionedModel):
     extra_data = Column(
         JSON, 
         nullable=True, 
-        default={},
+        default=dict,
         comment="Additional payment method data stored as JSON"
     )
 
@@ -173,9 +174,10 @@ class UserPaymentMethod(Base, PartitionedModel):
     )
 
     # Relationships
+    # payment_methods backref is raise_on_sql: load it with selectinload()/joinedload()
     user = relationship(
         "User",
-        backref=backref("payment_methods", lazy="dynamic"),
+        backref=backref("payment_methods", lazy="raise_on_sql"),
         foreign_keys=[user_id]
     )
 
@@ -187,9 +189,23 @@ class UserPaymentMethod(Base, PartitionedModel):
             comment="Foreign key relationship to the users table"
         ),
         UniqueConstraint('token', 'partition_key', name='uq_user_payment_methods_token'),
+        CheckConstraint('expiry_month BETWEEN 1 AND 12', name='expiry_month_range'),
+        CheckConstraint('last_four BETWEEN 0 AND 9999', name='last_four_range'),
+        # Partial unique index for "default method" lookups; only default rows are indexed
+        Index(
+            'uq_upm_user_default_true',
+            'user_id', 'partition_key',
+            unique=True,
+            postgresql_where=text('is_default = true')
+        ),
         {
             'postgresql_partition_by': 'RANGE (partition_key)',
             'schema': 'data_playground',
             'comment': 'Stores user payment method data with hourly partitioning for efficient querying'
         }
     )
+
+    @property
+    def last_four_display(self):
+        """last_four as the 4 digits it stands for ("0042", not 42); use this wherever it's shown"""
+        return None if self.last_four is None else f"{self.last_four:04d}"
@@ -1,140 +1,47 @@
 from .base import Base, PartitionedModel, generate_partition_name
-from .user import User
-from .shop import Shop
-from .invoice import Invoice
-from .InvoicePayments import InvoicePayment
-from .ShopOrderPayments import ShopOrderPayment
-from .UserPaymentMethod import UserPaymentMethod
-from .global_event import GlobalEvent
-from .global_entity import GlobalEntity
-from .RequestResponseLog import RequestResponseLog
-from .odds_maker import OddsMaker
-from .shop_product import ShopProduct
-from .shop_order import ShopOrder, ShopOrderItem
-from .shop_review import ShopReview, ShopReviewVote
-from .shop_inventory import ShopInventoryLog
-from .shop_promotion import ShopPromotion, ShopPromotionUsage
-from .user_metrics import UserMetricsHourly, UserMetricsDaily
-from .shop_metrics import ShopMetricsHourly, ShopMetricsDaily
-from .product_metrics import ShopProductMetricsHourly, ShopProductMetricsDaily
+from ._manifest import PUBLIC, ENUMS
+import importlib
 
-# Import all enums
-from .enums import (
-    # Payment related enums
-    PaymentMethodType,
-    PaymentMethodStatus,
-    PaymentStatus,
-    PaymentTerms,
-    
-    # Order related enums
-    OrderStatus,
-    ShippingMethod,
-    
-    # Shop related enums
-    ShopCategory,
-    ProductCategory,
-    ProductStatus,
-    
-    # Promotion related enums
-    PromotionType,
-    PromotionStatus,
-    PromotionApplicability,
-    
-    # Review related enums
-    ReviewType,
-    ReviewStatus,
-    
-    # Inventory related enums
-    InventoryChangeType,
-    
-    # Entity and Event related enums
-    EntityType,
-    EventType
-)
+from sqlalchemy import event
+from sqlalchemy.orm import Mapper
+
+# Models and enums are imported on first access (PEP 562) so `import app.models`
+# doesn't pull in every mapper. Base classes above stay eager.
+# The name -> module maps live in _manifest.py (regenerate with helpers/gen_models_manifest.py).
+_LAZY = {**PUBLIC, **ENUMS}
+
+def __getattr__(name):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    obj = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = obj
+    return obj
+
+def __dir__():
+    return __all__
+
+@event.listens_for(Mapper, "before_configured")
+def _import_all_models():
+    # Relationships refer to each other by class name, so every model has to be
+    # mapped before SQLAlchemy configures any of them
+    for module in set(PUBLIC.values()):
+        importlib.import_module(f".{module}", __name__)
+    _check_one_class_per_table()
+
+def _check_one_class_per_table():
+    # A second class declaring the same __tablename__ shadows the first one and
+    # makes alembic autogenerate flip between the two definitions
+    owners = {}
+    for mapper in Base.registry.mappers:
+        tablename = mapper.class_.__dict__.get("__tablename__")
+        if tablename is None:
+            continue
+        if tablename in owners:
+            raise RuntimeError(
+                f"{tablename!r} is mapped by both {owners[tablename].__name__} and {mapper.class_.__name__}"
+            )
+        owners[tablename] = mapper.class_
 
 # Export all models and enums
-__all__ = [
-    # Base classes
-    "Base", "PartitionedModel", "generate_partition_name",
-    
-    # User related
-    "User",
-    
-    # Shop related
-    "Shop",
-    
-    # Invoice related
-    "Invoice",
-    
-    # Payment related
-    "InvoicePayment",
-    "ShopOrderPayment", 
-    "UserPaymentMethod",
-    
-    # Event and Entity related
-    "GlobalEvent",
-    "GlobalEntity",
-    
-    # Logging
-    "RequestResponseLog",
-    
-    # Odds Maker
-    "OddsMaker",
-    
-    # Product related
-    "ShopProduct",
-    
-    # Order related
-    "ShopOrder",
-    "ShopOrderItem",
-    
-    # Review related
-    "ShopReview",
-    "ShopReviewVote",
-    
-    # Inventory related
-    "ShopInventoryLog",
-    
-    # Promotion related
-    "ShopPromotion",
-    "ShopPromotionUsage",
-    
-    # Metrics related
-    "UserMetricsHourly",
-    "UserMetricsDaily",
-    "ShopMetricsHourly",
-    "ShopMetricsDaily",
-    "ShopProductMetricsHourly",
-    "ShopProductMetricsDaily",
-    
-    # Payment related enums
-    "PaymentMethodType",
-    "PaymentMethodStatus",
-    "PaymentStatus",
-    "PaymentTerms",
-    
-    # Order related enums
-    "OrderStatus",
-    "ShippingMethod",
-    
-    # Shop related enums
-    "ShopCategory",
-    "ProductCategory",
-    "ProductStatus",
-    
-    # Promotion related enums
-    "PromotionType",
-    "PromotionStatus",
-    "PromotionApplicability",
-    
-    # Review related enums
-    "ReviewType",
-    "ReviewStatus",
-    
-    # Inventory related enums
-    "InventoryChangeType",
-    
-    # Entity and Event related enums
-    "EntityType",
-    "EventType"
-]
+__all__ = ["Base", "PartitionedModel", "generate_partition_name", *_LAZY]
@@ -0,0 +1,50 @@
+"""Public model and enum names -> defining submodule. Generated by helpers/gen_models_manifest.py; do not edit."""
+
+PUBLIC = {
+    "InvoicePayment": "InvoicePayments",
+    "RequestResponseLog": "RequestResponseLog",
+    "ShopOrderPayment": "ShopOrderPayments",
+    "UserPaymentMethod": "UserPaymentMethod",
+    "GlobalEntity": "global_entity",
+    "EntityLifecycleEvent": "global_entity",
+    "GlobalEvent": "global_event",
+    "Invoice": "invoice",
+    "OddsMaker": "odds_maker",
+    "ShopProductMetricsHourly": "product_metrics",
+    "ShopProductMetricsDaily": "product_metrics",
+    "Shop": "shop",
+    "ShopInventoryLog": "shop_inventory",
+    "ShopMetricsHourly": "shop_metrics",
+    "ShopMetricsDaily": "shop_metrics",
+    "ShopOrder": "shop_order",
+    "ShopOrderItem": "shop_order",
+    "ShopProduct": "shop_product",
+    "ShopPromotion": "shop_promotion",
+    "ShopPromotionUsage": "shop_promotion",
+    "ShopReview": "shop_review",
+    "ShopReviewVote": "shop_review",
+    "User": "user",
+    "UserMetricsHourly": "user_metrics",
+    "UserMetricsDaily": "user_metrics",
+}
+
+ENUMS = {
+    "PaymentMethodType": "enums",
+    "PaymentMethodStatus": "enums",
+    "PaymentStatus": "enums",
+    "OrderStatus": "enums",
+    "ShippingMethod": "enums",
+    "PaymentTerms": "enums",
+    "ShopCategory": "enums",
+    "ProductCategory": "enums",
+    "ProductStatus": "enums",
+    "PromotionType": "enums",
+    "PromotionStatus": "enums",
+    "PromotionApplicability": "enums",
+    "ReviewType": "enums",
+    "ReviewStatus": "enums",
+    "InventoryChangeType": "enums",
+    "EntityType": "enums",
+    "EntityLifecycleKind": "enums",
+    "EventType": "enums",
+}
@@ -1,10 +1,18 @@
 from sqlalchemy.ext.asyncio import AsyncAttrs
-from sqlalchemy.orm import DeclarativeBase, declared_attr
-from sqlalchemy import Column, String, text, DDL, event, MetaData
-from datetime import datetime, timedelta
-from fastapi import HTTPException
+from sqlalchemy.orm import DeclarativeBase, declared_attr, Session
+from sqlalchemy import Column, Integer, String, text, DDL, event, MetaData, bindparam
+from sqlalchemy.dialects.postgresql import ARRAY
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from sqlalchemy.orm import declarative_mixin
 from sqlalchemy.exc import SQLAlchemyError
+import logging
+import operator
+import os
+import time
+import uuid
+
+logger = logging.getLogger(__name__)
 
 # Create a naming convention for constraints and indexes
 NAMING_CONVENTION = {
@@ -29,14 +37,196 @@ class Base(AsyncAttrs, DeclarativeBase):
     def __table_args__(cls):
         return {'schema': 'data_playground'}
 
+# (tablename, partition_key) pairs whose partition this process has already created or seen.
+# Anything that drops a partition has to discard its entry here.
+_ENSURED_PARTITIONS: set[tuple[str, str]] = set()
+
+# Session.info key for partitions created in a transaction that hasn't committed yet
+PENDING_PARTITIONS_KEY = "_pending_partitions"
+
+# UUIDv7 (48-bit ms timestamp + random) generated by the server, for column
+# server defaults. Same layout as pg_uuidv7's uuid_generate_v7(), without needing
+# the extension on a stock postgres image: stamp the clock over the front of a
+# v4 uuid and flip the version nibble from 4 to 7.
+UUID_GENERATE_V7_FUNCTION = DDL("""
+    CREATE OR REPLACE FUNCTION data_playground.uuid_generate_v7()
+    RETURNS uuid AS $$
+        SELECT encode(
+            set_bit(
+                set_bit(
+                    overlay(
+                        uuid_send(gen_random_uuid())
+                        PLACING substring(int8send(floor(extract(epoch FROM clock_timestamp()) * 1000)::bigint) FROM 3)
+                        FROM 1 FOR 6
+                    ),
+                    52, 1
+                ),
+                53, 1
+            ),
+            'hex'
+        )::uuid
+    $$ LANGUAGE sql VOLATILE
+""")
+
+# Server-side helper that creates a partition from bound parameters. One statement
+# text for every partition, so the server can reuse a single cached plan.
+# With hash_col set, the range partition is itself HASH partitioned on that column
+# into `modulus` children (<pname>_h0 ..), spreading one hour's inserts over several
+# btree tails. Hours created before a table opted in stay plain.
+ENSURE_PARTITION_FUNCTION = DDL("""
+    CREATE OR REPLACE FUNCTION data_playground.ensure_partition(
+        tbl text, pname text, lo text, hi text, hash_col text DEFAULT NULL, modulus int DEFAULT 0
+    )
+    RETURNS void AS $$
+    BEGIN
+        IF hash_col IS NULL THEN
+            EXECUTE format(
+                'CREATE TABLE IF NOT EXISTS data_playground.%%I PARTITION OF data_playground.%%I FOR VALUES FROM (%%L) TO (%%L)',
+                pname, tbl, lo, hi
+            );
+            RETURN;
+        END IF;
+
+        EXECUTE format(
+            'CREATE TABLE IF NOT EXISTS data_playground.%%I PARTITION OF data_playground.%%I FOR VALUES FROM (%%L) TO (%%L) PARTITION BY HASH (%%I)',
+            pname, tbl, lo, hi, hash_col
+        );
+        IF EXISTS (
+            SELECT 1 FROM pg_partitioned_table
+            WHERE partrelid = format('data_playground.%%I', pname)::regclass
+        ) THEN
+            FOR k IN 0 .. modulus - 1 LOOP
+                EXECUTE format(
+                    'CREATE TABLE IF NOT EXISTS data_playground.%%I PARTITION OF data_playground.%%I FOR VALUES WITH (MODULUS %%s, REMAINDER %%s)',
+                    pname || '_h' || k, pname, modulus, k
+                );
+            END LOOP;
+        END IF;
+    EXCEPTION WHEN duplicate_table THEN
+        NULL;
+    END;
+    $$ LANGUAGE plpgsql
+""")
+
+_ENSURE_PARTITION = text("SELECT data_playground.ensure_partition(:tbl, :pname, :lo, :hi, :hash_col, :modulus)")
+
+# Many partitions of one table in a single round-trip
+_ENSURE_PARTITIONS = text("""
+    SELECT data_playground.ensure_partition(:tbl, p.pname, p.lo, p.hi, :hash_col, :modulus)
+    FROM unnest(:pnames, :los, :his) AS p(pname, lo, hi)
+""").bindparams(
+    bindparam("pnames", type_=ARRAY(String)),
+    bindparam("los", type_=ARRAY(String)),
+    bindparam("his", type_=ARRAY(String)),
+    bindparam("hash_col", type_=String),
+    bindparam("modulus", type_=Integer),
+)
+
+# Direct children of a partitioned table
+_CHILD_PARTITIONS = text("""
+    SELECT c.relname
+    FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid
+    WHERE i.inhparent = to_regclass(:parent)
+    ORDER BY c.relname
+""")
+
+# Same output as strftime("%Y-%m-%dT%H:00:00") / strftime("%Y-%m-%d"), without
+# strftime's per-call format parsing
+def _format_hourly(dt):
+    return f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d}T{dt.hour:02d}:00:00"
+
+def _format_daily(dt):
+    return f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d}"
+
+# partition type -> (partition_key formatter, partition width)
+_PARTITION_SPECS = {
+    "hourly": (_format_hourly, timedelta(hours=1)),
+    "daily": (_format_daily, timedelta(days=1)),
+}
+
+# Single-pass replacement of the characters that aren't valid in a table name
+_SANITIZE = str.maketrans({'-': '_', ':': '_'})
+
+def _http_exc():
+    # fastapi is only needed on the error path of the HTTP-facing helpers
+    from fastapi import HTTPException
+    return HTTPException
+
+@lru_cache(maxsize=4096)
 def generate_partition_name(tablename, partition_key):
-    return f"{tablename}_p_{partition_key.replace('-', '_').replace(':', '_')}".lower()
+    return f"{tablename}_p_{partition_key.translate(_SANITIZE)}".lower()
+
+def generate_partition_keys(partitiontype, event_times):
+    """Vectorized partition keys for the bulk-ingest path.
+
+    Takes a datetime64 column (or a sequence of datetimes) and returns the same
+    strings generate_partition_key would, without a strftime call per row.
+    numpy's datetime64 -> string conversion does the civil-from-days math in C.
+    """
+    import numpy as np
+
+    if not isinstance(event_times, np.ndarray):
+        # Match strftime: format the wall-clock time, not the UTC instant
+        event_times = [t.replace(tzinfo=None) for t in event_times]
+    times = np.asarray(event_times, dtype='datetime64[s]')
+
+    if partitiontype == "hourly":
+        return np.char.add(np.datetime_as_string(times.astype('datetime64[h]'), unit='h'), ':00:00')
+    elif partitiontype == "daily":
+        return np.datetime_as_string(times.astype('datetime64[D]'), unit='D')
+    raise ValueError("Invalid partition type")
+
+# Random bytes for uuid7(), refilled 4 KiB at a time so most calls skip the urandom syscall
+_UUID7_POOL_SIZE = 4096
+_uuid7_pool = b""
+_uuid7_pos = _UUID7_POOL_SIZE
+
+def uuid7(ts=None):
+    """Time-ordered UUID (RFC 9562 v7): 48-bit ms timestamp, then 74 random bits.
+
+    Successive ids land at the right-hand edge of a btree instead of a random
+    leaf, so bulk inserts append rather than split pages all over the index.
+    Pass `ts` (naive datetimes are taken as UTC) to stamp the id with a row's
+    event time instead of the current time.
+    """
+    global _uuid7_pool, _uuid7_pos
+    if ts is None:
+        ms = time.time_ns() // 1_000_000
+    else:
+        if ts.tzinfo is None:
+            ts = ts.replace(tzinfo=timezone.utc)
+        ms = int(ts.timestamp() * 1000)
+    if _uuid7_pos + 10 > _UUID7_POOL_SIZE:
+        _uuid7_pool, _uuid7_pos = os.urandom(_UUID7_POOL_SIZE), 0
+    rand = int.from_bytes(_uuid7_pool[_uuid7_pos:_uuid7_pos + 10], "big")
+    _uuid7_pos += 10
+    return uuid.UUID(int=(
+        ms << 80
+        | 0x7 << 76
+        | (rand >> 68) << 64
+        | 0b10 << 62
+        | rand & 0x3FFFFFFFFFFFFFFF
+    ))
+
+def _truncate_to_second(target, value, oldvalue, initiator):
+    return value.replace(microsecond=0) if isinstance(value, datetime) else value
 
 @declarative_mixin
 class PartitionedModel:
-    # Include partition_key in primary key
+    # Include partition_key in primary key.
+    # This can't be a GENERATED ALWAYS AS column: Postgres rejects generated
+    # columns in a partition key, and to_char() isn't immutable anyway. The key
+    # is always derived from __partition_field__ by generate_partition_key /
+    # generate_partition_keys, so it stays consistent with the event time.
     partition_key = Column(String, nullable=False, primary_key=True)
 
+    # Set for classes whose partition field is a timestamptz(0) column
+    _partition_whole_seconds = False
+
+    # Optional HASH sub-partitioning of each range partition, e.g. "entity_id"
+    __subpartition_field__ = None
+    __subpartition_modulus__ = 8
+
     @declared_attr
     def __tablename__(cls):
         return cls.__name__.lower()
@@ -49,76 +239,252 @@ class PartitionedModel:
             'schema': 'data_playground'
         }
 
-    async def generate_partition_key(self, db):
-        event_time = getattr(self, self.__partition_field__, None)
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Resolve the partition config once per class instead of on every row;
+        # a bad __partitiontype__ now fails at import time
+        partition_field = getattr(cls, '__partition_field__', None)
+        partition_type = getattr(cls, '__partitiontype__', None)
+        if partition_field and partition_type:
+            if partition_type not in _PARTITION_SPECS:
+                raise ValueError(f"Invalid partition type {partition_type!r} on {cls.__name__}")
+            cls._partition_getter = operator.attrgetter(partition_field)
+            cls._partition_spec = _PARTITION_SPECS[partition_type]
+
+            # Postgres rounds into a timestamptz(0), which can push xx:59:59.6 into
+            # the next hour. Truncate on assignment instead, so the stored value,
+            # the in-memory identity and the partition key all agree.
+            table = cls.__dict__.get('__table__')
+            column = table.c.get(partition_field) if table is not None else None
+            if column is not None and getattr(column.type, 'precision', None) == 0:
+                cls._partition_whole_seconds = True
+                event.listen(getattr(cls, partition_field), 'set', _truncate_to_second, retval=True)
+
+    @classmethod
+    def _valid_partition_time(cls, event_time):
         if not isinstance(event_time, datetime):
-            print(f"Invalid Datetime {self.__partition_field__} type: {event_time} --> {type(event_time)}")
+            logger.warning("Invalid Datetime %s type: %s --> %s", cls.__partition_field__, event_time, type(event_time))
             event_time = datetime.utcnow()
+        return event_time
+
+    @classmethod
+    def _compute_partition(cls, event_time):
+        """Return (partition_key, partition_name, lower, upper) for an event time"""
+        event_time = cls._valid_partition_time(event_time)
 
-        partition_name = ""
-        partition_key = ""
+        format_key, delta = cls._partition_spec
+        partition_key = format_key(event_time)
+        upper = format_key(event_time + delta)
 
-        try:
-            if self.__partitiontype__ == "hourly":
-                partition_key = event_time.strftime("%Y-%m-%dT%H:00:00")
-                partition_name = generate_partition_name(self.__tablename__, partition_key.replace(':', '_')).lower()
-                print(f"Checking partition {partition_name} for {self.__tablename__} with partition key {partition_key}")
-                
-                await db.execute(text(f"""
-                    DO $$
-                    BEGIN
-                        IF NOT EXISTS (
-                            SELECT FROM pg_tables
-                            WHERE schemaname = 'data_playground' AND tablename = '{partition_name}'
-                        ) THEN
-                            CREATE TABLE IF NOT EXISTS data_playground.{partition_name} PARTITION OF data_playground.{self.__tablename__}
-                            FOR VALUES FROM ('{partition_key}') TO ('{(event_time + timedelta(hours=1)).strftime("%Y-%m-%dT%H:00:00")}');
-                        ELSE
-                            RAISE NOTICE 'Partition {partition_name} already exists';
-                        END IF;
-                    END $$;
-                """))
-            elif self.__partitiontype__ == "daily":
-                partition_key = event_time.strftime("%Y-%m-%d")
-                next_partition = (event_time + timedelta(days=1)).strftime("%Y-%m-%d")
-                partition_name = generate_partition_name(self.__tablename__, partition_key.replace(':', '_')).lower()
-                await db.execute(text(f"""
-                    DO $$
-                    BEGIN
-                        IF NOT EXISTS (
-                            SELECT FROM pg_tables
-                            WHERE schemaname = 'data_playground' AND tablename = '{partition_name}'
-                        ) THEN
-                            CREATE TABLE IF NOT EXISTS data_playground.{partition_name} PARTITION OF data_playground.{self.__tablename__}
-                            FOR VALUES FROM ('{partition_key}') TO ('{next_partition}');
-                        ELSE
-                            RAISE NOTICE 'Partition {partition_name} already exists';
-                        END IF;
-                    END $$;
-                """))
-            else:
-                raise ValueError("Invalid partition type")
+        return partition_key, generate_partition_name(cls.__tablename__, partition_key), partition_key, upper
 
-            await db.commit()
+    @classmethod
+    def _partition_params(cls, partition_name, lower, upper):
+        return {"tbl": cls.__tablename__, "pname": partition_name, "lo": lower, "hi": upper, **cls._subpartition_params()}
+
+    @classmethod
+    def _subpartition_params(cls):
+        if cls.__subpartition_field__ is None:
+            return {"hash_col": None, "modulus": 0}
+        return {"hash_col": cls.__subpartition_field__, "modulus": cls.__subpartition_modulus__}
+
+    async def generate_partition_key(self, db):
+        partition_key, partition_name, lower, upper = self._compute_partition(self._partition_getter(self))
+
+        # Partition already created by this process: skip the DDL and its commit
+        cache_key = (self.__tablename__, partition_key)
+        if cache_key in _ENSURED_PARTITIONS:
+            return partition_key
+
+        logger.debug("Checking partition %s for %s with partition key %s", partition_name, self.__tablename__, partition_key)
+
+        # The DDL rides in the caller's transaction behind a savepoint; the caller's
+        # commit persists it together with the row, and only then is it cached
+        try:
+            async with db.begin_nested():
+                await db.execute(_ENSURE_PARTITION, self._partition_params(partition_name, lower, upper))
+            db.info.setdefault(PENDING_PARTITIONS_KEY, set()).add(cache_key)
             
         except SQLAlchemyError as e:
-            await db.rollback()
-            print(f"Error while creating partition for {self.__tablename__}: {str(e)}")
+            logger.error("Error while creating partition for %s: %s", self.__tablename__, e)
 
         return partition_key
 
     @classmethod
-    async def create_with_partition(cls, db, **kwargs):
+    async def _create_many_with_partition_core(cls, db, rows):
+        """
+        Insert many rows in one transaction. Each distinct partition gets its DDL
+        once, then every row is added and committed together. Instances are not
+        refreshed, so server-side defaults aren't loaded on them. Errors propagate
+        as-is; background callers use this directly.
+        """
         try:
-            instance = cls(**kwargs)
-            instance.partition_key = await instance.generate_partition_key(db)
-            db.add(instance)
+            instances = []
+            pending = {}
+            for row in rows:
+                instance = cls(**row)
+                partition_key, partition_name, lower, upper = cls._compute_partition(cls._partition_getter(instance))
+                instance.partition_key = partition_key
+                instances.append(instance)
+
+                cache_key = (cls.__tablename__, partition_key)
+                if cache_key not in _ENSURED_PARTITIONS and cache_key not in pending:
+                    pending[cache_key] = cls._partition_params(partition_name, lower, upper)
+
+            for params in pending.values():
+                await db.execute(_ENSURE_PARTITION, params)
+            db.add_all(instances)
             await db.commit()
-            await db.refresh(instance)
-            return instance
+            _ENSURED_PARTITIONS.update(pending)
+            return instances
+        except Exception:
+            await db.rollback()
+            raise
+
+    @classmethod
+    async def create_many_with_partition(cls, db, rows):
+        try:
+            return await cls._create_many_with_partition_core(db, rows)
         except Exception as e:
+            raise _http_exc()(status_code=500, detail=f"Failed to create {cls.__name__}: {e}")
+
+    @classmethod
+    def _stamp_partition_keys(cls, mappings):
+        """
+        Set partition_key on each dict; return DDL params for partitions not yet ensured.
+        Batches from the event buffer share one event_time object, so the key is
+        formatted once per run of equal times, and the partition name and bounds
+        only for partitions the batch hasn't seen yet.
+        """
+        format_key = cls._partition_spec[0]
+        pending = {}
+        last_time = last_key = _UNSET = object()
+        for mapping in mappings:
+            if cls._partition_whole_seconds:
+                mapping[cls.__partition_field__] = _truncate_to_second(None, mapping.get(cls.__partition_field__), None, None)
+            event_time = mapping.get(cls.__partition_field__)
+            if event_time is not last_time or last_key is _UNSET:
+                last_time, valid_time = event_time, cls._valid_partition_time(event_time)
+                last_key = format_key(valid_time)
+            mapping["partition_key"] = last_key
+
+            cache_key = (cls.__tablename__, last_key)
+            if cache_key not in _ENSURED_PARTITIONS and cache_key not in pending:
+                _, partition_name, lower, upper = cls._compute_partition(valid_time)
+                pending[cache_key] = cls._partition_params(partition_name, lower, upper)
+        return pending
+
+    @classmethod
+    async def _ensure_partitions(cls, db, pending):
+        """Run the DDL for _stamp_partition_keys' leftovers in db's transaction; cached on commit"""
+        for params in pending.values():
+            await db.execute(_ENSURE_PARTITION, params)
+        db.info.setdefault(PENDING_PARTITIONS_KEY, set()).update(pending)
+
+    @classmethod
+    async def bulk_insert_mappings_with_partition(cls, db, mappings):
+        """
+        Fast lane for the data generators: stamps partition_key onto each dict and
+        inserts them with bulk_insert_mappings, skipping ORM instance construction.
+        Nothing is returned; use create_many_with_partition when instances are needed.
+        """
+        pending = cls._stamp_partition_keys(mappings)
+        try:
+            for params in pending.values():
+                await db.execute(_ENSURE_PARTITION, params)
+            await db.run_sync(lambda session: session.bulk_insert_mappings(cls, mappings))
+            await db.commit()
+        except Exception:
+            await db.rollback()
+            raise
+        _ENSURED_PARTITIONS.update(pending)
+
+    @classmethod
+    async def pre_create_partitions(cls, db, start, end):
+        """
+        Create every partition covering [start, end] up front, in one statement and
+        one commit, and prime _ENSURED_PARTITIONS so the inserts skip DDL entirely.
+        """
+        partitions = {}
+        current = start
+        while current <= end:
+            partition_key, partition_name, lower, upper = cls._compute_partition(current)
+            partitions[partition_key] = (partition_name, lower, upper)
+            current += cls._partition_spec[1]
+        partition_key, partition_name, lower, upper = cls._compute_partition(end)
+        partitions[partition_key] = (partition_name, lower, upper)
+
+        names, lowers, uppers = zip(*partitions.values())
+        try:
+            await db.execute(_ENSURE_PARTITIONS, {
+                "tbl": cls.__tablename__, "pnames": list(names), "los": list(lowers), "his": list(uppers),
+                **cls._subpartition_params()
+            })
+            await db.commit()
+        except Exception:
             await db.rollback()
-            raise HTTPException(status_code=500, detail=f"Failed to create {cls.__name__}: {str(e)}")
+            raise
+        _ENSURED_PARTITIONS.update((cls.__tablename__, partition_key) for partition_key in partitions)
+
+    @classmethod
+    async def ensure_partitions_ahead(cls, db, ahead=24):
+        """Create the current partition and the next `ahead` ones, so writers never wait on DDL"""
+        now = datetime.utcnow()
+        await cls.pre_create_partitions(db, now, now + cls._partition_spec[1] * ahead)
+
+    @classmethod
+    async def partitions_before(cls, db, cutoff):
+        """Names of the partitions wholly older than the one holding cutoff, oldest first"""
+        _, cutoff_name, _, _ = cls._compute_partition(cutoff)
+        # Partition names sort by time, so a string compare finds the old ones
+        prefix = generate_partition_name(cls.__tablename__, '')
+        names = (await db.scalars(_CHILD_PARTITIONS, {"parent": f"data_playground.{cls.__tablename__}"})).all()
+        return [name for name in names if name.startswith(prefix) and name < cutoff_name]
+
+    @classmethod
+    async def drop_partitions(cls, db, names):
+        """DROP the named partitions in one transaction and forget them in _ENSURED_PARTITIONS"""
+        try:
+            for name in names:
+                await db.execute(text(f'DROP TABLE IF EXISTS data_playground."{name}"'))
+            await db.commit()
+        except Exception:
+            await db.rollback()
+            raise
+
+        dropped_names = set(names)
+        _ENSURED_PARTITIONS.difference_update([
+            cache_key for cache_key in _ENSURED_PARTITIONS
+            if cache_key[0] == cls.__tablename__ and generate_partition_name(*cache_key) in dropped_names
+        ])
+
+    @classmethod
+    async def drop_partitions_before(cls, db, cutoff):
+        """
+        Retention: DROP every partition older than the one holding cutoff. Dropping
+        a partition only touches the catalog, where a range DELETE would rewrite
+        and then vacuum the rows. Returns the dropped partition names.
+        """
+        dropped = await cls.partitions_before(db, cutoff)
+        await cls.drop_partitions(db, dropped)
+        return dropped
+
+    @classmethod
+    async def _create_with_partition_core(cls, db, **kwargs):
+        instance, = await cls._create_many_with_partition_core(db, [kwargs])
+        try:
+            await db.refresh(instance)
+        except Exception:
+            await db.rollback()
+            raise
+        return instance
+
+    @classmethod
+    async def create_with_partition(cls, db, **kwargs):
+        try:
+            return await cls._create_with_partition_core(db, **kwargs)
+        except Exception as e:
+            raise _http_exc()(status_code=500, detail=f"Failed to create {cls.__name__}: {e}")
 
     @classmethod
     async def validate_partition(cls, db, **kwargs):
@@ -128,7 +494,15 @@ class PartitionedModel:
             return instance
         except Exception as e:
             await db.rollback()
-            raise HTTPException(status_code=500, detail=f"Failed to create {cls.__name__}: {str(e)}")
+            raise _http_exc()(status_code=500, detail=f"Failed to create {cls.__name__}: {e}")
+
+@event.listens_for(Session, 'after_commit')
+def cache_pending_partitions(session):
+    _ENSURED_PARTITIONS.update(session.info.pop(PENDING_PARTITIONS_KEY, ()))
+
+@event.listens_for(Session, 'after_rollback')
+def discard_pending_partitions(session):
+    session.info.pop(PENDING_PARTITIONS_KEY, None)
 
 # Event listener to ensure schema exists and is set as default
 @event.listens_for(Base.metadata, 'before_create')
@@ -138,6 +512,16 @@ def create_schema(target, connection, **kw):
     # Set search_path to ensure types are created in data_playground schema
     connection.execute(DDL('SET search_path TO data_playground'))
 
+# Event listener to install uuid_generate_v7 before any table defaults to it
+@event.listens_for(Base.metadata, 'before_create')
+def create_uuid_generate_v7_function(target, connection, **kw):
+    connection.execute(UUID_GENERATE_V7_FUNCTION)
+
+# Event listener to install the ensure_partition helper alongside the tables
+@event.listens_for(Base.metadata, 'after_create')
+def create_ensure_partition_function(target, connection, **kw):
+    connection.execute(ENSURE_PARTITION_FUNCTION)
+
 # Event listener to ensure types are created in data_playground schema
 @event.listens_for(Base.metadata, 'after_create')
 def set_default_schema(target, connection, **kw):
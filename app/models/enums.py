@@ -1,6 +1,88 @@
 import enum
+import functools
+import sys
 
-class PaymentMethodType(enum.Enum):
+__all__ = [
+    "PaymentMethodType",
+    "PaymentMethodStatus",
+    "PaymentStatus",
+    "OrderStatus",
+    "ShippingMethod",
+    "PaymentTerms",
+    "ShopCategory",
+    "ProductCategory",
+    "ProductStatus",
+    "PromotionType",
+    "PromotionStatus",
+    "PromotionApplicability",
+    "ReviewType",
+    "ReviewStatus",
+    "InventoryChangeType",
+    "EntityType",
+    "EntityLifecycleKind",
+    "EventType",
+    "ENTITY_TYPE_BY_VALUE",
+    "EVENT_TYPE_BY_VALUE",
+    "EventTypeCode",
+    "EVENT_CODE",
+    "ACCOUNT_EVENTS",
+    "SHOP_EVENTS",
+    "PRODUCT_EVENTS",
+    "ORDER_EVENTS",
+    "PAYMENT_EVENTS",
+    "PAYMENT_METHOD_EVENTS",
+    "REVIEW_EVENTS",
+    "PROMOTION_EVENTS",
+    "INVENTORY_EVENTS",
+    "INVOICE_EVENTS",
+    "METRIC_EVENTS",
+    "SYSTEM_EVENTS",
+    "DATA_INTEGRITY_EVENTS",
+    "API_EVENTS",
+    "SECURITY_EVENTS",
+    "ERROR_EVENTS",
+    "SYSTEM_HEALTH_EVENTS",
+    "METRIC_ROLLUP_EVENTS",
+    "to_entity_type",
+    "to_event_type",
+    "to_payment_status",
+]
+
+class CachedEnumMeta(enum.EnumMeta):
+    """Precomputes each enum's values/names/choices once, at class creation"""
+    def __init__(cls, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Intern the values so decoded strings that are interned too compare by identity
+        for member in cls._member_map_.values():
+            if isinstance(member._value_, str):
+                member._value_ = sys.intern(member._value_)
+        # Rebuilt in place: the *_BY_VALUE module maps alias this dict
+        value_map = {sys.intern(k) if isinstance(k, str) else k: v for k, v in cls._value2member_map_.items()}
+        cls._value2member_map_.clear()
+        cls._value2member_map_.update(value_map)
+        cls._values = tuple(member.value for member in cls)
+        cls._names = tuple(member.name for member in cls)
+        cls._choices = tuple((member.name, member.value) for member in cls)
+
+class BaseEnum(enum.StrEnum, metaclass=CachedEnumMeta):
+    """
+    Shared base for the string-valued model enums. A StrEnum member is its value:
+    str(), format() and comparisons use the plain string, no .value needed.
+    """
+
+    @classmethod
+    def values(cls):
+        return cls._values
+
+    @classmethod
+    def names(cls):
+        return cls._names
+
+    @classmethod
+    def choices(cls):
+        return cls._choices
+
+class PaymentMethodType(BaseEnum):
     """Types of payment methods that can be stored"""
     CREDIT_CARD = "credit_card"  # Credit cards
     DEBIT_CARD = "debit_card"  # Debit cards
@@ -8,14 +90,14 @@ class PaymentMethodType(enum.Enum):
     DIGITAL_WALLET = "digital_wallet"  # Digital wallets (PayPal, etc.)
     CRYPTO_WALLET = "crypto_wallet"  # Cryptocurrency wallets
 
-class PaymentMethodStatus(enum.Enum):
+class PaymentMethodStatus(BaseEnum):
     """Possible states for a payment method"""
     ACTIVE = "active"  # Available for use
     EXPIRED = "expired"  # Card/account expired
     SUSPENDED = "suspended"  # Temporarily unavailable
     DELETED = "deleted"  # Removed by user
 
-class PaymentStatus(enum.Enum):
+class PaymentStatus(BaseEnum):
     """Possible states for a payment"""
     # Initial states
     DRAFT = "draft"  # Being prepared
@@ -36,7 +118,7 @@ class PaymentStatus(enum.Enum):
     REFUNDED = "refunded"  # Payment fully refunded
     PARTIALLY_REFUNDED = "partially_refunded"  # Payment partially refunded
 
-class OrderStatus(enum.Enum):
+class OrderStatus(BaseEnum):
     """Possible states for an order"""
     PENDING = "pending"  # Order created but not processed
     PROCESSING = "processing"  # Order being prepared
@@ -47,7 +129,7 @@ class OrderStatus(enum.Enum):
     ON_HOLD = "on_hold"  # Order temporarily suspended
     RETURNED = "returned"  # Order returned by customer
 
-class ShippingMethod(enum.Enum):
+class ShippingMethod(BaseEnum):
     """Available shipping methods"""
     STANDARD = "standard"  # Regular shipping (3-5 days)
     EXPRESS = "express"  # Expedited shipping (1-2 days)
@@ -55,7 +137,7 @@ class ShippingMethod(enum.Enum):
     LOCAL_PICKUP = "local_pickup"  # Customer picks up from store
     INTERNATIONAL = "international"  # International shipping
 
-class PaymentTerms(enum.Enum):
+class PaymentTerms(BaseEnum):
     """Available payment terms"""
     IMMEDIATE = "immediate"  # Due immediately
     NET_15 = "net_15"  # Due in 15 days
@@ -64,7 +146,7 @@ class PaymentTerms(enum.Enum):
     NET_60 = "net_60"  # Due in 60 days
     CUSTOM = "custom"  # Custom payment terms
 
-class ShopCategory(enum.Enum):
+class ShopCategory(BaseEnum):
     """Categories available for shops"""
     RETAIL = "retail"  # General retail
     RESTAURANT = "restaurant"  # Food service
@@ -75,7 +157,7 @@ class ShopCategory(enum.Enum):
     ENTERTAINMENT = "entertainment"  # Entertainment products/services
     OTHER = "other"  # Other categories
 
-class ProductCategory(enum.Enum):
+class ProductCategory(BaseEnum):
     """Categories available for products"""
     ELECTRONICS = "electronics"  # Electronic devices
     CLOTHING = "clothing"  # Apparel
@@ -89,14 +171,14 @@ class ProductCategory(enum.Enum):
     HEALTH = "health"  # Health products
     OTHER = "other"  # Other categories
 
-class ProductStatus(enum.Enum):
+class ProductStatus(BaseEnum):
     """Possible states for a product"""
     ACTIVE = "active"  # Available for purchase
     INACTIVE = "inactive"  # Temporarily unavailable
     OUT_OF_STOCK = "out_of_stock"  # No stock available
     DISCONTINUED = "discontinued"  # No longer sold
 
-class PromotionType(enum.Enum):
+class PromotionType(BaseEnum):
     """Types of promotions that can be offered"""
     PERCENTAGE = "percentage"  # Percentage off total
     FIXED_AMOUNT = "fixed_amount"  # Fixed amount off total
@@ -105,7 +187,7 @@ class PromotionType(enum.Enum):
     FREE_SHIPPING = "free_shipping"  # Free shipping offer
     MINIMUM_PURCHASE = "minimum_purchase"  # Discount with minimum spend
 
-class PromotionStatus(enum.Enum):
+class PromotionStatus(BaseEnum):
     """Possible states for a promotion"""
     DRAFT = "draft"  # Being created/edited
     SCHEDULED = "scheduled"  # Set to start in future
@@ -114,19 +196,19 @@ class PromotionStatus(enum.Enum):
     ENDED = "ended"  # Naturally completed
     CANCELLED = "cancelled"  # Manually stopped
 
-class PromotionApplicability(enum.Enum):
+class PromotionApplicability(BaseEnum):
     """What the promotion applies to"""
     ALL_PRODUCTS = "all_products"  # Applies to entire shop
     SPECIFIC_PRODUCTS = "specific_products"  # Only certain products
     SPECIFIC_CATEGORIES = "specific_categories"  # Only certain categories
     MINIMUM_ORDER = "minimum_order"  # Orders above threshold
 
-class ReviewType(enum.Enum):
+class ReviewType(BaseEnum):
     """Types of reviews that can be created"""
     SHOP = "shop"  # Review for the overall shop
     PRODUCT = "product"  # Review for a specific product
 
-class ReviewStatus(enum.Enum):
+class ReviewStatus(BaseEnum):
     """Possible states for a review"""
     PENDING = "pending"  # Awaiting moderation
     APPROVED = "approved"  # Visible to public
@@ -134,7 +216,7 @@ class ReviewStatus(enum.Enum):
     REPORTED = "reported"  # Flagged for review
     REMOVED = "removed"  # Taken down after being live
 
-class InventoryChangeType(enum.Enum):
+class InventoryChangeType(BaseEnum):
     """Types of inventory changes that can occur"""
     PURCHASE = "purchase"  # New stock purchased/received
     SALE = "sale"  # Stock sold to customer
@@ -147,7 +229,8 @@ class InventoryChangeType(enum.Enum):
     RESERVATION = "reservation"  # Stock reserved for order
     RESERVATION_RELEASE = "reservation_release"  # Reserved stock released
 
-class EntityType(enum.Enum):
+@enum.unique
+class EntityType(BaseEnum):
     USER = "user"
     SHOP = "user_shop"
     SHOP_PRODUCT = "shop_product"
@@ -159,7 +242,19 @@ class EntityType(enum.Enum):
     USER_PAYMENT_METHOD = "user_payment_method"
     UNKNOWN = "unknown"
 
-class EventType(enum.Enum):
+# Direct value -> member maps for hot decoders: ENTITY_TYPE_BY_VALUE.get(raw) skips
+# EnumMeta.__call__/_missing_ and the KeyError -> ValueError round trip of EntityType(raw)
+ENTITY_TYPE_BY_VALUE = EntityType._value2member_map_
+
+@enum.unique
+class EntityLifecycleKind(enum.IntEnum):
+    """Stored as SMALLINT on entity_lifecycle_events; the codes are persisted, never renumber them"""
+    CREATED = 1
+    DEACTIVATED = 2
+    REACTIVATED = 3
+
+@enum.unique
+class EventType(BaseEnum):
     """Types of events that can occur in the system"""
     # Account Events
     ACCOUNT_CREATED = "account_created"
@@ -296,3 +391,174 @@ class EventType(enum.Enum):
 
     # Custom Events
     UNKNOWN_EVENT = "unknown_event"
+
+EVENT_TYPE_BY_VALUE = EventType._value2member_map_
+
+# Integer mirror of EventType, in declaration order, for int-keyed dispatch tables:
+# handlers[EVENT_CODE[event_type]](...) instead of an if/elif chain of string compares
+EventTypeCode = enum.IntEnum("EventTypeCode", [(member.name, code) for code, member in enumerate(EventType)])
+EVENT_CODE = {member: EventTypeCode[member.name] for member in EventType}
+
+# EventType categories, for O(1) "is this a payment event?" checks
+ACCOUNT_EVENTS = frozenset({
+    EventType.ACCOUNT_CREATED,
+    EventType.ACCOUNT_DELETED,
+    EventType.ACCOUNT_DEACTIVATED,
+    EventType.ACCOUNT_REACTIVATED,
+    EventType.USER_LOGIN,
+    EventType.USER_LOGOUT,
+    EventType.PROFILE_UPDATED,
+    EventType.PASSWORD_CHANGED,
+    EventType.EMAIL_CHANGED,
+})
+SHOP_EVENTS = frozenset({
+    EventType.SHOP_CREATED,
+    EventType.SHOP_DELETED,
+    EventType.SHOP_UPDATED,
+    EventType.SHOP_DEACTIVATED,
+    EventType.SHOP_REACTIVATED,
+    EventType.SHOP_SETTINGS_UPDATED,
+})
+PRODUCT_EVENTS = frozenset({
+    EventType.PRODUCT_CREATED,
+    EventType.PRODUCT_UPDATED,
+    EventType.PRODUCT_DELETED,
+    EventType.PRODUCT_PRICE_CHANGED,
+    EventType.PRODUCT_STATUS_CHANGED,
+    EventType.PRODUCT_CATEGORY_CHANGED,
+})
+ORDER_EVENTS = frozenset({
+    EventType.ORDER_PLACED,
+    EventType.ORDER_UPDATED,
+    EventType.ORDER_CANCELLED,
+    EventType.ORDER_PROCESSING,
+    EventType.ORDER_SHIPPED,
+    EventType.ORDER_DELIVERED,
+    EventType.ORDER_RETURNED,
+    EventType.ORDER_REFUNDED,
+})
+PAYMENT_EVENTS = frozenset({
+    EventType.PAYMENT_INITIATED,
+    EventType.PAYMENT_PROCESSING,
+    EventType.PAYMENT_SUCCEEDED,
+    EventType.PAYMENT_FAILED,
+    EventType.PAYMENT_REFUNDED,
+    EventType.PAYMENT_PARTIALLY_REFUNDED,
+    EventType.PAYMENT_DISPUTED,
+    EventType.PAYMENT_DISPUTE_RESOLVED,
+})
+PAYMENT_METHOD_EVENTS = frozenset({
+    EventType.PAYMENT_METHOD_ADDED,
+    EventType.PAYMENT_METHOD_UPDATED,
+    EventType.PAYMENT_METHOD_REMOVED,
+    EventType.PAYMENT_METHOD_EXPIRED,
+    EventType.PAYMENT_METHOD_DEFAULT_CHANGED,
+})
+REVIEW_EVENTS = frozenset({
+    EventType.REVIEW_POSTED,
+    EventType.REVIEW_UPDATED,
+    EventType.REVIEW_DELETED,
+    EventType.REVIEW_REPORTED,
+    EventType.REVIEW_STATUS_CHANGED,
+    EventType.REVIEW_VOTE_ADDED,
+    EventType.REVIEW_VOTE_REMOVED,
+})
+PROMOTION_EVENTS = frozenset({
+    EventType.PROMOTION_CREATED,
+    EventType.PROMOTION_UPDATED,
+    EventType.PROMOTION_ACTIVATED,
+    EventType.PROMOTION_DEACTIVATED,
+    EventType.PROMOTION_USED,
+    EventType.PROMOTION_EXPIRED,
+    EventType.PROMOTION_LIMIT_REACHED,
+})
+INVENTORY_EVENTS = frozenset({
+    EventType.INVENTORY_UPDATED,
+    EventType.INVENTORY_LOW,
+    EventType.INVENTORY_OUT,
+    EventType.INVENTORY_RESTOCKED,
+    EventType.INVENTORY_ADJUSTED,
+    EventType.INVENTORY_AUDIT,
+})
+INVOICE_EVENTS = frozenset({
+    EventType.INVOICE_CREATED,
+    EventType.INVOICE_UPDATED,
+    EventType.INVOICE_PAID,
+    EventType.INVOICE_CANCELLED,
+    EventType.INVOICE_OVERDUE,
+    EventType.INVOICE_REMINDER_SENT,
+})
+METRIC_EVENTS = frozenset({
+    EventType.METRICS_UPDATED,
+    EventType.SHOP_METRICS_UPDATED,
+    EventType.PRODUCT_METRICS_UPDATED,
+    EventType.METRICS_ROLLUP_STARTED,
+    EventType.METRICS_ROLLUP_COMPLETED,
+    EventType.METRICS_ROLLUP_FAILED,
+})
+SYSTEM_EVENTS = frozenset({
+    EventType.SYSTEM_STARTUP,
+    EventType.SYSTEM_SHUTDOWN,
+    EventType.MAINTENANCE_STARTED,
+    EventType.MAINTENANCE_COMPLETED,
+    EventType.BACKUP_STARTED,
+    EventType.BACKUP_COMPLETED,
+    EventType.RESTORE_STARTED,
+    EventType.RESTORE_COMPLETED,
+})
+DATA_INTEGRITY_EVENTS = frozenset({
+    EventType.DATA_VALIDATION_STARTED,
+    EventType.DATA_VALIDATION_COMPLETED,
+    EventType.DATA_CORRUPTION_DETECTED,
+    EventType.DATA_REPAIR_STARTED,
+    EventType.DATA_REPAIR_COMPLETED,
+})
+API_EVENTS = frozenset({
+    EventType.API_RATE_LIMIT_WARNING,
+    EventType.API_RATE_LIMIT_EXCEEDED,
+    EventType.API_THROTTLING_APPLIED,
+    EventType.API_KEY_CREATED,
+    EventType.API_KEY_REVOKED,
+})
+SECURITY_EVENTS = frozenset({
+    EventType.SUSPICIOUS_ACTIVITY,
+    EventType.LOGIN_ATTEMPT_FAILED,
+    EventType.PASSWORD_RESET,
+    EventType.TWO_FACTOR_ENABLED,
+    EventType.TWO_FACTOR_DISABLED,
+})
+ERROR_EVENTS = frozenset({
+    EventType.ERROR_OCCURRED,
+    EventType.SHOP_ERROR,
+    EventType.PAYMENT_ERROR,
+    EventType.SYSTEM_ERROR,
+})
+# Cross-category sets the GlobalEvent analysis helpers filter on
+SYSTEM_HEALTH_EVENTS = frozenset({
+    EventType.SYSTEM_STARTUP,
+    EventType.SYSTEM_SHUTDOWN,
+    EventType.MAINTENANCE_STARTED,
+    EventType.MAINTENANCE_COMPLETED,
+    EventType.DATA_CORRUPTION_DETECTED,
+    EventType.SYSTEM_ERROR,
+})
+METRIC_ROLLUP_EVENTS = frozenset({
+    EventType.METRICS_ROLLUP_STARTED,
+    EventType.METRICS_ROLLUP_COMPLETED,
+    EventType.METRICS_ROLLUP_FAILED,
+})
+
+# Decoders for external strings: unknown values map to a fallback member instead of
+# raising ValueError, and the working set of distinct strings stays in the LRU
+@functools.lru_cache(maxsize=2048)
+def to_event_type(value: str) -> EventType:
+    return EVENT_TYPE_BY_VALUE.get(value, EventType.UNKNOWN_EVENT)
+
+@functools.lru_cache(maxsize=256)
+def to_entity_type(value: str) -> EntityType:
+    return ENTITY_TYPE_BY_VALUE.get(value, EntityType.UNKNOWN)
+
+@functools.lru_cache(maxsize=256)
+def to_payment_status(value: str):
+    """PaymentStatus has no unknown member, so an unrecognised value decodes to None"""
+    return PaymentStatus._value2member_map_.get(value)
@@ -1,12 +1,22 @@
-from .base import Base, PartitionedModel
-from sqlalchemy import Column, DateTime, String, Enum, Index, UUID
+from .base import Base, PartitionedModel, uuid7
+from sqlalchemy import Column, String, Enum, Index, UUID, BigInteger, SmallInteger, Sequence, CheckConstraint, bindparam, select
+from sqlalchemy.dialects.postgresql import TIMESTAMP
 from datetime import datetime
-from .enums import EntityType
+from .enums import EntityType, EntityLifecycleKind
+
+# Tiebreaker for lifecycle rows: event_time is whole seconds, so a created and a
+# deactivated in the same second would otherwise tie
+ENTITY_LIFECYCLE_SEQ = Sequence('entity_lifecycle_events_seq', schema='data_playground')
+
+def _entity_id_default(context):
+    """uuid7 stamped with the row's event_time, so the id sorts with its partition"""
+    return uuid7(context.get_current_parameters().get('event_time'))
 
 class GlobalEntity(Base, PartitionedModel):
     """
-    Tracks all entities in the system, providing a global registry of
-    when entities were created, deactivated, or reactivated.
+    Global registry of every entity in the system: one narrow identity row per
+    entity, written once and never updated. When an entity was created,
+    deactivated or reactivated lives in EntityLifecycleEvent.
     
     Indexing Strategy:
     - Primary key (event_time, entity_id, partition_key)
@@ -16,22 +26,28 @@ class GlobalEntity(Base, PartitionedModel):
     
     Partitioning Strategy:
     - Hourly partitioning based on event_time for efficient querying of recent data
+    - Each hourly partition is HASH sub-partitioned 8 ways on entity_id; pruning on
+      event_time/partition_key still happens at the top level first
     - Each partition contains one hour of data
     - Older partitions can be archived or dropped based on retention policy
     """
     __tablename__ = 'global_entities'
     __partitiontype__ = "hourly"  # Changed from daily to hourly
     __partition_field__ = "event_time"
+    # Each hour is HASH sub-partitioned on entity_id, so concurrent inserts into
+    # the current hour spread over 8 btree tails instead of one
+    __subpartition_field__ = "entity_id"
 
     # Primary Fields
     event_time = Column(
-        DateTime(timezone=True), 
+        TIMESTAMP(timezone=True, precision=0), 
         primary_key=True,
         comment="Timestamp used for partitioning and primary key"
     )
     entity_id = Column(
         UUID(as_uuid=True), 
         primary_key=True,
+        default=_entity_id_default,
         comment="Unique identifier for the entity"
     )
     partition_key = Column(
@@ -40,7 +56,10 @@ class GlobalEntity(Base, PartitionedModel):
         comment="Key used for time-based table partitioning"
     )
     
-    # Entity Type for table mapping
+    # Entity Type for table mapping. A native PG enum is stored as its 4-byte OID,
+    # not the label, and in (entity_type, event_time) / (entity_id, entity_type)
+    # index tuples alignment pads a smallint out to the same width, so a SMALLINT
+    # code column wouldn't make either index any smaller
     entity_type = Column(
         Enum(EntityType, schema='data_playground'), 
         nullable=False,
@@ -50,27 +69,6 @@ class GlobalEntity(Base, PartitionedModel):
         
     )
 
-    # Timestamps
-    created_time = Column(
-        DateTime(timezone=True), 
-        nullable=False, 
-        default=datetime.utcnow,
-        index=True,
-        comment="When the entity was created"
-    )
-    deactivated_time = Column(
-        DateTime(timezone=True),
-        nullable=True,
-        index=True,
-        comment="When the entity was deactivated (if applicable)"
-    )
-    reactivated_time = Column(
-        DateTime(timezone=True),
-        nullable=True,
-        index=True,
-        comment="When the entity was reactivated (if applicable)"
-    )
-
     # Indexes for common queries
     __table_args__ = (
         # Index for looking up entities by type
@@ -83,10 +81,20 @@ class GlobalEntity(Base, PartitionedModel):
               entity_id, entity_type,
               postgresql_using='btree'),
               
-        # Index for time-based queries
+        # Index for time-based queries; INCLUDE carries entity_type, so time-range
+        # reads of event_time, entity_id and entity_type are index-only scans
+        # (partition_key isn't covered, so selecting the whole row still visits the heap)
         Index('idx_global_entity_time_id', 
               event_time, entity_id,
-              postgresql_using='btree'),
+              postgresql_using='btree',
+              postgresql_include=['entity_type']),
+              
+        # BRIN over event_time: rows arrive in time order, so a few hundred bytes
+        # per partition cover range scans that would otherwise need the btree
+        Index('idx_global_entity_time_brin',
+              event_time,
+              postgresql_using='brin',
+              postgresql_with={'pages_per_range': 32}),
               
         # Partitioning configuration
         {
@@ -95,3 +103,123 @@ class GlobalEntity(Base, PartitionedModel):
             'comment': 'Stores entity data with hourly partitioning for efficient querying'
         }
     )
+
+    @classmethod
+    async def get_entity(cls, db, entity_id, entity_type):
+        """Entity by id and type, through the prebuilt ENTITY_BY_ID_AND_TYPE statement"""
+        return (await db.scalars(
+            ENTITY_BY_ID_AND_TYPE, {'entity_id': entity_id, 'entity_type': entity_type}
+        )).first()
+
+    @classmethod
+    async def record_lifecycle(cls, db, entity_id, kind, event_time=None):
+        """Append a created/deactivated/reactivated fact for an entity"""
+        return await EntityLifecycleEvent.create_with_partition(
+            db,
+            entity_id=entity_id,
+            kind=kind,
+            event_time=event_time or datetime.utcnow()
+        )
+
+    @classmethod
+    async def get_lifecycle_state(cls, db, entity_id, since):
+        """
+        The entity's latest EntityLifecycleKind, or None if nothing was recorded.
+        since is the entity's event_time: no transition predates it, so hourly
+        partitions before it are pruned, and the rest are read newest first
+        until one has a row for the entity.
+        """
+        kind = (await db.scalars(LATEST_LIFECYCLE_KIND, {
+            'entity_id': entity_id,
+            'since_key': EntityLifecycleEvent._compute_partition(since)[0]
+        })).first()
+        return None if kind is None else EntityLifecycleKind(kind)
+
+class EntityLifecycleEvent(Base, PartitionedModel):
+    """
+    Append-only lifecycle facts for GlobalEntity, one row per created /
+    deactivated / reactivated transition. Inserting a row replaces what used
+    to be an UPDATE of a mostly-NULL timestamp column on global_entities.
+    Current state is the latest row per entity (get_lifecycle_state).
+    
+    Indexing Strategy:
+    - Primary key (event_time, entity_id, kind, partition_key)
+    - (entity_id, partition_key, event_time, seq) serves the latest-row-per-entity
+      lookup; seq orders transitions recorded in the same second
+    - BRIN on event_time for time-range scans
+    
+    Partitioning Strategy:
+    - Hourly partitioning based on event_time, like global_entities
+    """
+    __tablename__ = 'entity_lifecycle_events'
+    __partitiontype__ = "hourly"
+    __partition_field__ = "event_time"
+
+    event_time = Column(
+        TIMESTAMP(timezone=True, precision=0),
+        primary_key=True,
+        comment="When the transition happened"
+    )
+    entity_id = Column(
+        UUID(as_uuid=True),
+        primary_key=True,
+        comment="GlobalEntity the transition belongs to"
+    )
+    kind = Column(
+        SmallInteger,
+        primary_key=True,
+        comment="EntityLifecycleKind code: 1 created, 2 deactivated, 3 reactivated"
+    )
+    # A sequence rather than an IDENTITY column: Postgres 15 can't put identity columns on partitioned tables
+    seq = Column(
+        BigInteger,
+        ENTITY_LIFECYCLE_SEQ,
+        nullable=False,
+        server_default=ENTITY_LIFECYCLE_SEQ.next_value(),
+        comment="Insert order; breaks event_time ties between transitions"
+    )
+
+    __table_args__ = (
+        CheckConstraint('kind BETWEEN 1 AND 3', name='kind'),
+
+        # Latest transition per entity. partition_key leads the time columns so each
+        # partition's scan comes back in LATEST_LIFECYCLE_KIND's order
+        Index('idx_entity_lifecycle_entity_time',
+              entity_id, 'partition_key', event_time, seq,
+              postgresql_using='btree'),
+
+        # Rows arrive in time order, so BRIN covers time ranges for a few hundred bytes
+        Index('idx_entity_lifecycle_time_brin',
+              event_time,
+              postgresql_using='brin',
+              postgresql_with={'pages_per_range': 32}),
+
+        # Partitioning configuration
+        {
+            'postgresql_partition_by': 'RANGE (partition_key)',
+            'schema': 'data_playground',
+            'comment': 'Append-only entity lifecycle transitions, partitioned hourly'
+        }
+    )
+
+# Hot query shapes, built once at import. Values travel as bound parameters, so every
+# call hits the same compiled-cache entry instead of rebuilding the select
+ENTITY_BY_ID_AND_TYPE = select(GlobalEntity).where(
+    GlobalEntity.entity_id == bindparam('entity_id'),
+    GlobalEntity.entity_type == bindparam('entity_type')
+)
+# Ordered by partition_key first, which is also the range partition key, so the
+# planner appends partitions newest first and stops at the first one with a row
+LATEST_LIFECYCLE_KIND = (
+    select(EntityLifecycleEvent.kind)
+    .where(
+        EntityLifecycleEvent.entity_id == bindparam('entity_id'),
+        EntityLifecycleEvent.partition_key >= bindparam('since_key')
+    )
+    .order_by(
+        EntityLifecycleEvent.partition_key.desc(),
+        EntityLifecycleEvent.event_time.desc(),
+        EntityLifecycleEvent.seq.desc()
+    )
+    .limit(1)
+)
@@ -1,11 +1,71 @@
-from .base import Base, PartitionedModel
-from sqlalchemy import Column, DateTime, String, ForeignKeyConstraint, JSON, Enum, UUID, Index
-from sqlalchemy.orm import relationship, backref
-import uuid
-from datetime import datetime
-from sqlalchemy.ext.hybrid import hybrid_property
-from app.schemas import GlobalEventResponse
-from .enums import EventType
+from .base import Base, PartitionedModel, uuid7
+from sqlalchemy import Column, Computed, DateTime, String, ForeignKeyConstraint, Enum, UUID, Index, BigInteger, MetaData, Table, bindparam, distinct, event, func, insert, lambda_stmt, select, text, tuple_
+from sqlalchemy.orm import relationship, backref, Session, selectinload
+from sqlalchemy.dialects.postgresql import JSONB
+from collections import deque
+from functools import partialmethod
+from datetime import datetime, timezone
+import asyncio
+import itertools
+import logging
+import os
+import orjson
+from .enums import EventType, ERROR_EVENTS, SECURITY_EVENTS, SYSTEM_HEALTH_EVENTS, METRIC_ROLLUP_EVENTS
+
+logger = logging.getLogger(__name__)
+
+# Session.info key holding event rows staged for the current transaction
+EVENT_BUFFER_KEY = "_event_buffer"
+
+# EventBuffer: rows per multi-row INSERT, and the longest a queued row waits for one
+AUDIT_TRAIL_BUFFER_MAX_SIZE = int(os.getenv("AUDIT_TRAIL_BUFFER_MAX_SIZE", 500))
+AUDIT_TRAIL_FLUSH_INTERVAL = float(os.getenv("AUDIT_TRAIL_FLUSH_INTERVAL", 1.0))
+# Longest a row whose caller awaits its commit (the create_* helpers) waits for a flush
+AUDIT_TRAIL_ACK_DELAY = float(os.getenv("AUDIT_TRAIL_ACK_DELAY", 0.02))
+# Batch size from which GlobalEvent.bulk_create uses COPY rather than INSERT
+COPY_MIN_ROWS = 100
+# Backlog at which EventBuffer switches from max_size-row INSERTs to one COPY of this many rows
+AUDIT_TRAIL_COPY_THRESHOLD = int(os.getenv("AUDIT_TRAIL_COPY_THRESHOLD", 5000))
+# Most rows EventBuffer holds before producers wait for the flusher to catch up
+AUDIT_TRAIL_QUEUE_CAPACITY = int(os.getenv("AUDIT_TRAIL_QUEUE_CAPACITY", 100_000))
+# Independent EventBuffers (flusher + connection each) that event_buffer spreads rows over
+AUDIT_TRAIL_BUFFER_SHARDS = int(os.getenv("AUDIT_TRAIL_BUFFER_SHARDS", 4))
+
+# Rows fetched per round trip by GlobalEvent.stream_events
+STREAM_BATCH_SIZE = 500
+
+# Event counts per (hour, event_type), materialized from global_events by the
+# global_events_hourly_rollup migration. It lives on its own MetaData so create_all
+# and autogenerate leave the view alone.
+global_events_hourly_rollup = Table(
+    'global_events_hourly_rollup',
+    MetaData(schema='data_playground'),
+    Column('hour', DateTime(timezone=True), primary_key=True),
+    Column('event_type', Enum(EventType, schema='data_playground', create_type=False), primary_key=True),
+    Column('n', BigInteger, nullable=False),
+)
+
+# Typed lookup keys promoted out of event_metadata; every emitted row carries all of
+# them (None when unused) so mixed event types still share one executemany INSERT
+_ENTITY_ID_COLUMNS = ('shop_id', 'product_id', 'order_id', 'payment_id', 'review_id', 'promotion_id')
+
+# Column order for copy_events records
+_COPY_COLUMNS = ('event_id', 'event_time', 'event_type', 'event_metadata', 'user_id', 'caller_entity_id', *_ENTITY_ID_COLUMNS, 'extra_data', 'partition_key')
+
+def _epoch_ms(ts):
+    """Milliseconds since the epoch; naive datetimes are taken as UTC"""
+    if ts.tzinfo is None:
+        ts = ts.replace(tzinfo=timezone.utc)
+    return int(ts.timestamp() * 1000)
+
+# in_() wants a sequence, not a frozenset
+_SECURITY_EVENT_LIST = list(SECURITY_EVENTS)
+
+# Off by default in Postgres because it costs planning time on every query; the stats
+# aggregates turn it on for their own transaction, so each hourly partition is counted
+# separately (and in parallel workers) and only per-partition partials get combined
+_PARTITIONWISE_AGGREGATE = text("SET LOCAL enable_partitionwise_aggregate = on")
+_REFRESH_HOURLY_ROLLUP = text("REFRESH MATERIALIZED VIEW CONCURRENTLY data_playground.global_events_hourly_rollup")
 
 class GlobalEvent(Base, PartitionedModel):
     """
@@ -13,14 +73,16 @@ class GlobalEvent(Base, PartitionedModel):
     and enabling system-wide monitoring and analysis.
     
     Indexing Strategy:
-    - Primary key (event_id, partition_key) for partitioning support
+    - Primary key (event_id, event_time); the partition column has to be part of it
     - event_type is indexed for filtering specific types of events
     - user_id is indexed for user-specific event queries
     - event_time is indexed for time-based queries and partitioning
     - Composite indexes for common query patterns
     
     Partitioning Strategy:
-    - Hourly partitioning based on event_time for efficient querying of recent events
+    - RANGE partitioned on event_time itself, so WHERE event_time BETWEEN ... prunes directly
+    - Hourly children are created by PartitionedModel (ensure_partition); the hourly
+      partition_key strings double as timestamptz range bounds
     - Each partition contains one hour of data
     - Older partitions can be archived or dropped based on retention policy
     """
@@ -32,13 +94,14 @@ class GlobalEvent(Base, PartitionedModel):
     event_id = Column(
         UUID(as_uuid=True), 
         primary_key=True, 
-        default=uuid.uuid4,
-        comment="Unique identifier for the event"
+        server_default=text("data_playground.uuid_generate_v7()"),
+        comment="Unique identifier for the event (UUIDv7, generated by the server)"
     )
     event_time = Column(
         DateTime(timezone=True), 
-        nullable=False,
+        primary_key=True,
         index=True,
+        server_default=func.now(),
         comment="Timestamp when the event occurred (with timezone)"
     )
     event_type = Column(
@@ -48,10 +111,12 @@ class GlobalEvent(Base, PartitionedModel):
         index=True,
         comment="Type of event that occurred (e.g., user creation, payment, etc.)"
     )
+    # TOASTed with lz4 rather than pglz (set by migration; SQLAlchemy has no
+    # column option for it); new partitions inherit it from the parent
     event_metadata = Column(
-        JSON, 
+        JSONB, 
         nullable=True,
-        comment="Additional event-specific data stored as JSON"
+        comment="Additional event-specific data stored as JSONB"
     )
     caller_entity_id = Column(
         UUID(as_uuid=True), 
@@ -59,26 +124,76 @@ class GlobalEvent(Base, PartitionedModel):
         index=True,
         comment="ID of the entity that triggered the event"
     )
+    # No single-column index: ix_ge_user_time and ix_global_events_user_type both lead with it
     user_id = Column(
         UUID(as_uuid=True), 
         nullable=True,
-        index=True,
         comment="ID of the user associated with this event (if applicable)"
     )
+
+    # Entity lookup keys, as typed columns rather than strings inside event_metadata,
+    # so get_shop_events and friends are a B-tree seek instead of a GIN probe.
+    # shop_id and product_id are indexed with event_time in __table_args__
+    shop_id = Column(
+        UUID(as_uuid=True),
+        nullable=True,
+        comment="Shop the event concerns (shop, product and promotion events)"
+    )
+    product_id = Column(
+        UUID(as_uuid=True),
+        nullable=True,
+        comment="Product the event concerns"
+    )
+    order_id = Column(
+        UUID(as_uuid=True),
+        nullable=True,
+        index=True,
+        comment="Order the event concerns"
+    )
+    payment_id = Column(
+        UUID(as_uuid=True),
+        nullable=True,
+        index=True,
+        comment="Payment the event concerns"
+    )
+    review_id = Column(
+        UUID(as_uuid=True),
+        nullable=True,
+        index=True,
+        comment="Review the event concerns"
+    )
+    promotion_id = Column(
+        UUID(as_uuid=True),
+        nullable=True,
+        index=True,
+        comment="Promotion the event concerns"
+    )
+    
+    # Metric rollup events' metric_type, pulled out of event_metadata by Postgres so
+    # get_metric_rollup_status filters on a B-tree. Never written by the application
+    metric_type = Column(
+        String,
+        Computed("event_metadata->>'metric_type'", persisted=True),
+        nullable=True,
+        comment="metric_type from event_metadata (metric rollup events only)"
+    )
     
-    # Additional Data
+    # Additional Data. No default: rows that don't set it stay NULL (read it as {})
+    # rather than every insert encoding and storing an empty object
     extra_data = Column(
-        JSON, 
+        JSONB, 
         nullable=True, 
-        default={},
         comment="Additional arbitrary data related to the event"
     )
     
-    # Partition key for time-based partitioning
+    # Hour bucket of event_time. No longer the partition column, but still
+    # stamped on every row: the users foreign key is (user_id, partition_key).
+    # Not a Computed column: to_char() is only STABLE, so Postgres won't accept
+    # it in a generation expression, and the key has to match the string
+    # _format_hourly writes into users.partition_key byte for byte.
     partition_key = Column(
         String, 
         nullable=False,
-        primary_key=True,
         comment="Key used for time-based table partitioning"
     )
 
@@ -87,8 +202,22 @@ class GlobalEvent(Base, PartitionedModel):
         # Composite index for event_type and event_time for filtering events by type within a time range
         Index('ix_global_events_type_time', 'event_type', 'event_time'),
         
-        # Composite index for user_id and event_time for user timeline queries
-        Index('ix_global_events_user_time', 'user_id', 'event_time'),
+        # User timelines: matches get_user_events' filter and its (event_time, event_id)
+        # DESC keyset order, so a page is one index range scan with no sort. Partial,
+        # since system events carry no user and would only bloat it
+        Index('ix_ge_user_time', 'user_id', text('event_time DESC'), text('event_id DESC'),
+              postgresql_where=text('user_id IS NOT NULL')),
+        
+        # Shop and product timelines, same shape as ix_ge_user_time for get_shop_events
+        # and get_product_events; most events have neither, hence partial
+        Index('ix_ge_shop_time', 'shop_id', text('event_time DESC'), text('event_id DESC'),
+              postgresql_where=text('shop_id IS NOT NULL')),
+        Index('ix_ge_product_time', 'product_id', text('event_time DESC'), text('event_id DESC'),
+              postgresql_where=text('product_id IS NOT NULL')),
+        
+        # get_metric_rollup_status: metric_type equality plus a time range
+        Index('ix_ge_metric_type_time', 'metric_type', 'event_time',
+              postgresql_where=text('metric_type IS NOT NULL')),
         
         # Composite index for user_id and event_type for user-specific event type queries
         Index('ix_global_events_user_type', 'user_id', 'event_type'),
@@ -96,6 +225,12 @@ class GlobalEvent(Base, PartitionedModel):
         # Composite index for caller_entity_id and event_time for entity timeline queries
         Index('ix_global_events_entity_time', 'caller_entity_id', 'event_time'),
         
+        # GIN over event_metadata for @> containment filters on ad hoc keys
+        # (promoted keys have their own columns); jsonb_path_ops only supports @>, and is smaller and faster for it
+        Index('ix_ge_metadata_gin', 'event_metadata',
+              postgresql_using='gin',
+              postgresql_ops={'event_metadata': 'jsonb_path_ops'}),
+        
         # Foreign key constraint with partition key
         ForeignKeyConstraint(
             ['user_id', 'partition_key'],
@@ -106,398 +241,719 @@ class GlobalEvent(Base, PartitionedModel):
         
         # Partitioning configuration
         {
-            'postgresql_partition_by': 'RANGE (partition_key)',
+            'postgresql_partition_by': 'RANGE (event_time)',
             'schema': 'data_playground',
             'comment': 'Stores all system events with hourly partitioning for efficient querying'
         }
     )
 
-    @hybrid_property
-    def response(self):
-        return GlobalEventResponse(
-            event_id=str(self.event_id),
-            event_time=self.event_time,
-            event_type=self.event_type.value,
-            event_metadata=self.event_metadata
+    # The entity that triggered the event. caller_entity_id has no FK (global_entities
+    # is partitioned on its own clock), hence the explicit join and viewonly.
+    # raise_on_sql like the user backref: load both through query_with_entities()
+    entity = relationship(
+        "GlobalEntity",
+        primaryjoin="foreign(GlobalEvent.caller_entity_id) == GlobalEntity.entity_id",
+        uselist=False,
+        viewonly=True,
+        lazy="raise_on_sql"
+    )
+
+    @classmethod
+    def query_with_entities(cls):
+        """select(GlobalEvent) with user and entity batch-loaded: 3 queries per page, not 1 + 2N"""
+        return select(cls).options(selectinload(cls.user), selectinload(cls.entity))
+
+    # Helper Methods for Bulk Ingest
+    @staticmethod
+    def _stamp_batch_defaults(rows):
+        """
+        Fill in event_time and event_id wherever a row lacks them. Rows without an
+        event_time share one clock reading for the whole batch; it's stamped here
+        rather than left to the now() server default because event_time picks the
+        partition, and partition_key has to agree with it. event_id is a uuid7 of
+        the row's event_time, made here rather than per row by uuid_generate_v7()
+        on the server, and it gives every row the same keys, which executemany needs
+        when a batch mixes create_* rows (id already set) with emit_* rows.
+        """
+        now = None
+        make_id = uuid7
+        for row in rows:
+            if row.get('event_time') is None:
+                if now is None:
+                    now = datetime.now(timezone.utc)
+                row['event_time'] = now
+            if row.get('event_id') is None:
+                row['event_id'] = make_id(row['event_time'])
+
+    @classmethod
+    async def bulk_insert(cls, db, rows):
+        """
+        Insert event dicts with one executemany INSERT through Core: no ORM
+        instances, no flush, nothing returned. Every dict needs the same keys.
+        """
+        cls._stamp_batch_defaults(rows)
+        pending = cls._stamp_partition_keys(rows)
+        try:
+            await cls._ensure_partitions(db, pending)
+            await db.execute(INSERT_EVENTS, rows)
+            await db.commit()
+        except Exception:
+            await db.rollback()
+            raise
+
+    @classmethod
+    async def copy_events(cls, db, rows):
+        """
+        Hot ingest path: stream event dicts into global_events with COPY, skipping
+        per-row INSERT parsing. Python-side defaults don't run under COPY, so
+        event_type is filled in here; event_id comes from _stamp_batch_defaults,
+        stamped with event_time rather than the server's clock, which keeps
+        backfills in order.
+        """
+        if not rows:
+            return
+        cls._stamp_batch_defaults(rows)
+        pending = cls._stamp_partition_keys(rows)
+        # A generator: records are encoded as asyncpg streams them, not all up front
+        records = (
+            (
+                row['event_id'],
+                row['event_time'],
+                (row.get('event_type') or EventType.UNKNOWN_EVENT).name,
+                None if row.get('event_metadata') is None else orjson.dumps(row['event_metadata']),
+                row.get('user_id'),
+                row.get('caller_entity_id'),
+                *(row.get(column) for column in _ENTITY_ID_COLUMNS),
+                None if row.get('extra_data') is None else orjson.dumps(row['extra_data']),
+                row['partition_key'],
+            )
+            for row in rows
         )
+        try:
+            await cls._ensure_partitions(db, pending)
+            conn = await db.connection()
+            raw = await conn.get_raw_connection()
+            await raw.driver_connection.copy_records_to_table(
+                cls.__tablename__,
+                schema_name='data_playground',
+                columns=_COPY_COLUMNS,
+                records=records
+            )
+            await db.commit()
+        except Exception:
+            await db.rollback()
+            raise
+
+    @classmethod
+    async def bulk_create(cls, db, rows, threshold=COPY_MIN_ROWS):
+        """
+        Write a batch of event dicts the cheapest way for its size: COPY from
+        threshold rows up, where it beats INSERT's per-row parse and bind, and
+        an executemany INSERT below that, where COPY's setup would dominate.
+        """
+        if len(rows) >= threshold:
+            await cls.copy_events(db, rows)
+        else:
+            await cls.bulk_insert(db, rows)
+
+    @classmethod
+    async def copy_events_parallel(cls, session_factory, rows, batch_size=10_000, concurrency=4):
+        """
+        copy_events over several pooled connections at once: rows are split into
+        batch_size chunks and up to `concurrency` COPYs run side by side, each on its
+        own session from session_factory. Every batch commits on its own, so a
+        failure can leave earlier batches written.
+        """
+        if not rows:
+            return
+        # Create every partition up front on one connection; concurrent CREATE TABLE
+        # ... PARTITION OF for the same hour would race on the catalog
+        cls._stamp_batch_defaults(rows)
+        pending = cls._stamp_partition_keys(rows)
+        if pending:
+            async with session_factory() as db:
+                try:
+                    await cls._ensure_partitions(db, pending)
+                    await db.commit()
+                except Exception:
+                    await db.rollback()
+                    raise
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def copy_batch(batch):
+            async with semaphore, session_factory() as db:
+                await cls.copy_events(db, batch)
+
+        await asyncio.gather(*(
+            copy_batch(rows[start:start + batch_size]) for start in range(0, len(rows), batch_size)
+        ))
 
     # Helper Methods for Event Creation
     @classmethod
-    async def create_user_event(cls, db, event_type, user_id, **metadata):
+    async def _emit(cls, db, event_type, metadata, user_id=None, wait=False, **entity_ids):
+        """
+        Write one event; entity_ids fill the promoted shop_id/product_id/... columns.
+
+        wait=False (the emit_* helpers): queue it on event_buffer and return None.
+        event_time is left unset, so each flushed batch shares one timestamp (see
+        _stamp_batch_defaults). Without a running flusher (scripts, tests) the row is
+        inserted right away on db instead.
+
+        wait=True (the create_* helpers): return its event_id once it's committed.
+        The id is a uuid7 made here, so the write needs no RETURNING. With the
+        flusher running the row still goes through event_buffer, so concurrent
+        callers share a batch and wait at most ack_delay for it, rather than
+        paying an INSERT and a commit each; otherwise it's inserted on db now.
+        """
+        row = {
+            'event_type': event_type,
+            'user_id': user_id,
+            'event_time': None,
+            'event_metadata': metadata,
+            **dict.fromkeys(_ENTITY_ID_COLUMNS),
+            **entity_ids
+        }
+        if wait:
+            row['event_id'] = uuid7()
+            if event_buffer.running:
+                await (await event_buffer.put(row, ack=True))
+            else:
+                row['event_time'] = datetime.now(timezone.utc)
+                await cls.bulk_insert(db, [row])
+            return row['event_id']
+        if event_buffer.running:
+            await event_buffer.put(row)
+        else:
+            await cls.bulk_insert(db, [row])
+
+    @classmethod
+    async def create_user_event(cls, db, event_type, user_id, wait=True, **metadata):
         """Create a user-related event"""
-        event = await cls.create_with_partition(
-            db,
-            event_type=event_type,
-            user_id=user_id,
-            event_time=datetime.utcnow(),
-            event_metadata=metadata
-        )
-        return event
+        return await cls._emit(db, event_type, metadata, user_id=user_id, wait=wait)
+
+    emit_user_event = partialmethod(create_user_event, wait=False)
+
+    @classmethod
+    async def stage_user_event(cls, db, event_type, user_id, **metadata):
+        """
+        Stage a user-related event to be written with the caller's next commit;
+        returns its event_id (a uuid7 made here, like _emit's). shop_id/order_id/
+        payment_id/... keywords go to their own columns, not event_metadata;
+        pass them as UUIDs.
+        """
+        entity_ids = {column: metadata.pop(column, None) for column in _ENTITY_ID_COLUMNS}
+        now = datetime.now(timezone.utc)
+        row = {
+            'event_id': uuid7(now),
+            'event_type': event_type,
+            'user_id': user_id,
+            'event_time': now,
+            'event_metadata': metadata,
+            **entity_ids
+        }
+        # The partition DDL, if any, runs in the caller's transaction and commits with it
+        await cls._ensure_partitions(db, cls._stamp_partition_keys([row]))
+        db.info.setdefault(EVENT_BUFFER_KEY, []).append(row)
+        return row['event_id']
 
     @classmethod
-    async def create_shop_event(cls, db, event_type, shop_id, user_id=None, **metadata):
+    async def create_shop_event(cls, db, event_type, shop_id, user_id=None, wait=True, **metadata):
         """Create a shop-related event"""
-        metadata['shop_id'] = str(shop_id)
-        event = await cls.create_with_partition(
-            db,
-            event_type=event_type,
-            user_id=user_id,
-            event_time=datetime.utcnow(),
-            event_metadata=metadata
-        )
-        return event
+        return await cls._emit(db, event_type, metadata, user_id=user_id, shop_id=shop_id, wait=wait)
+
+    emit_shop_event = partialmethod(create_shop_event, wait=False)
 
     @classmethod
-    async def create_order_event(cls, db, event_type, order_id, user_id, **metadata):
+    async def create_order_event(cls, db, event_type, order_id, user_id, wait=True, **metadata):
         """Create an order-related event"""
-        metadata['order_id'] = str(order_id)
-        event = await cls.create_with_partition(
-            db,
-            event_type=event_type,
-            user_id=user_id,
-            event_time=datetime.utcnow(),
-            event_metadata=metadata
-        )
-        return event
+        return await cls._emit(db, event_type, metadata, user_id=user_id, order_id=order_id, wait=wait)
+
+    emit_order_event = partialmethod(create_order_event, wait=False)
 
     @classmethod
-    async def create_product_event(cls, db, event_type, product_id, shop_id, user_id=None, **metadata):
+    async def create_product_event(cls, db, event_type, product_id, shop_id, user_id=None, wait=True, **metadata):
         """Create a product-related event"""
-        metadata.update({
-            'product_id': str(product_id),
-            'shop_id': str(shop_id)
-        })
-        event = await cls.create_with_partition(
-            db,
-            event_type=event_type,
-            user_id=user_id,
-            event_time=datetime.utcnow(),
-            event_metadata=metadata
-        )
-        return event
+        return await cls._emit(db, event_type, metadata, user_id=user_id, product_id=product_id, shop_id=shop_id, wait=wait)
+
+    emit_product_event = partialmethod(create_product_event, wait=False)
 
     @classmethod
-    async def create_payment_event(cls, db, event_type, payment_id, user_id, **metadata):
+    async def create_payment_event(cls, db, event_type, payment_id, user_id, wait=True, **metadata):
         """Create a payment-related event"""
-        metadata['payment_id'] = str(payment_id)
-        event = await cls.create_with_partition(
-            db,
-            event_type=event_type,
-            user_id=user_id,
-            event_time=datetime.utcnow(),
-            event_metadata=metadata
-        )
-        return event
+        return await cls._emit(db, event_type, metadata, user_id=user_id, payment_id=payment_id, wait=wait)
+
+    emit_payment_event = partialmethod(create_payment_event, wait=False)
 
     @classmethod
-    async def create_review_event(cls, db, event_type, review_id, user_id, **metadata):
+    async def create_review_event(cls, db, event_type, review_id, user_id, wait=True, **metadata):
         """Create a review-related event"""
-        metadata['review_id'] = str(review_id)
-        event = await cls.create_with_partition(
-            db,
-            event_type=event_type,
-            user_id=user_id,
-            event_time=datetime.utcnow(),
-            event_metadata=metadata
-        )
-        return event
+        return await cls._emit(db, event_type, metadata, user_id=user_id, review_id=review_id, wait=wait)
+
+    emit_review_event = partialmethod(create_review_event, wait=False)
 
     @classmethod
-    async def create_promotion_event(cls, db, event_type, promotion_id, shop_id, user_id=None, **metadata):
+    async def create_promotion_event(cls, db, event_type, promotion_id, shop_id, user_id=None, wait=True, **metadata):
         """Create a promotion-related event"""
-        metadata.update({
-            'promotion_id': str(promotion_id),
-            'shop_id': str(shop_id)
-        })
-        event = await cls.create_with_partition(
-            db,
-            event_type=event_type,
-            user_id=user_id,
-            event_time=datetime.utcnow(),
-            event_metadata=metadata
-        )
-        return event
+        return await cls._emit(db, event_type, metadata, user_id=user_id, promotion_id=promotion_id, shop_id=shop_id, wait=wait)
+
+    emit_promotion_event = partialmethod(create_promotion_event, wait=False)
 
     @classmethod
-    async def create_error_event(cls, db, event_type, error_message, user_id=None, **metadata):
+    async def create_error_event(cls, db, event_type, error_message, user_id=None, wait=True, **metadata):
         """Create an error event"""
         metadata['error_message'] = error_message
-        event = await cls.create_with_partition(
-            db,
-            event_type=event_type,
-            user_id=user_id,
-            event_time=datetime.utcnow(),
-            event_metadata=metadata
-        )
-        return event
+        return await cls._emit(db, event_type, metadata, user_id=user_id, wait=wait)
+
+    emit_error_event = partialmethod(create_error_event, wait=False)
 
     # Helper Methods for Event Analysis
     @classmethod
-    async def get_user_events(cls, db, user_id, event_types=None, start_time=None, end_time=None):
-        """Get events for a specific user"""
-        query = db.query(cls).filter(cls.user_id == user_id)
+    def _timeline_filters(cls, stmt, event_types, start_time, end_time):
+        """Add the optional event_type/time filters shared by the timeline queries to a lambda_stmt"""
         if event_types:
-            query = query.filter(cls.event_type.in_(event_types))
+            stmt += lambda s: s.where(cls.event_type.in_(event_types))
         if start_time:
-            query = query.filter(cls.event_time >= start_time)
+            stmt += lambda s: s.where(cls.event_time >= start_time)
         if end_time:
-            query = query.filter(cls.event_time <= end_time)
-        return await query.order_by(cls.event_time.desc()).all()
+            stmt += lambda s: s.where(cls.event_time <= end_time)
+        return stmt
 
     @classmethod
-    async def get_shop_events(cls, db, shop_id, event_types=None, start_time=None, end_time=None):
-        """Get events for a specific shop"""
-        query = db.query(cls).filter(
-            cls.event_metadata.contains({'shop_id': str(shop_id)})
-        )
-        if event_types:
-            query = query.filter(cls.event_type.in_(event_types))
-        if start_time:
-            query = query.filter(cls.event_time >= start_time)
-        if end_time:
-            query = query.filter(cls.event_time <= end_time)
-        return await query.order_by(cls.event_time.desc()).all()
+    async def _timeline_page(cls, db, stmt, limit, before, scalars=True):
+        """
+        At most `limit` rows of stmt (a lambda_stmt), newest first. Pass the
+        (event_time, event_id) of the last row as `before` to get the next page:
+        a keyset seek on the time indexes instead of an OFFSET that reads and
+        throws away every earlier page. scalars=False returns Row tuples, for
+        column selects.
+
+        The cursor also bounds event_time on its own: partition pruning doesn't
+        look inside a row comparison, so without it every page would still open
+        the partitions newer than the cursor.
+        """
+        if before is not None:
+            before_time, before_id = before
+            stmt += lambda s: s.where(
+                cls.event_time <= before_time,
+                tuple_(cls.event_time, cls.event_id) < tuple_(before_time, before_id)
+            )
+        stmt += lambda s: s.order_by(cls.event_time.desc(), cls.event_id.desc()).limit(limit)
+        if not scalars:
+            return (await db.execute(stmt)).all()
+        return (await db.scalars(stmt)).all()
 
     @classmethod
-    async def get_product_events(cls, db, product_id, event_types=None, start_time=None, end_time=None):
-        """Get events for a specific product"""
-        query = db.query(cls).filter(
-            cls.event_metadata.contains({'product_id': str(product_id)})
-        )
-        if event_types:
-            query = query.filter(cls.event_type.in_(event_types))
-        if start_time:
-            query = query.filter(cls.event_time >= start_time)
-        if end_time:
-            query = query.filter(cls.event_time <= end_time)
-        return await query.order_by(cls.event_time.desc()).all()
-
-    @classmethod
-    async def get_error_events(cls, db, error_types=None, start_time=None, end_time=None):
-        """Get error events"""
-        query = db.query(cls).filter(
-            cls.event_type.in_([
-                EventType.ERROR_OCCURRED,
-                EventType.SHOP_ERROR,
-                EventType.PAYMENT_ERROR,
-                EventType.SYSTEM_ERROR
-            ])
-        )
-        if error_types:
-            query = query.filter(cls.event_type.in_(error_types))
-        if start_time:
-            query = query.filter(cls.event_time >= start_time)
-        if end_time:
-            query = query.filter(cls.event_time <= end_time)
-        return await query.order_by(cls.event_time.desc()).all()
+    async def stream_events(cls, db, query, params=None):
+        """
+        Iterate every row of query without loading them all: rows come off a
+        server-side cursor STREAM_BATCH_SIZE at a time. For exports and backfills
+        that really do need the full result.
+        """
+        result = await db.stream_scalars(query.execution_options(yield_per=STREAM_BATCH_SIZE), params)
+        async for event in result:
+            yield event
+
+    # The timeline queries are lambda_stmts: SQLAlchemy caches each lambda's SQL by
+    # its code location, so repeat calls skip building and compiling the select and
+    # only pull the new values out of the closures as bound parameters
+    @classmethod
+    async def get_user_events(cls, db, user_id, event_types=None, start_time=None, end_time=None, limit=1000, before=None):
+        """Get events for a specific user, newest first; see _timeline_page for limit/before"""
+        stmt = lambda_stmt(lambda: select(cls).where(cls.user_id == user_id))
+        stmt = cls._timeline_filters(stmt, event_types, start_time, end_time)
+        return await cls._timeline_page(db, stmt, limit, before)
+
+    @classmethod
+    async def get_user_events_brief(cls, db, user_id, event_types=None, start_time=None, end_time=None, limit=1000, before=None):
+        """
+        get_user_events as (event_id, event_time, event_type, event_metadata) rows:
+        no ORM instances or identity map. Feeds GlobalEventResponse.from_rows.
+        """
+        stmt = lambda_stmt(lambda: select(
+            cls.event_id, cls.event_time, cls.event_type, cls.event_metadata
+        ).where(cls.user_id == user_id))
+        stmt = cls._timeline_filters(stmt, event_types, start_time, end_time)
+        return await cls._timeline_page(db, stmt, limit, before, scalars=False)
+
+    @classmethod
+    async def get_shop_events(cls, db, shop_id, event_types=None, start_time=None, end_time=None, limit=1000, before=None):
+        """Get events for a specific shop, newest first; see _timeline_page for limit/before"""
+        stmt = lambda_stmt(lambda: select(cls).where(cls.shop_id == shop_id))
+        stmt = cls._timeline_filters(stmt, event_types, start_time, end_time)
+        return await cls._timeline_page(db, stmt, limit, before)
+
+    @classmethod
+    async def get_product_events(cls, db, product_id, event_types=None, start_time=None, end_time=None, limit=1000, before=None):
+        """Get events for a specific product, newest first; see _timeline_page for limit/before"""
+        stmt = lambda_stmt(lambda: select(cls).where(cls.product_id == product_id))
+        stmt = cls._timeline_filters(stmt, event_types, start_time, end_time)
+        return await cls._timeline_page(db, stmt, limit, before)
+
+    @classmethod
+    async def get_error_events(cls, db, error_types=None, start_time=None, end_time=None, limit=1000, before=None):
+        """Get error events, newest first; see _timeline_page for limit/before"""
+        event_types = list(ERROR_EVENTS & set(error_types) if error_types else ERROR_EVENTS)
+        stmt = cls._timeline_filters(lambda_stmt(lambda: select(cls)), event_types, start_time, end_time)
+        return await cls._timeline_page(db, stmt, limit, before)
 
     @classmethod
     async def get_event_stats(cls, db, event_types=None, start_time=None, end_time=None):
-        """Get statistics for events"""
-        query = db.query(cls)
+        """Get statistics for events; the counting happens in Postgres, only per-type totals come back"""
+        conditions = []
+        params = {}
         if event_types:
-            query = query.filter(cls.event_type.in_(event_types))
+            conditions.append(EVENT_TYPE_IN)
+            params['event_types'] = list(event_types)
         if start_time:
-            query = query.filter(cls.event_time >= start_time)
+            conditions.append(cls.event_time >= start_time)
         if end_time:
-            query = query.filter(cls.event_time <= end_time)
-        
-        events = await query.all()
+            conditions.append(cls.event_time <= end_time)
+
+        await db.execute(_PARTITIONWISE_AGGREGATE)
+        counts = dict((await db.execute(
+            select(cls.event_type, func.count()).where(*conditions).group_by(cls.event_type), params
+        )).all())
+        unique_users = await db.scalar(
+            select(func.count(distinct(cls.user_id))).where(*conditions), params
+        )
         return {
-            'total_events': len(events),
+            'total_events': sum(counts.values()),
             'events_by_type': {
-                event_type: len([e for e in events if e.event_type == event_type])
+                event_type: counts.get(event_type, 0)
                 for event_type in EventType
             },
-            'unique_users': len(set(event.user_id for event in events if event.user_id))
+            'unique_users': unique_users
         }
 
+    @classmethod
+    async def get_event_stats_archived(cls, event_types=None, start_time=None, end_time=None):
+        """get_event_stats over the hours already moved to Parquet; DuckDB runs in a worker thread"""
+        from ..utils.event_archive import archived_event_stats
+        return await asyncio.to_thread(archived_event_stats, event_types, start_time, end_time)
+
+    # Helper Methods for the Hourly Rollup
+    @classmethod
+    async def refresh_hourly_rollup(cls, db):
+        """Bring global_events_hourly_rollup up to date; readers aren't blocked meanwhile"""
+        await db.execute(_REFRESH_HOURLY_ROLLUP)
+        await db.commit()
+
+    @classmethod
+    async def get_hourly_event_counts(cls, db, event_types=None, start_time=None, end_time=None):
+        """(hour, event_type, n) rows from the rollup; as fresh as its last refresh"""
+        rollup = global_events_hourly_rollup.c
+        query = select(rollup.hour, rollup.event_type, rollup.n)
+        if event_types:
+            query = query.where(rollup.event_type.in_(event_types))
+        if start_time:
+            query = query.where(rollup.hour >= start_time)
+        if end_time:
+            query = query.where(rollup.hour <= end_time)
+        return (await db.execute(query.order_by(rollup.hour, rollup.event_type))).all()
+
     # Helper Methods for Event Creation
     @classmethod
-    async def create_system_event(cls, db, event_type, **metadata):
+    async def create_system_event(cls, db, event_type, wait=True, **metadata):
         """Create a system-related event"""
-        event = await cls.create_with_partition(
-            db,
-            event_type=event_type,
-            event_time=datetime.utcnow(),
-            event_metadata=metadata
-        )
-        return event
+        return await cls._emit(db, event_type, metadata, wait=wait)
+
+    emit_system_event = partialmethod(create_system_event, wait=False)
 
     @classmethod
-    async def create_maintenance_event(cls, db, event_type, maintenance_type, **metadata):
-        """Create a maintenance-related event"""
-        metadata.update({
-            'maintenance_type': maintenance_type,
-            'start_time': datetime.utcnow().isoformat() if 'STARTED' in event_type.value else None,
-            'end_time': datetime.utcnow().isoformat() if 'COMPLETED' in event_type.value else None
-        })
-        event = await cls.create_with_partition(
-            db,
-            event_type=event_type,
-            event_time=datetime.utcnow(),
-            event_metadata=metadata
-        )
-        return event
+    async def create_maintenance_event(cls, db, event_type, maintenance_type, wait=True, **metadata):
+        """Create a maintenance-related event; when it started or finished is the event_type plus event_time"""
+        metadata['maintenance_type'] = maintenance_type
+        return await cls._emit(db, event_type, metadata, wait=wait)
+
+    emit_maintenance_event = partialmethod(create_maintenance_event, wait=False)
 
     # Helper Methods for Data Integrity Events
     @classmethod
-    async def create_data_validation_event(cls, db, event_type, validation_type, results=None, **metadata):
+    async def create_data_validation_event(cls, db, event_type, validation_type, results=None, wait=True, **metadata):
         """Create a data validation event"""
         metadata.update({
             'validation_type': validation_type,
-            'validation_results': results,
-            'timestamp': datetime.utcnow().isoformat()
+            'validation_results': results
         })
-        event = await cls.create_with_partition(
-            db,
-            event_type=event_type,
-            event_time=datetime.utcnow(),
-            event_metadata=metadata
-        )
-        return event
+        return await cls._emit(db, event_type, metadata, wait=wait)
+
+    emit_data_validation_event = partialmethod(create_data_validation_event, wait=False)
 
     @classmethod
-    async def create_data_corruption_event(cls, db, corruption_details, affected_tables=None, **metadata):
+    async def create_data_corruption_event(cls, db, corruption_details, affected_tables=None, wait=True, **metadata):
         """Create a data corruption event"""
         metadata.update({
             'corruption_details': corruption_details,
-            'affected_tables': affected_tables,
-            'detected_time': datetime.utcnow().isoformat()
+            'affected_tables': affected_tables
         })
-        event = await cls.create_with_partition(
-            db,
-            event_type=EventType.DATA_CORRUPTION_DETECTED,
-            event_time=datetime.utcnow(),
-            event_metadata=metadata
-        )
-        return event
+        return await cls._emit(db, EventType.DATA_CORRUPTION_DETECTED, metadata, wait=wait)
+
+    emit_data_corruption_event = partialmethod(create_data_corruption_event, wait=False)
 
     # Helper Methods for API and Rate Limiting Events
     @classmethod
-    async def create_api_event(cls, db, event_type, api_key=None, endpoint=None, user_id=None, **metadata):
+    async def create_api_event(cls, db, event_type, api_key=None, endpoint=None, user_id=None, wait=True, **metadata):
         """Create an API-related event"""
         metadata.update({
             'api_key': api_key,
-            'endpoint': endpoint,
-            'timestamp': datetime.utcnow().isoformat()
+            'endpoint': endpoint
         })
-        event = await cls.create_with_partition(
-            db,
-            event_type=event_type,
-            user_id=user_id,
-            event_time=datetime.utcnow(),
-            event_metadata=metadata
-        )
-        return event
+        return await cls._emit(db, event_type, metadata, user_id=user_id, wait=wait)
+
+    emit_api_event = partialmethod(create_api_event, wait=False)
 
     @classmethod
-    async def create_rate_limit_event(cls, db, event_type, user_id, endpoint, current_rate=None, limit=None, **metadata):
+    async def create_rate_limit_event(cls, db, event_type, user_id, endpoint, current_rate=None, limit=None, wait=True, **metadata):
         """Create a rate limit event"""
         metadata.update({
             'endpoint': endpoint,
             'current_rate': current_rate,
-            'rate_limit': limit,
-            'timestamp': datetime.utcnow().isoformat()
+            'rate_limit': limit
         })
-        event = await cls.create_with_partition(
-            db,
-            event_type=event_type,
-            user_id=user_id,
-            event_time=datetime.utcnow(),
-            event_metadata=metadata
-        )
-        return event
+        return await cls._emit(db, event_type, metadata, user_id=user_id, wait=wait)
+
+    emit_rate_limit_event = partialmethod(create_rate_limit_event, wait=False)
 
     # Helper Methods for Security Events
     @classmethod
-    async def create_security_event(cls, db, event_type, user_id, ip_address=None, user_agent=None, **metadata):
+    async def create_security_event(cls, db, event_type, user_id, ip_address=None, user_agent=None, wait=True, **metadata):
         """Create a security-related event"""
         metadata.update({
             'ip_address': ip_address,
-            'user_agent': user_agent,
-            'timestamp': datetime.utcnow().isoformat()
+            'user_agent': user_agent
         })
-        event = await cls.create_with_partition(
-            db,
-            event_type=event_type,
-            user_id=user_id,
-            event_time=datetime.utcnow(),
-            event_metadata=metadata
-        )
-        return event
+        return await cls._emit(db, event_type, metadata, user_id=user_id, wait=wait)
+
+    emit_security_event = partialmethod(create_security_event, wait=False)
 
     # Helper Methods for Metric Events
     @classmethod
-    async def create_metric_rollup_event(cls, db, event_type, metric_type, start_time=None, end_time=None, **metadata):
-        """Create a metric rollup event"""
+    async def create_metric_rollup_event(cls, db, event_type, metric_type, start_time=None, end_time=None, wait=True, **metadata):
+        """Create a metric rollup event; the rollup window is stored as epoch milliseconds"""
         metadata.update({
             'metric_type': metric_type,
-            'rollup_start_time': start_time.isoformat() if start_time else None,
-            'rollup_end_time': end_time.isoformat() if end_time else None,
-            'timestamp': datetime.utcnow().isoformat()
+            'rollup_start_time': _epoch_ms(start_time) if start_time else None,
+            'rollup_end_time': _epoch_ms(end_time) if end_time else None
         })
-        event = await cls.create_with_partition(
-            db,
-            event_type=event_type,
-            event_time=datetime.utcnow(),
-            event_metadata=metadata
-        )
-        return event
+        return await cls._emit(db, event_type, metadata, wait=wait)
+
+    emit_metric_rollup_event = partialmethod(create_metric_rollup_event, wait=False)
 
     # Additional Analysis Methods
     @classmethod
     async def get_system_health_events(cls, db, start_time=None, end_time=None):
         """Get system health-related events"""
-        system_event_types = [
-            EventType.SYSTEM_STARTUP,
-            EventType.SYSTEM_SHUTDOWN,
-            EventType.MAINTENANCE_STARTED,
-            EventType.MAINTENANCE_COMPLETED,
-            EventType.DATA_CORRUPTION_DETECTED,
-            EventType.SYSTEM_ERROR
-        ]
-        return await cls.get_event_stats(db, event_types=system_event_types, start_time=start_time, end_time=end_time)
-
-    @classmethod
-    async def get_security_events(cls, db, user_id=None, start_time=None, end_time=None):
-        """Get security-related events"""
-        security_event_types = [
-            EventType.SUSPICIOUS_ACTIVITY,
-            EventType.LOGIN_ATTEMPT_FAILED,
-            EventType.PASSWORD_RESET,
-            EventType.TWO_FACTOR_ENABLED,
-            EventType.TWO_FACTOR_DISABLED
-        ]
-        query = db.query(cls).filter(cls.event_type.in_(security_event_types))
+        return await cls.get_event_stats(db, event_types=SYSTEM_HEALTH_EVENTS, start_time=start_time, end_time=end_time)
+
+    @classmethod
+    async def get_security_events(cls, db, user_id=None, start_time=None, end_time=None, limit=1000, before=None):
+        """Get security-related events, newest first; see _timeline_page for limit/before"""
+        stmt = lambda_stmt(lambda: select(cls))
         if user_id:
-            query = query.filter(cls.user_id == user_id)
-        if start_time:
-            query = query.filter(cls.event_time >= start_time)
-        if end_time:
-            query = query.filter(cls.event_time <= end_time)
-        return await query.order_by(cls.event_time.desc()).all()
+            stmt += lambda s: s.where(cls.user_id == user_id)
+        stmt = cls._timeline_filters(stmt, _SECURITY_EVENT_LIST, start_time, end_time)
+        return await cls._timeline_page(db, stmt, limit, before)
 
     @classmethod
     async def get_metric_rollup_status(cls, db, metric_type=None, start_time=None, end_time=None):
-        """Get metric rollup status"""
-        metric_event_types = [
-            EventType.METRICS_ROLLUP_STARTED,
-            EventType.METRICS_ROLLUP_COMPLETED,
-            EventType.METRICS_ROLLUP_FAILED
-        ]
-        query = db.query(cls).filter(cls.event_type.in_(metric_event_types))
+        """Get metric rollup status; only the counts come back, not the events"""
+        query = select(cls.event_type, func.count()).where(EVENT_TYPE_IN).group_by(cls.event_type)
         if metric_type:
-            query = query.filter(cls.event_metadata.contains({'metric_type': metric_type}))
+            query = query.where(cls.metric_type == metric_type)
         if start_time:
-            query = query.filter(cls.event_time >= start_time)
+            query = query.where(cls.event_time >= start_time)
         if end_time:
-            query = query.filter(cls.event_time <= end_time)
+            query = query.where(cls.event_time <= end_time)
         
-        events = await query.order_by(cls.event_time.desc()).all()
+        await db.execute(_PARTITIONWISE_AGGREGATE)
+        counts = dict((await db.execute(query, {'event_types': list(METRIC_ROLLUP_EVENTS)})).all())
         return {
-            'total_rollups': len(events),
-            'successful_rollups': len([e for e in events if e.event_type == EventType.METRICS_ROLLUP_COMPLETED]),
-            'failed_rollups': len([e for e in events if e.event_type == EventType.METRICS_ROLLUP_FAILED]),
-            'in_progress_rollups': len([e for e in events if e.event_type == EventType.METRICS_ROLLUP_STARTED])
+            'total_rollups': sum(counts.values()),
+            'successful_rollups': counts.get(EventType.METRICS_ROLLUP_COMPLETED, 0),
+            'failed_rollups': counts.get(EventType.METRICS_ROLLUP_FAILED, 0),
+            'in_progress_rollups': counts.get(EventType.METRICS_ROLLUP_STARTED, 0)
         }
+
+class EventBuffer:
+    """
+    Process-wide write buffer behind the emit_*_event helpers. Producers append
+    rows to a deque and return without awaiting the database; a single flusher
+    task drains it with one multi-row INSERT per max_size rows, or every
+    flush_interval seconds when traffic is light. Everything runs on the event
+    loop, so the deque needs no lock. The queue is bounded by capacity: once
+    the database falls that far behind, put() makes producers wait instead of
+    growing memory without limit. A backlog of copy_threshold rows or more is
+    drained copy_threshold at a time through COPY instead. Rows queued with
+    ack=True don't wait out flush_interval: the first one arms a timer that
+    flushes after ack_delay, so callers awaiting a commit share one batch.
+
+    One set per process (see ShardedEventBuffer); each uvicorn worker runs its own flushers.
+    """
+    def __init__(self, max_size=AUDIT_TRAIL_BUFFER_MAX_SIZE, flush_interval=AUDIT_TRAIL_FLUSH_INTERVAL,
+                 capacity=AUDIT_TRAIL_QUEUE_CAPACITY, copy_threshold=AUDIT_TRAIL_COPY_THRESHOLD,
+                 ack_delay=AUDIT_TRAIL_ACK_DELAY):
+        self.max_size = max_size
+        self.flush_interval = flush_interval
+        self.ack_delay = ack_delay
+        self.capacity = capacity
+        self.copy_threshold = copy_threshold
+        self._pending = deque()
+        self._wakeup = None
+        self._room = None
+        self._ack_timer = None
+        self._session_factory = None
+        self._task = None
+        self._stopping = False
+
+    @property
+    def running(self):
+        return self._task is not None and not self._task.done()
+
+    def start(self, session_factory):
+        """Start the flusher on the running loop; it opens a session from session_factory per batch"""
+        self._session_factory = session_factory
+        self._wakeup = asyncio.Event()
+        self._room = asyncio.Event()
+        self._room.set()
+        self._stopping = False
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Write out whatever is still queued, then stop the flusher"""
+        if self._task is None:
+            return
+        self._stopping = True
+        self._wakeup.set()
+        await self._task
+        self._task = None
+
+    async def put(self, row, ack=False):
+        """enqueue(), but first wait for room if the queue is at capacity"""
+        while len(self._pending) >= self.capacity:
+            self._room.clear()
+            self._wakeup.set()
+            await self._room.wait()
+        return self.enqueue(row, ack)
+
+    def enqueue(self, row, ack=False):
+        """
+        Queue an event row. With ack=True, returns a future that resolves once the
+        row is committed (or carries the insert's exception); otherwise None.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future() if ack else None
+        self._pending.append((row, future))
+        if len(self._pending) >= self.max_size:
+            self._wakeup.set()
+        elif ack and self._ack_timer is None:
+            self._ack_timer = loop.call_later(self.ack_delay, self._wakeup.set)
+        return future
+
+    async def _run(self):
+        while not self._stopping:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            if self._ack_timer is not None:
+                self._ack_timer.cancel()
+                self._ack_timer = None
+            await self.flush()
+        await self.flush()
+
+    async def flush(self):
+        while self._pending:
+            size = self.copy_threshold if len(self._pending) >= self.copy_threshold else self.max_size
+            batch = [self._pending.popleft() for _ in range(min(size, len(self._pending)))]
+            self._room.set()
+            try:
+                async with self._session_factory() as db:
+                    await GlobalEvent.bulk_create(db, [row for row, _ in batch], threshold=self.copy_threshold)
+            except Exception as e:
+                # Audit rows are fire-and-forget: log and drop, and tell whoever asked
+                logger.error("Failed to flush %d buffered events: %s", len(batch), e, exc_info=True)
+                for _, future in batch:
+                    if future is not None and not future.done():
+                        future.set_exception(e)
+                continue
+            for _, future in batch:
+                if future is not None and not future.done():
+                    future.set_result(None)
+
+class ShardedEventBuffer:
+    """
+    Several EventBuffers side by side. One flusher only ever has one batch in
+    flight, so once encoding and the round trip dominate it caps throughput;
+    with a flusher per shard, each on its own pooled connection, that many
+    batches are written at once. Rows for a user always go to the same shard,
+    so that user's events keep their order; rows without a user are dealt out
+    round-robin. Same interface as EventBuffer; capacity is split evenly.
+    """
+    def __init__(self, shards=AUDIT_TRAIL_BUFFER_SHARDS, capacity=AUDIT_TRAIL_QUEUE_CAPACITY, **kwargs):
+        self.shards = [EventBuffer(capacity=max(1, capacity // shards), **kwargs) for _ in range(shards)]
+        self._round_robin = itertools.count()
+
+    @property
+    def running(self):
+        return any(shard.running for shard in self.shards)
+
+    def _shard(self, row):
+        user_id = row.get('user_id')
+        key = hash(user_id) if user_id is not None else next(self._round_robin)
+        return self.shards[key % len(self.shards)]
+
+    def start(self, session_factory):
+        for shard in self.shards:
+            shard.start(session_factory)
+
+    async def stop(self):
+        await asyncio.gather(*(shard.stop() for shard in self.shards))
+
+    async def put(self, row, ack=False):
+        return await self._shard(row).put(row, ack)
+
+    def enqueue(self, row, ack=False):
+        return self._shard(row).enqueue(row, ack)
+
+    async def flush(self):
+        await asyncio.gather(*(shard.flush() for shard in self.shards))
+
+event_buffer = ShardedEventBuffer()
+
+# Hot query shapes, built once at import. Values travel as bound parameters, so every
+# call hits the same compiled-cache entry instead of rebuilding the select
+EVENT_BY_ID = select(GlobalEvent).where(GlobalEvent.event_id == bindparam('event_id'))
+EVENTS_IN_RANGE = (
+    select(GlobalEvent)
+    .where(GlobalEvent.event_time.between(bindparam('lo'), bindparam('hi')))
+    .order_by(GlobalEvent.event_time)
+)
+# Just the response columns: listing pages skip ORM hydration (see GlobalEventResponse.from_rows)
+EVENT_ROWS_PAGE = (
+    select(GlobalEvent.event_id, GlobalEvent.event_time, GlobalEvent.event_type, GlobalEvent.event_metadata)
+    .offset(bindparam('skip'))
+    .limit(bindparam('limit'))
+)
+
+# Every event write that doesn't go through COPY is this one executemany INSERT. The
+# event type and metadata are plain parameters, so all helpers share a single SQL
+# text: asyncpg prepares it once per connection and reuses it (statement_cache_size
+# in database.py); per-event-type statements would only add identical plans
+INSERT_EVENTS = insert(GlobalEvent.__table__)
+
+# event_type IN (...) with the member list bound at execute time. One expanding
+# parameter, so the statement compiles the same however many types are passed
+EVENT_TYPE_IN = GlobalEvent.event_type.in_(bindparam('event_types', expanding=True))
+
+# Write staged events in the same transaction as the commit that triggered them
+@event.listens_for(Session, 'before_commit')
+def flush_event_buffer(session):
+    rows = session.info.pop(EVENT_BUFFER_KEY, None)
+    if rows:
+        session.execute(INSERT_EVENTS, rows)
+
+@event.listens_for(Session, 'after_rollback')
+def discard_event_buffer(session):
+    session.info.pop(EVENT_BUFFER_KEY, None)
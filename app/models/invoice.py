@@ -1,5 +1,5 @@
 from .base import Base, PartitionedModel
-from sqlalchemy import Column, DateTime, String, ForeignKeyConstraint, JSON, Enum, Float, Integer, UUID, UniqueConstraint
+from sqlalchemy import Column, DateTime, String, ForeignKeyConstraint, JSON, Enum, Float, Integer, UUID, UniqueConstraint, select, func
 from sqlalchemy.orm import relationship, backref
 import uuid
 from datetime import datetime, timedelta
@@ -121,7 +121,7 @@ class Invoice(Base, PartitionedModel):
     extra_data = Column(
         JSON, 
         nullable=True, 
-        default={},
+        default=dict,
         comment="Additional invoice data stored as JSON"
     )
 
@@ -224,9 +224,13 @@ class Invoice(Base, PartitionedModel):
         if self.status in [PaymentStatus.CANCELLED, PaymentStatus.REFUNDED]:
             return
         
-        total_paid = sum(p.amount for p in await self.payments.filter_by(
-            status=PaymentStatus.COMPLETED
-        ).all())
+        from .InvoicePayments import InvoicePayment
+        total_paid = (await db.execute(
+            select(func.coalesce(func.sum(InvoicePayment.amount), 0)).where(
+                InvoicePayment.invoice_id == self.id,
+                InvoicePayment.status == PaymentStatus.COMPLETED
+            )
+        )).scalar_one()
         
         if total_paid >= self.total_amount:
             self.status = PaymentStatus.PAID
@@ -41,7 +41,7 @@ class ShopProductMetricsHourly(Base, PartitionedModel):
     cart_additions_count = Column(Integer, nullable=False, default=0)
     cart_removals_count = Column(Integer, nullable=False, default=0)
     page_views = Column(Integer, nullable=False, default=0)
-    extra_metrics = Column(JSON, nullable=True, default={})
+    extra_metrics = Column(JSON, nullable=True, default=dict)
 
     # Partition key for time-based partitioning
     partition_key = Column(
@@ -102,7 +102,7 @@ class ShopProductMetricsDaily(Base, PartitionedModel):
     cart_additions_count = Column(Integer, nullable=False, default=0)
     cart_removals_count = Column(Integer, nullable=False, default=0)
     page_views = Column(Integer, nullable=False, default=0)
-    extra_metrics = Column(JSON, nullable=True, default={})
+    extra_metrics = Column(JSON, nullable=True, default=dict)
 
     # Partition key for time-based partitioning
     partition_key = Column(
@@ -129,7 +129,7 @@ class Shop(Base, PartitionedModel):
     extra_data = Column(
         JSON, 
         nullable=True, 
-        default={},
+        default=dict,
         comment="Additional shop data stored as JSON"
     )
 
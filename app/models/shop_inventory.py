@@ -144,7 +144,7 @@ class ShopInventoryLog(Base, PartitionedModel):
     extra_data = Column(
         JSON, 
         nullable=True, 
-        default={},
+        default=dict,
         comment="Additional inventory data stored as JSON"
     )
 
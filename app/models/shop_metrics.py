@@ -42,7 +42,7 @@ class ShopMetricsHourly(Base, PartitionedModel):
     
     # Additional Metrics
     inventory_value = Column(Float, nullable=False, default=0.0)
-    extra_metrics = Column(JSON, nullable=True, default={})
+    extra_metrics = Column(JSON, nullable=True, default=dict)
 
     # Partition key for time-based partitioning
     partition_key = Column(
@@ -104,7 +104,7 @@ class ShopMetricsDaily(Base, PartitionedModel):
     
     # Additional Metrics
     inventory_value = Column(Float, nullable=False, default=0.0)
-    extra_metrics = Column(JSON, nullable=True, default={})
+    extra_metrics = Column(JSON, nullable=True, default=dict)
 
     # Partition key for time-based partitioning
     partition_key = Column(
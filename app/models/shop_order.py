@@ -196,7 +196,7 @@ class ShopOrder(Base, PartitionedModel):
     extra_data = Column(
         JSON, 
         nullable=True, 
-        default={},
+        default=dict,
         comment="Additional order data stored as JSON"
     )
 
@@ -498,7 +498,7 @@ class ShopOrderItem(Base, PartitionedModel):
     extra_data = Column(
         JSON, 
         nullable=True, 
-        default={},
+        default=dict,
         comment="Additional item data stored as JSON"
     )
 
@@ -158,13 +158,13 @@ class ShopProduct(Base, PartitionedModel):
     tags = Column(
         JSON, 
         nullable=True, 
-        default=[],
+        default=list,
         comment="Array of searchable tags"
     )
     extra_data = Column(
         JSON, 
         nullable=True, 
-        default={},
+        default=dict,
         comment="Additional product data stored as JSON"
     )
 
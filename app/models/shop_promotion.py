@@ -191,7 +191,7 @@ class ShopPromotion(Base, PartitionedModel):
     extra_data = Column(
         JSON, 
         nullable=True, 
-        default={},
+        default=dict,
         comment="Additional promotion data stored as JSON"
     )
 
@@ -390,7 +390,7 @@ class ShopPromotionUsage(Base, PartitionedModel):
     extra_data = Column(
         JSON, 
         nullable=True, 
-        default={},
+        default=dict,
         comment="Additional usage data stored as JSON"
     )
 
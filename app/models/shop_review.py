@@ -143,7 +143,7 @@ class ShopReview(Base, PartitionedModel):
     extra_data = Column(
         JSON, 
         nullable=True, 
-        default={},
+        default=dict,
         comment="Additional review data stored as JSON"
     )
 
@@ -327,7 +327,7 @@ class ShopReviewVote(Base, PartitionedModel):
     extra_data = Column(
         JSON, 
         nullable=True, 
-        default={},
+        default=dict,
         comment="Additional vote data stored as JSON"
     )
 
@@ -1,9 +1,15 @@
-from .base import Base, PartitionedModel
-from sqlalchemy import Column, DateTime, String, Boolean, JSON, UUID, Index, UniqueConstraint
+from .base import Base, PartitionedModel, uuid7
+from sqlalchemy import Column, DateTime, String, Boolean, UUID, Index, UniqueConstraint, select
 from sqlalchemy.orm import relationship, backref
-import uuid
+from sqlalchemy.dialects.postgresql import JSONB, TIMESTAMP
 from datetime import datetime
 from .user_metrics import UserMetricsDaily, UserMetricsHourly
+from .shop import Shop
+from .shop_order import ShopOrder
+from .shop_review import ShopReview
+from .shop_promotion import ShopPromotionUsage
+from .UserPaymentMethod import UserPaymentMethod
+from .enums import PaymentMethodStatus
 
 class User(Base, PartitionedModel):
     """
@@ -14,10 +20,9 @@ class User(Base, PartitionedModel):
     - Composite primary key (id, partition_key) for partitioning support
     - username is indexed for unique constraint and frequent lookups
     - email is indexed for frequent lookups and authentication
-    - status is indexed for filtering active/inactive users
-    - created_time is indexed for time-based queries
-    - event_time is indexed for partitioning
-    - Composite indexes for common query patterns
+    - deactivated_time is indexed for deactivation lookups
+    - status, created_time, last_login_time and event_time are only indexed through
+      the composite indexes below, which cover the common query patterns
     
     Partitioning Strategy:
     - Hourly partitioning based on event_time for efficient querying of recent data
@@ -32,7 +37,7 @@ class User(Base, PartitionedModel):
     id = Column(
         UUID(as_uuid=True), 
         primary_key=True, 
-        default=uuid.uuid4,
+        default=uuid7,
         comment="Unique identifier for the user"
     )
     username = Column(
@@ -56,7 +61,6 @@ class User(Base, PartitionedModel):
         Boolean, 
         nullable=False, 
         default=True,
-        index=True,
         comment="User account status (true=active, false=inactive)"
     )
     
@@ -65,7 +69,6 @@ class User(Base, PartitionedModel):
         DateTime(timezone=True), 
         nullable=False, 
         default=datetime.utcnow,
-        index=True,
         comment="When the user account was created"
     )
     deactivated_time = Column(
@@ -77,104 +80,88 @@ class User(Base, PartitionedModel):
     last_login_time = Column(
         DateTime(timezone=True), 
         nullable=True,
-        index=True,
         comment="Last time the user logged in"
     )
     event_time = Column(
-        DateTime(timezone=True), 
+        TIMESTAMP(timezone=True, precision=0), 
         nullable=False, 
         default=datetime.utcnow,
-        index=True,
         comment="Timestamp used for partitioning"
     )
     
     # Additional Data
     extra_data = Column(
-        JSON, 
+        JSONB, 
         nullable=True, 
-        default={},
-        comment="Additional user data stored as JSON"
+        default=dict,
+        comment="Additional user data stored as JSONB"
     )
 
     # Relationships
+    # The child-side backrefs are raise_on_sql: listing children never joins users implicitly.
+    # Use selectinload()/joinedload() on the backref when the user is actually needed.
+    # payment_methods comes from the UserPaymentMethod.user backref.
     # Shops owned by this user
     owned_shops = relationship(
         "Shop",
-        backref=backref("owner", lazy="joined"),
-        foreign_keys="Shop.user_owner_id",
-        lazy="dynamic"
+        backref=backref("owner", lazy="raise_on_sql"),
+        foreign_keys="Shop.owner_id"
     )
     
     # Orders placed by this user
     orders_placed = relationship(
         "ShopOrder",
-        backref=backref("customer", lazy="joined"),
-        foreign_keys="ShopOrder.user_id",
-        lazy="dynamic"
-    )
-    
-    # Payment methods saved by this user
-    payment_methods = relationship(
-        "UserPaymentMethod",
-        backref=backref("user", lazy="joined"),
-        foreign_keys="UserPaymentMethod.user_id",
-        lazy="dynamic"
+        backref=backref("customer", lazy="raise_on_sql"),
+        foreign_keys="ShopOrder.user_id"
     )
     
     # Reviews written by this user
     reviews_written = relationship(
         "ShopReview",
-        backref=backref("reviewer", lazy="joined"),
-        foreign_keys="ShopReview.user_id",
-        lazy="dynamic"
+        backref=backref("reviewer", lazy="raise_on_sql"),
+        foreign_keys="ShopReview.user_id"
     )
     
     # Invoices associated with this user
     invoices = relationship(
         "Invoice",
-        backref=backref("user", lazy="joined"),
-        foreign_keys="Invoice.user_id",
-        lazy="dynamic"
+        backref=backref("user", lazy="raise_on_sql"),
+        foreign_keys="Invoice.user_id"
     )
     
     # Promotions used by this user
     promotion_usages = relationship(
         "ShopPromotionUsage",
-        backref=backref("user", lazy="joined"),
-        foreign_keys="ShopPromotionUsage.user_id",
-        lazy="dynamic"
+        backref=backref("user", lazy="raise_on_sql"),
+        foreign_keys="ShopPromotionUsage.user_id"
     )
     
     # Votes cast by this user on reviews
     review_votes = relationship(
         "ShopReviewVote",
-        backref=backref("voter", lazy="joined"),
-        foreign_keys="ShopReviewVote.user_id",
-        lazy="dynamic"
+        backref=backref("voter", lazy="raise_on_sql"),
+        foreign_keys="ShopReviewVote.user_id"
     )
     
     # Hourly metrics for this user
     hourly_metrics = relationship(
         "UserMetricsHourly",
-        backref=backref("user", lazy="joined"),
-        foreign_keys="UserMetricsHourly.user_id",
-        lazy="dynamic"
+        backref=backref("user", lazy="raise_on_sql"),
+        foreign_keys="UserMetricsHourly.user_id"
     )
     
     # Daily metrics for this user
     daily_metrics = relationship(
         "UserMetricsDaily",
-        backref=backref("user", lazy="joined"),
-        foreign_keys="UserMetricsDaily.user_id",
-        lazy="dynamic"
+        backref=backref("user", lazy="raise_on_sql"),
+        foreign_keys="UserMetricsDaily.user_id"
     )
     
     # Events associated with this user
     events = relationship(
         "GlobalEvent",
-        backref=backref("user", lazy="joined"),
-        foreign_keys="GlobalEvent.user_id",
-        lazy="dynamic"
+        backref=backref("user", lazy="raise_on_sql"),
+        foreign_keys="GlobalEvent.user_id"
     )
 
     # Indexes and Constraints
@@ -183,6 +170,10 @@ class User(Base, PartitionedModel):
         UniqueConstraint('username', 'partition_key', name='uq_users_username'),
         UniqueConstraint('id', 'partition_key', name='uq_users_id'),
         
+        # These composites are the only indexes on status/created_time/last_login_time/event_time.
+        # Every hourly partition maintains its own copy of each index, so single-column
+        # duplicates of their leading columns would only add a btree insert per row.
+        
         # Composite index for status and created_time for filtering active users by creation date
         Index('ix_users_status_created_time', 'status', 'created_time'),
         
@@ -200,82 +191,80 @@ class User(Base, PartitionedModel):
         }
     )
 
+    # The create helpers below are plain functions that hand back create_with_partition's
+    # coroutine, so callers still await them but no wrapper coroutine is allocated per call
+    def _create_child(self, db, model, owner_field='user_id', **data):
+        """Create a row of `model` owned by this user through `owner_field`; the caller awaits the result"""
+        data[owner_field] = self.id
+        return model.create_with_partition(db, **data)
+
     # Helper Methods for Shop Operations
-    async def create_shop(self, db, **shop_data):
+    def create_shop(self, db, **shop_data):
         """Create a new shop owned by this user"""
-        from .shop import Shop
-        shop = await Shop.create_with_partition(db, user_owner_id=self.id, **shop_data)
-        return shop
+        return self._create_child(db, Shop, 'owner_id', **shop_data)
 
     async def get_owned_shops(self, db, active_only=True):
         """Get shops owned by this user"""
-        query = self.owned_shops
+        query = select(Shop).where(Shop.owner_id == self.id, Shop.partition_key == self.partition_key)
         if active_only:
-            query = query.filter_by(status=True)
-        return await query.all()
+            query = query.where(Shop.status == True)
+        return (await db.scalars(query)).all()
 
     # Helper Methods for Order Operations
-    async def place_order(self, db, shop_id, **order_data):
+    def place_order(self, db, shop_id, **order_data):
         """Place a new order at a shop"""
-        from .shop_order import ShopOrder
-        order = await ShopOrder.create_with_partition(
-            db, user_id=self.id, shop_id=shop_id, **order_data
-        )
-        return order
+        return self._create_child(db, ShopOrder, shop_id=shop_id, **order_data)
 
     async def get_orders(self, db, status=None):
         """Get orders placed by this user"""
-        query = self.orders_placed
+        query = select(ShopOrder).where(ShopOrder.user_id == self.id, ShopOrder.partition_key == self.partition_key)
         if status:
-            query = query.filter_by(status=status)
-        return await query.all()
+            query = query.where(ShopOrder.status == status)
+        return (await db.scalars(query)).all()
 
     # Helper Methods for Payment Operations
-    async def add_payment_method(self, db, **payment_method_data):
+    def add_payment_method(self, db, **payment_method_data):
         """Add a new payment method"""
-        from .payment_method import UserPaymentMethod
-        payment_method = await UserPaymentMethod.create_with_partition(
-            db, user_id=self.id, **payment_method_data
-        )
-        return payment_method
+        return self._create_child(db, UserPaymentMethod, **payment_method_data)
 
     async def get_payment_methods(self, db, active_only=True):
         """Get user's payment methods"""
-        query = self.payment_methods
+        query = select(UserPaymentMethod).where(
+            UserPaymentMethod.user_id == self.id,
+            UserPaymentMethod.partition_key == self.partition_key
+        )
         if active_only:
-            query = query.filter_by(status='ACTIVE')
-        return await query.all()
+            query = query.where(UserPaymentMethod.status == PaymentMethodStatus.ACTIVE)
+        return (await db.scalars(query)).all()
 
     # Helper Methods for Review Operations
-    async def write_review(self, db, shop_id, **review_data):
+    def write_review(self, db, shop_id, **review_data):
         """Write a review for a shop or product"""
-        from .shop_review import ShopReview
-        review = await ShopReview.create_with_partition(
-            db, user_id=self.id, shop_id=shop_id, **review_data
-        )
-        return review
+        return self._create_child(db, ShopReview, shop_id=shop_id, **review_data)
 
     async def get_reviews(self, db):
         """Get reviews written by this user"""
-        return await self.reviews_written.all()
+        return (await db.scalars(
+            select(ShopReview).where(ShopReview.user_id == self.id, ShopReview.partition_key == self.partition_key)
+        )).all()
 
     # Helper Methods for Promotion Operations
-    async def use_promotion(self, db, promotion_id, order_id, **usage_data):
+    def use_promotion(self, db, promotion_id, order_id, **usage_data):
         """Use a promotion on an order"""
-        from .shop_promotion import ShopPromotionUsage
-        usage = await ShopPromotionUsage.create_with_partition(
-            db, user_id=self.id, promotion_id=promotion_id, 
-            order_id=order_id, **usage_data
+        return self._create_child(
+            db, ShopPromotionUsage, promotion_id=promotion_id, order_id=order_id, **usage_data
         )
-        return usage
 
     # Helper Methods for Metrics
     async def get_metrics(self, db, timeframe='daily', start_time=None, end_time=None):
         """Get user metrics for a specific timeframe"""
         MetricsModel = UserMetricsDaily if timeframe == 'daily' else UserMetricsHourly
-        query = self.daily_metrics if timeframe == 'daily' else self.hourly_metrics
+        query = select(MetricsModel).where(
+            MetricsModel.user_id == self.id,
+            MetricsModel.partition_key == self.partition_key
+        )
         if start_time:
-            query = query.filter(MetricsModel.event_time >= start_time)
+            query = query.where(MetricsModel.event_time >= start_time)
         if end_time:
-            query = query.filter(MetricsModel.event_time <= end_time)
-        return await query.all()
\ No newline at end of file
+            query = query.where(MetricsModel.event_time <= end_time)
+        return (await db.scalars(query)).all()
\ No newline at end of file
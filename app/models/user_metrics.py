@@ -36,7 +36,7 @@ class UserMetricsHourly(Base, PartitionedModel):
     # Additional Metrics
     cart_abandonment_count = Column(Integer, nullable=False, default=0)
     total_items_purchased = Column(Integer, nullable=False, default=0)
-    extra_metrics = Column(JSON, nullable=True, default={})
+    extra_metrics = Column(JSON, nullable=True, default=dict)
 
     __table_args__ = (
         ForeignKeyConstraint(
@@ -84,7 +84,7 @@ class UserMetricsDaily(Base, PartitionedModel):
     # Additional Metrics
     cart_abandonment_count = Column(Integer, nullable=False, default=0)
     total_items_purchased = Column(Integer, nullable=False, default=0)
-    extra_metrics = Column(JSON, nullable=True, default={})
+    extra_metrics = Column(JSON, nullable=True, default=dict)
 
     __table_args__ = (
         ForeignKeyConstraint(
@@ -2,7 +2,7 @@ from datetime import datetime, timedelta
 from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import text
-from ..database import get_db
+from ..database import get_async_db
 import logging
 from app.utils.helpers import post_request, BASE_URL
 import httpx
@@ -40,7 +40,7 @@ async def create_rollups(
     background_tasks: BackgroundTasks, 
     start_date: datetime = None, 
     end_date: datetime = None, 
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     try:
         dates = []
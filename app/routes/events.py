@@ -2,6 +2,8 @@ from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 from .. import models, schemas, database
+from ..models.enums import to_event_type
+from ..models.global_event import EVENT_BY_ID, EVENT_ROWS_PAGE
 from datetime import datetime, timedelta
 from typing import List
 import uuid
@@ -21,7 +23,7 @@ def create_event(event: schemas.GlobalEventCreate, db: Session = Depends(get_db)
     event_time = datetime.utcnow()
     new_event = models.GlobalEvent(
         event_time=event_time,
-        event_type=event.event_type,
+        event_type=to_event_type(event.event_type),
         event_metadata=event.event_metadata,
         partition_key=models.GlobalEvent.generate_partition_key(event_time)
     )
@@ -37,34 +39,19 @@ def create_event(event: schemas.GlobalEventCreate, db: Session = Depends(get_db)
     db.commit()
     db.refresh(new_event)
     
-    return schemas.GlobalEventResponse(
-        event_id=new_event.event_id,
-        event_time=new_event.event_time,
-        event_type=new_event.event_type,
-        event_metadata=new_event.event_metadata
-    )
+    return schemas.GlobalEventResponse.model_validate(new_event)
 
 @router.get("/events/{event_id}", response_model=schemas.GlobalEventResponse)
 def read_event(event_id: uuid.UUID, db: Session = Depends(get_db)):
-    event = db.query(models.GlobalEvent).filter(models.GlobalEvent.event_id == event_id).first()
+    event = db.scalars(EVENT_BY_ID, {'event_id': event_id}).first()
     if event is None:
         raise HTTPException(status_code=404, detail="Event not found")
-    return schemas.GlobalEventResponse(
-        event_id=event.event_id,
-        event_time=event.event_time,
-        event_type=event.event_type,
-        event_metadata=event.event_metadata
-    )
+    return schemas.GlobalEventResponse.model_validate(event)
 
 @router.get("/events/", response_model=List[schemas.GlobalEventResponse])
 def read_events(skip: int = 0, limit: int = 10, db: Session = Depends(get_db)):
-    events = db.query(models.GlobalEvent).offset(skip).limit(limit).all()
-    return [schemas.GlobalEventResponse(
-        event_id=event.event_id,
-        event_time=event.event_time,
-        event_type=event.event_type,
-        event_metadata=event.event_metadata
-    ) for event in events]
+    rows = db.execute(EVENT_ROWS_PAGE, {'skip': skip, 'limit': limit})
+    return schemas.GlobalEventResponse.from_rows(rows)
 
 # Add a function to create partitions for the next 24 hours
 def create_partitions(db: Session):
@@ -3,7 +3,7 @@ from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import text
 from sqlalchemy.exc import ProgrammingError
-from ..database import get_db
+from ..database import get_async_db
 import logging
 from tenacity import retry, stop_after_attempt, wait_exponential
 
@@ -25,7 +25,7 @@ def generate_partition_name(tablename, partition_key):
 
 @router.post("/fake_user_snapshot", response_model=FakeUserSnapshotResponse)
 async def fake_user_snapshot(
-    snapshot: FakeUserSnapshot, db: AsyncSession = Depends(get_db)
+    snapshot: FakeUserSnapshot, db: AsyncSession = Depends(get_async_db)
 ):
     logger.info("Starting fake user snapshot generation")
     
@@ -2,7 +2,7 @@ from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 from ..models import GlobalEvent, EventType
 from ..schemas import FakeUserCreate, FakeUserDeactivate, GlobalEventResponse
-from ..database import get_db, parse_event_time
+from ..database import get_async_db, parse_event_time
 from ..utils.fake_user_helpers import create_fake_user_metadata, get_fake_user_by_identifier
 import uuid
 import logging
@@ -17,7 +17,7 @@ handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s -
 logger.addHandler(handler)
 
 @router.post("/create_fake_user/", response_model=GlobalEventResponse)
-async def create_fake_user(fake_user: FakeUserCreate, db: AsyncSession = Depends(get_db)):
+async def create_fake_user(fake_user: FakeUserCreate, db: AsyncSession = Depends(get_async_db)):
     try:
         event_metadata = create_fake_user_metadata(str(uuid.uuid4()), fake_user.email)
 
@@ -28,7 +28,7 @@ async def create_fake_user(fake_user: FakeUserCreate, db: AsyncSession = Depends
             event_metadata=event_metadata
         )
 
-        return GlobalEventResponse.from_orm(new_event)
+        return GlobalEventResponse.model_validate(new_event)
 
     except Exception as e:
         logger.error(f"Failed to create fake user: {e}")
@@ -36,7 +36,7 @@ async def create_fake_user(fake_user: FakeUserCreate, db: AsyncSession = Depends
 
 
 @router.post("/deactivate_fake_user/", response_model=GlobalEventResponse)
-async def deactivate_fake_user(fake_user: FakeUserDeactivate, db: AsyncSession = Depends(get_db)):
+async def deactivate_fake_user(fake_user: FakeUserDeactivate, db: AsyncSession = Depends(get_async_db)):
     try:
         # Determine if the identifier is an email or fake_user_id and create event metadata accordingly
         if '@' in fake_user.identifier:
@@ -55,7 +55,7 @@ async def deactivate_fake_user(fake_user: FakeUserDeactivate, db: AsyncSession =
             event_metadata=event_metadata
         )
 
-        return GlobalEventResponse.from_orm(new_event)
+        return GlobalEventResponse.model_validate(new_event)
 
     except Exception as e:
         logger.error(f"Failed to deactivate fake user: {e}")
@@ -77,7 +77,7 @@ async def deactivate_fake_user(fake_user: FakeUserDeactivate, db: AsyncSession =
 #         event_metadata=event_metadata
 #     )
 #
-#     return GlobalEventResponse.from_orm(new_event)
+#     return GlobalEventResponse.model_validate(new_event)
 
 # @router.get("/fake_user/{fake_user_id}", response_model=GlobalEventResponse)
 # def get_fake_user(fake_user_id: uuid.UUID, db: Session = Depends(get_db)):
@@ -1,12 +1,15 @@
 from datetime import datetime, timedelta
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
 import logging
 from ..utils.fake_data.new_fake_data_generator_models import (
     BaseDataStore,
     ActionCounter,
 )
 import pytz
-from ..models import OddsMaker
+from .. import models
+from ..models import OddsMaker, PartitionedModel
+from ..database import get_async_db
 from pydantic import BaseModel, Field
 import random
 
@@ -84,8 +87,19 @@ class FakeDataGenerator(BaseModel):
         }
 
 
+def range_partitioned_models():
+    """Every RANGE-partitioned model (on partition_key or event_time), i.e. the ones ensure_partition can create"""
+    return [
+        model for model in (getattr(models, name) for name in models.PUBLIC)
+        if issubclass(model, PartitionedModel)
+        and (model.__table__.dialect_options["postgresql"]["partition_by"] or "").startswith("RANGE")
+    ]
+
+
 @router.post("/generate_fake_data")
-async def trigger_fake_data_generation(fdg: FakeDataGenerator) -> ActionCounter:
+async def trigger_fake_data_generation(
+    fdg: FakeDataGenerator, db: AsyncSession = Depends(get_async_db)
+) -> ActionCounter:
     """
     
     
@@ -117,6 +131,9 @@ async def trigger_fake_data_generation(fdg: FakeDataGenerator) -> ActionCounter:
     )
 
     try:
+        # Create the whole horizon's partitions once so inserts never wait on DDL
+        for model in range_partitioned_models():
+            await model.pre_create_partitions(db, fdg.start_date, fdg.end_date)
 
         base = BaseDataStore()
 
@@ -52,9 +52,6 @@ def invoice_payment(payment: schemas.PaymentCreate, db: Session = Depends(get_db
     partition_name = f"payments_{event_time.date().strftime('%Y_%m_%d')}"
     database.create_partition_if_not_exists(db, partition_name, event_time.date())
     
-    db.commit()
-    db.refresh(new_payment)
-    
     # Prepare the response
     event_metadata = {
         "payment_id": payment_id,
@@ -69,12 +66,9 @@ def invoice_payment(payment: schemas.PaymentCreate, db: Session = Depends(get_db
         partition_key=models.GlobalEvent.generate_partition_key(event_time)
     )
     db.add(new_event)
+
+    # Payment and event go out in one flush and one commit
     db.commit()
     db.refresh(new_event)
 
-    return schemas.GlobalEventResponse(
-        event_id=new_event.event_id,
-        event_time=new_event.event_time,
-        event_type=new_event.event_type,
-        event_metadata=new_event.event_metadata
-    )
+    return schemas.GlobalEventResponse.model_validate(new_event)
@@ -32,7 +32,7 @@ async def create_shop(shop: schemas.ShopCreate, db: Session = Depends(database.g
             event_metadata=event_metadata
         )
 
-        return schemas.GlobalEventResponse.from_orm(new_event)
+        return schemas.GlobalEventResponse.model_validate(new_event)
 
     except Exception as e:
         logger.error(f"Failed to create shop: {e}")
@@ -53,7 +53,7 @@ async def delete_shop(shop: schemas.ShopDelete, db: Session = Depends(database.g
             event_metadata=event_metadata
         )
 
-        return schemas.GlobalEventResponse.from_orm(new_event)
+        return schemas.GlobalEventResponse.model_validate(new_event)
 
     except Exception as e:
         logger.error(f"Failed to delete shop: {e}")
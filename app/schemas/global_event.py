@@ -1,25 +1,54 @@
 # app/schemas/global_event.py
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from datetime import datetime
 from typing import Dict
 import uuid
+from app.models.enums import EventType
+
+# Enum member -> wire string, built once; the validator below runs for every row of a page
+_EVENT_TYPE_VALUES = {member: member.value for member in EventType}
 
 class GlobalEventResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
     event_id: str = Field(..., description="UUID of the event")
     event_time: datetime
     event_type: str
     event_metadata: Dict
 
-    class Config:
-        from_attributes = True
+    @field_validator("event_id", mode="before")
+    @classmethod
+    def _event_id_to_str(cls, value):
+        return str(value) if isinstance(value, uuid.UUID) else value
 
+    @field_validator("event_type", mode="before")
     @classmethod
-    def from_orm(cls, obj):
-        # Convert UUID to string if necessary
-        if isinstance(obj.event_id, uuid.UUID):
-            obj.event_id = str(obj.event_id)
-        return super().from_orm(obj)
+    def _event_type_to_value(cls, value):
+        return _EVENT_TYPE_VALUES.get(value, value)
+
+    @field_validator("event_metadata", mode="before")
+    @classmethod
+    def _event_metadata_default(cls, value):
+        # NULL metadata reads as {}, same as from_rows
+        return {} if value is None else value
+
+    @classmethod
+    def from_rows(cls, rows):
+        """
+        Responses for (event_id, event_time, event_type, event_metadata) rows read
+        from global_events. model_construct skips validation: the values come
+        straight from typed columns, so only the id and enum need converting.
+        """
+        return [
+            cls.model_construct(
+                event_id=str(row.event_id),
+                event_time=row.event_time,
+                event_type=_EVENT_TYPE_VALUES.get(row.event_type, row.event_type),
+                event_metadata=row.event_metadata or {}
+            )
+            for row in rows
+        ]
 
 class GlobalEventCreate(BaseModel):
     event_type: str
@@ -27,4 +56,3 @@ class GlobalEventCreate(BaseModel):
 
     class Config:
         from_attributes = True
-
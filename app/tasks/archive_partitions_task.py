@@ -0,0 +1,24 @@
+import logging
+import os
+from datetime import datetime, timedelta
+from ..database import SchedulerSessionLocal
+from ..utils.event_archive import archive_partitions_before
+
+logger = logging.getLogger(__name__)
+
+# global_events hours older than this move to Parquet (7 days by default)
+GLOBAL_EVENTS_ARCHIVE_AFTER_HOURS = int(os.getenv("GLOBAL_EVENTS_ARCHIVE_AFTER_HOURS", 168))
+
+# Work through any backlog a day of partitions per run
+MAX_PARTITIONS_PER_RUN = 24
+
+async def archive_partitions_task():
+    """Archive cold global_events partitions to Parquet and drop them from Postgres"""
+    try:
+        cutoff = datetime.utcnow() - timedelta(hours=GLOBAL_EVENTS_ARCHIVE_AFTER_HOURS)
+        async with SchedulerSessionLocal() as db:
+            archived = await archive_partitions_before(db, cutoff, max_partitions=MAX_PARTITIONS_PER_RUN)
+        if archived:
+            logger.info(f"Archived {len(archived)} global_events partitions older than {cutoff}")
+    except Exception as e:
+        logger.error(f"Error archiving global_events partitions: {str(e)}")
@@ -0,0 +1,62 @@
+import logging
+from datetime import datetime
+from sqlalchemy import text
+from ..database import SchedulerSessionLocal
+from ..models.global_entity import GlobalEntity
+from ..models.global_event import GlobalEvent
+
+logger = logging.getLogger(__name__)
+
+# (model, parent index to order each partition's heap by)
+CLUSTER_TARGETS = [
+    (GlobalEntity, 'idx_global_entity_time_id'),
+    (GlobalEvent, 'ix_data_playground_global_events_event_time'),
+]
+
+# CLUSTER holds an ACCESS EXCLUSIVE lock on the partition, so work through any
+# backlog a few partitions per run
+MAX_PARTITIONS_PER_RUN = 24
+
+# Partitions older than the current hour whose copy of the parent index hasn't been
+# clustered on yet. Partition names sort by hour, so a string compare finds the cold ones.
+# Hash sub-partitioned hours are skipped: their tails are already split, and a
+# partitioned index can't be marked clustered, so they'd be picked up on every run
+_UNCLUSTERED_PARTITIONS = text("""
+    SELECT part.relname AS partition_name, idx.relname AS index_name
+    FROM pg_inherits pi
+    JOIN pg_class part ON part.oid = pi.inhrelid
+    JOIN pg_index x ON x.indrelid = part.oid
+    JOIN pg_class idx ON idx.oid = x.indexrelid
+    JOIN pg_inherits ii ON ii.inhrelid = idx.oid
+    WHERE pi.inhparent = to_regclass(:parent_table)
+      AND ii.inhparent = to_regclass(:parent_index)
+      AND part.relkind = 'r'
+      AND NOT x.indisclustered
+      AND part.relname < :current_partition
+    ORDER BY part.relname
+    LIMIT :max_partitions
+""")
+
+async def cluster_partition(db, partition_name, index_name):
+    """Rewrite one partition's heap in index order; rows of a time range end up on adjacent pages"""
+    await db.execute(text(f'CLUSTER data_playground."{partition_name}" USING "{index_name}"'))
+    await db.commit()
+
+async def cluster_partitions_task():
+    """CLUSTER cold hourly partitions of global_entities and global_events by event_time"""
+    for model, index_name in CLUSTER_TARGETS:
+        try:
+            async with SchedulerSessionLocal() as db:
+                _, current_partition, _, _ = model._compute_partition(datetime.utcnow())
+                rows = (await db.execute(_UNCLUSTERED_PARTITIONS, {
+                    'parent_table': f'data_playground.{model.__tablename__}',
+                    'parent_index': f'data_playground.{index_name}',
+                    'current_partition': current_partition,
+                    'max_partitions': MAX_PARTITIONS_PER_RUN,
+                })).all()
+                for partition_name, partition_index in rows:
+                    await cluster_partition(db, partition_name, partition_index)
+            if rows:
+                logger.info(f"Clustered {len(rows)} {model.__tablename__} partitions on {index_name}")
+        except Exception as e:
+            logger.error(f"Error clustering {model.__tablename__} partitions: {str(e)}")
@@ -0,0 +1,14 @@
+import logging
+from ..database import SchedulerSessionLocal
+from ..models.global_event import GlobalEvent
+
+logger = logging.getLogger(__name__)
+
+async def refresh_event_rollup_task():
+    """Refresh the hourly event-count rollup that the dashboards read"""
+    try:
+        async with SchedulerSessionLocal() as db:
+            await GlobalEvent.refresh_hourly_rollup(db)
+        logger.info("Refreshed global_events_hourly_rollup")
+    except Exception as e:
+        logger.error(f"Error refreshing global_events_hourly_rollup: {str(e)}")
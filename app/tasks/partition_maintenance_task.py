@@ -0,0 +1,37 @@
+import logging
+import os
+from datetime import datetime, timedelta
+from ..database import SchedulerSessionLocal
+from ..models.global_entity import GlobalEntity, EntityLifecycleEvent
+from ..models.global_event import GlobalEvent
+
+logger = logging.getLogger(__name__)
+
+# Hours of partitions kept ready ahead of the clock
+PARTITIONS_AHEAD = int(os.getenv("PARTITIONS_AHEAD", 24))
+
+# global_events partitions older than this are dropped (30 days by default)
+GLOBAL_EVENTS_RETENTION_HOURS = int(os.getenv("GLOBAL_EVENTS_RETENTION_HOURS", 720))
+
+# Tables whose upcoming partitions are created ahead of time
+PRECREATE_MODELS = [GlobalEvent, GlobalEntity, EntityLifecycleEvent]
+
+async def partition_maintenance_task():
+    """Precreate upcoming hourly partitions and drop global_events partitions past retention"""
+    for model in PRECREATE_MODELS:
+        try:
+            async with SchedulerSessionLocal() as db:
+                await model.ensure_partitions_ahead(db, ahead=PARTITIONS_AHEAD)
+        except Exception as e:
+            logger.error(f"Error precreating {model.__tablename__} partitions: {str(e)}")
+
+    # Only the append-only event log ages out; entities are a registry and users
+    # rows are referenced by global_events' foreign key
+    try:
+        cutoff = datetime.utcnow() - timedelta(hours=GLOBAL_EVENTS_RETENTION_HOURS)
+        async with SchedulerSessionLocal() as db:
+            dropped = await GlobalEvent.drop_partitions_before(db, cutoff)
+        if dropped:
+            logger.info(f"Dropped {len(dropped)} global_events partitions older than {cutoff}")
+    except Exception as e:
+        logger.error(f"Error dropping old global_events partitions: {str(e)}")
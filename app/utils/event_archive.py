@@ -0,0 +1,123 @@
+import glob
+import logging
+import os
+from datetime import datetime, timezone
+import duckdb
+import pyarrow as pa
+import pyarrow.parquet as pq
+from sqlalchemy import text
+from app.models.base import generate_partition_name, uuid7
+from app.models.enums import EventType
+from app.models.global_event import GlobalEvent, _ENTITY_ID_COLUMNS
+
+logger = logging.getLogger(__name__)
+
+# Cold global_events hours live here as Parquet, one file per archive run of an hour:
+# <ARCHIVE_DIR>/dt=YYYY-MM-DD/hr=HH/part-<uuid7>.parquet. An hour that's backfilled
+# and archived again gets a second file next to the first instead of replacing it
+ARCHIVE_DIR = os.getenv("GLOBAL_EVENTS_ARCHIVE_DIR", "/archive/global_events")
+ARCHIVE_GLOB = os.path.join(ARCHIVE_DIR, "dt=*", "hr=*", "*.parquet")
+
+# Rows per server-side fetch, and so per Parquet row group
+ARCHIVE_BATCH_ROWS = 50_000
+
+# UUIDs and JSON go in as text: it's what DuckDB filters and groups on cheaply,
+# and the wire format stays readable without the ORM
+_ARCHIVE_SCHEMA = pa.schema([
+    ('event_id', pa.string()),
+    ('event_time', pa.timestamp('us', tz='UTC')),
+    ('event_type', pa.string()),
+    ('event_metadata', pa.string()),
+    ('user_id', pa.string()),
+    ('caller_entity_id', pa.string()),
+    *[(column, pa.string()) for column in _ENTITY_ID_COLUMNS],
+    ('extra_data', pa.string()),
+])
+
+def partition_hour(partition_name):
+    """The hour an hourly global_events partition holds, from its name"""
+    suffix = partition_name[len(generate_partition_name(GlobalEvent.__tablename__, '')):]
+    return datetime.strptime(suffix, "%Y_%m_%dt%H_%M_%S")
+
+def archive_path(hour):
+    """A new, unique file name in the hour's directory"""
+    return os.path.join(ARCHIVE_DIR, f"dt={hour:%Y-%m-%d}", f"hr={hour:%H}", f"part-{uuid7()}.parquet")
+
+async def write_partition_parquet(db, partition_name, path):
+    """Stream one partition into a zstd Parquet file; written to a temp name and renamed into place"""
+    columns = ', '.join(
+        f'{field.name}::text' if field.name != 'event_time' else field.name for field in _ARCHIVE_SCHEMA
+    )
+    result = await db.stream(
+        text(f'SELECT {columns} FROM data_playground."{partition_name}"')
+        .execution_options(yield_per=ARCHIVE_BATCH_ROWS)
+    )
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with pq.ParquetWriter(tmp_path, _ARCHIVE_SCHEMA, compression='zstd') as writer:
+        async for rows in result.partitions():
+            writer.write_table(pa.Table.from_arrays(
+                [pa.array(values, type=field.type) for values, field in zip(zip(*rows), _ARCHIVE_SCHEMA)],
+                schema=_ARCHIVE_SCHEMA
+            ))
+    os.replace(tmp_path, path)
+
+async def archive_partitions_before(db, cutoff, max_partitions=None):
+    """
+    Move global_events hours older than cutoff to Parquet. Each partition is
+    locked, written out and dropped in one transaction: the ACCESS EXCLUSIVE
+    lock holds off late inserts into that hour until the DROP, so no row can
+    land between the read and the drop. If the transaction fails, its file is
+    removed again and the partition stays for the next run. Returns the
+    archived partition names.
+    """
+    names = (await GlobalEvent.partitions_before(db, cutoff))[:max_partitions]
+    for name in names:
+        path = archive_path(partition_hour(name))
+        try:
+            await db.execute(text(f'LOCK TABLE data_playground."{name}" IN ACCESS EXCLUSIVE MODE'))
+            await write_partition_parquet(db, name, path)
+            await GlobalEvent.drop_partitions(db, [name])
+        except BaseException:
+            await db.rollback()
+            if os.path.exists(path):
+                os.remove(path)
+            raise
+    return names
+
+def archived_event_stats(event_types=None, start_time=None, end_time=None):
+    """
+    GlobalEvent.get_event_stats over the Parquet archive, in DuckDB. Blocking;
+    callers on the event loop go through GlobalEvent.get_event_stats_archived.
+    """
+    counts, unique_users = {}, 0
+    if glob.glob(ARCHIVE_GLOB):
+        conditions, params = [], []
+        if event_types:
+            conditions.append(f"event_type IN ({', '.join('?' * len(event_types))})")
+            params.extend(EventType(event_type).name for event_type in event_types)
+        for bound, op in ((start_time, '>='), (end_time, '<=')):
+            if bound:
+                conditions.append(f"event_time {op} ?")
+                params.append(bound if bound.tzinfo else bound.replace(tzinfo=timezone.utc))
+        source = f"read_parquet('{ARCHIVE_GLOB.replace(chr(39), chr(39) * 2)}')"
+        where = ' AND '.join(conditions) or 'TRUE'
+
+        with duckdb.connect() as con:
+            counts = {
+                EventType[name]: n for name, n in con.execute(
+                    f"SELECT event_type, count(*) FROM {source} WHERE {where} GROUP BY event_type", params
+                ).fetchall()
+            }
+            unique_users = con.execute(
+                f"SELECT count(DISTINCT user_id) FROM {source} WHERE {where}", params
+            ).fetchone()[0]
+
+    return {
+        'total_events': sum(counts.values()),
+        'events_by_type': {
+            event_type: counts.get(event_type, 0)
+            for event_type in EventType
+        },
+        'unique_users': unique_users
+    }
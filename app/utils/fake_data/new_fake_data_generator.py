@@ -1,4 +1,5 @@
 import asyncio
+import uvloop
 from datetime import datetime, timedelta
 
 from app.utils.fake_data.new_fake_data_generator_models import BaseDataStore
@@ -26,6 +27,7 @@ async def old_main():  #TODO replace main with a daily that takes in a datastore
     await base.process_day(current_date)
 
 if __name__ == "__main__":
-
+    # Generation is I/O bound: stay on a single (uvloop) event loop rather than a process pool
+    uvloop.install()
     asyncio.run(main())
 
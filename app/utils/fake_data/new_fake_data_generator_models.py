@@ -1,6 +1,7 @@
 from datetime import datetime, timedelta
 import uuid
 from typing import List, Dict, Optional
+from dataclasses import dataclass, asdict
 from pydantic import BaseModel, Field
 import os
 import json
@@ -11,10 +12,14 @@ from .user import User, Shop
 from .user_actions import generate_users, generate_shops, deactivate_shops, deactivate_users
 from .call_rollups import call_user_snapshot_api, call_shop_snapshot_api
 import random
+import numpy as np
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# One record per active user for the vectorized metrics below
+ACTIVE_USER_DTYPE = np.dtype([('created_ts', 'datetime64[s]'), ('shop_count', np.int32)])
+
 def make_list_unique(input_list: list) -> list:
     """
     Remove duplicate items from a list based on their id attribute.
@@ -30,8 +35,9 @@ def make_list_unique(input_list: list) -> list:
             seen_ids.add(item.id)
     return unique_list
 
-class ActionCounter(BaseModel):
-    """Model to keep track of various action counts."""
+@dataclass(slots=True)
+class ActionCounter:
+    """Running action counts; a slotted dataclass since it's bumped on every batch."""
     users_created: int = 0
     users_deactivated: int = 0
     shops_created: int = 0
@@ -133,7 +139,7 @@ class BaseDataStore(BaseModel):
         if self.action_counter.active_shops != expected_active_shops:
             logger.warning(f"Mismatch in active shops count. Expected: {expected_active_shops}, Actual: {self.action_counter.active_shops}")
 
-        for attr, value in self.action_counter.__dict__.items():
+        for attr, value in asdict(self.action_counter).items():
             if value < 0:
                 logger.error(f"Negative value detected for {attr}: {value}")
 
@@ -154,7 +160,7 @@ class BaseDataStore(BaseModel):
     def _update_all_action_counter(self, current_date):
         """Update the all_action_counter with the current batch's data."""
         self.all_action_counter[current_date] = {
-            **self.action_counter.dict(),
+            **asdict(self.action_counter),
             'processing_time': self.batch.duration.total_seconds()
         }
 
@@ -165,26 +171,43 @@ class BaseDataStore(BaseModel):
             previous_counter = self.all_action_counter[previous_date]
             
             logger.info("Daily changes:")
-            for key in self.action_counter.__dict__.keys():
-                daily_change = self.action_counter.__dict__[key] - previous_counter[key]
+            for key, value in asdict(self.action_counter).items():
+                daily_change = value - previous_counter[key]
                 logger.info(f"  {key}: {daily_change}")
             
             time_change = self.all_action_counter[current_date]['processing_time'] - previous_counter['processing_time']
             logger.info(f"  processing_time change: {time_change:.2f} seconds")
 
+    def active_user_arrays(self) -> np.ndarray:
+        """
+        Column-wise (structure-of-arrays) snapshot of the active users, so metrics
+        are numpy reductions instead of per-object attribute loads.
+        """
+        users = list(self.active_users.values())
+        arrays = np.empty(len(users), dtype=ACTIVE_USER_DTYPE)
+        arrays['created_ts'] = [user.created_time.replace(tzinfo=None) for user in users]
+        arrays['shop_count'] = [len(user.shops) for user in users]
+        return arrays
+
     def _log_additional_metrics(self):
         """Log additional metrics about users and shops."""
-        active_user_list = list(self.active_users.values())
-        shops_per_user = [len(user.shops) for user in active_user_list]
-        avg_shops_per_user = sum(shops_per_user) / len(active_user_list) if active_user_list else 0
+        users = self.active_user_arrays()
+        if not len(users):
+            return
+        shops_per_user = users['shop_count']
+        distribution = np.bincount(shops_per_user)
 
-        logger.info(f" Average shops per active user: {avg_shops_per_user:.2f}")
+        logger.info(f" Average shops per active user: {shops_per_user.mean():.2f}")
         logger.info(f" Shop distribution:")
-        for i in range(max(shops_per_user) + 1):
-            count = shops_per_user.count(i)
-            percentage = (count / len(active_user_list)) * 100 if active_user_list else 0
+        for i, count in enumerate(distribution):
+            percentage = (count / len(users)) * 100
             logger.info(f"  Users with {i} shops: {count} ({percentage:.2f}%)")
 
+        # Users created per hour of day, bucketed in one pass
+        hours = users['created_ts'].astype('datetime64[h]').astype(np.int64) % 24
+        for hour, count in enumerate(np.bincount(hours, minlength=24)):
+            logger.debug(f"  Users created in hour {hour:02d}: {count}")
+
     def create_batch(self):
         """Create a new batch and reset batch counters."""
         self.batch = Batch()
@@ -422,7 +445,7 @@ class BaseDataStore(BaseModel):
             state = {
                 "active_users": {str(k): v.dict() for k, v in self.active_users.items()},
                 "active_shops": {str(k): v.dict() for k, v in self.active_shops.items()},
-                "action_counter": self.action_counter.dict(),
+                "action_counter": asdict(self.action_counter),
                 "all_action_counter": {str(k): v for k, v in self.all_action_counter.items()},
                 "all_batch": {str(k): v.dict() for k, v in self.all_batch.items()}
             }
@@ -3,6 +3,7 @@ from sqlalchemy.orm import sessionmaker
 from sqlalchemy.exc import ProgrammingError, OperationalError
 from datetime import datetime, timedelta
 import logging
+from app.models.base import generate_partition_name
 
 # Set up the logger
 logger = logging.getLogger("partition_logger")
@@ -17,20 +18,20 @@ engine = create_engine(
     max_overflow=20,
     pool_timeout=30,
     pool_recycle=1800,
+    # The bounds below carry no offset; read them as UTC (see SESSION_TIMEZONE in app/database.py)
+    connect_args={'options': '-c timezone=UTC'},
 )
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
-def generate_partition_name(tablename, partition_key):
-    return f"{tablename}_p_{partition_key.replace('-', '_').replace(':', '_')}"
-
 def create_partition(session, tablename, partition_key, partition_type="hourly"):
     partition_name = generate_partition_name(tablename, partition_key)
     try:
         if partition_type == "hourly":
+            next_partition = (datetime.fromisoformat(partition_key) + timedelta(hours=1)).strftime("%Y-%m-%dT%H:00:00")
             session.execute(text(f"""
                 CREATE TABLE IF NOT EXISTS {partition_name} PARTITION OF {tablename}
-                FOR VALUES IN ('{partition_key}')
+                FOR VALUES FROM ('{partition_key}') TO ('{next_partition}')
             """))
         elif partition_type == "daily":
             next_partition = (datetime.fromisoformat(partition_key) + timedelta(days=1)).strftime("%Y-%m-%d")
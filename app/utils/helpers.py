@@ -1,4 +1,5 @@
 import asyncio
+import contextlib
 import httpx
 from datetime import datetime, timedelta
 import random
@@ -64,10 +65,8 @@ async def process_tasks(client, tasks):
         raise
 
 async def post_request(client, url, payload, error_message, semaphore=None):
-    if semaphore is None:
-        semaphore = asyncio.Semaphore(250)  # Default value if semaphore is not provided
-    
-    async with semaphore:
+    # A per-call semaphore bounds nothing; concurrency is bounded by the API's DB pool
+    async with semaphore or contextlib.nullcontext():
         try:
             logger.debug(f"Sending POST request to {url} with payload: {payload}")
             response = await client.post(url, json=payload)
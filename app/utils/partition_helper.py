@@ -3,6 +3,7 @@ import sqlalchemy as sa
 from datetime import datetime, timedelta
 from app.database import execute_ddl
 from app.models import *
+from app.models.base import generate_partition_name
 from sqlalchemy import inspect, text
 from typing import Union, List
 
@@ -34,10 +35,6 @@ def get_partition_info(model):
     logger.info(f"Partition info for {model.__name__}: {info}")
     return info
 
-def generate_partition_name(tablename: str, partition_key: str) -> str:
-    """Generate standardized partition table name"""
-    return f"{tablename}_p_{partition_key.replace('-', '_').replace(':', '_')}".lower()
-
 def check_and_create_partition(connection, table_name: str, start_range: sa.DateTime, end_range: sa.DateTime = None):
     """Create partition(s) for a table within the specified time range"""
     try:
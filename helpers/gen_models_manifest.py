@@ -0,0 +1,69 @@
+"""
+Regenerate app/models/_manifest.py from the model sources.
+
+Walks app/models/*.py, picks up every mapped model (a class deriving from Base)
+and every enum (a class deriving from enum.Enum or BaseEnum), and writes the
+name -> module maps that app/models/__init__.py lazily imports from. A module
+with an __all__ only contributes the names listed there.
+
+Usage: python helpers/gen_models_manifest.py
+"""
+import ast
+from pathlib import Path
+
+MODELS_DIR = Path(__file__).resolve().parent.parent / "app" / "models"
+MANIFEST = MODELS_DIR / "_manifest.py"
+SKIP = {"__init__", "_manifest", "base"}
+
+def base_names(node):
+    for base in node.bases:
+        if isinstance(base, ast.Name):
+            yield base.id
+        elif isinstance(base, ast.Attribute):
+            yield base.attr
+
+def module_all(tree):
+    """The module's literal __all__, if it declares one"""
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(
+            isinstance(target, ast.Name) and target.id == "__all__" for target in node.targets
+        ):
+            return set(ast.literal_eval(node.value))
+    return None
+
+def collect():
+    models, enums = {}, {}
+    for path in sorted(MODELS_DIR.glob("*.py")):
+        if path.stem in SKIP:
+            continue
+        tree = ast.parse(path.read_text(), filename=str(path))
+        exported = module_all(tree)
+        for node in tree.body:
+            if not isinstance(node, ast.ClassDef) or node.name.startswith("_"):
+                continue
+            if exported is not None and node.name not in exported:
+                continue
+            bases = set(base_names(node))
+            if "Base" in bases:
+                models[node.name] = path.stem
+            elif bases & {"Enum", "IntEnum", "StrEnum", "BaseEnum"}:
+                enums[node.name] = path.stem
+    return models, enums
+
+def render(title, mapping):
+    lines = [f"{title} = {{"]
+    lines += [f'    "{name}": "{module}",' for name, module in mapping.items()]
+    lines.append("}")
+    return "\n".join(lines)
+
+def main():
+    models, enums = collect()
+    MANIFEST.write_text(
+        '"""Public model and enum names -> defining submodule. Generated by helpers/gen_models_manifest.py; do not edit."""\n\n'
+        + render("PUBLIC", models) + "\n\n"
+        + render("ENUMS", enums) + "\n"
+    )
+    print(f"Wrote {len(models)} models and {len(enums)} enums to {MANIFEST}")
+
+if __name__ == "__main__":
+    main()